@@ -0,0 +1,93 @@
+import sys
+import json
+import glob
+import timeit
+import argparse
+from pathlib import Path
+from fixture_site import make_units, make_fusion_metadata
+
+repo_directory = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_directory))
+from python_files.fusion_metadata import parse_fusion_metadata
+
+
+
+# Microbenchmark of the fusion-metadata parser, against the saved sample payloads in benchmarks/samples.
+# Each sample is the text of the <script id="fusion-metadata"> element of a community page. Samples of real pages can be added to the folder as well.
+#   python benchmarks/bench_fusion_metadata.py
+#   python benchmarks/bench_fusion_metadata.py --generate     (writes the synthetic samples again)
+
+
+
+samples_directory = Path(__file__).parent / 'samples'
+
+
+
+def parse_with_index_scans(script):
+    # The parser that save_community used before, for comparison. Raises ValueError if a literal isn't found.
+    json_start_index = script.index('[{"unitId":')
+    json_end_index = script.index('}}],"promotions":')
+    units = json.loads(script[json_start_index:json_end_index] + '}}]')
+
+    json_start_index = script.index('}}],"promotions":')
+    json_end_index = script.index(',"fees"')
+    promotions = json.loads(script[json_start_index:json_end_index].replace('}}],"promotions":', '', 1))
+
+    time_start_index = script.index('"officeHours":[')
+    time_end_index = script.index('],"policies":')
+    office_hours = script[time_start_index:time_end_index].replace('"officeHours":[', '', 1).replace('"', '').replace(',', ', ')
+    return units, promotions, office_hours
+
+
+
+def generate_samples():
+    samples_directory.mkdir(exist_ok=True)
+    community_path = '/california/san-jose-apartments/avalon-san-jose'
+    samples = {
+        'small': make_fusion_metadata('avalon-san-jose', make_units('avalon-san-jose', community_path, 20)),
+        'large': make_fusion_metadata('avalon-san-jose', make_units('avalon-san-jose', community_path, 100), content_cache_bytes=50000),
+        'reordered_keys': make_fusion_metadata('avalon-san-jose', make_units('avalon-san-jose', community_path, 20), reorder_keys=True)
+    }
+    for name, script in samples.items():
+        (samples_directory / f'fusion_metadata_{name}.js').write_text(script, encoding='utf-8')
+        print(f'Wrote sample: fusion_metadata_{name}.js ({len(script) / 1024:.0f} KB)')
+
+
+
+def time_parser(parser, script, number):
+    # Milliseconds per call, best of 3.
+    return min(timeit.repeat(lambda: parser(script), number=number, repeat=3)) / number * 1000
+
+
+
+def main(args):
+    if args.generate:
+        generate_samples()
+        return
+
+    print(f'{"sample":<40} {"KB":>6} {"units":>6} {"parser ms":>10} {"index scans ms":>15}  same result')
+    for sample_path in sorted(glob.glob(str(samples_directory / '*.js'))):
+        script = Path(sample_path).read_text(encoding='utf-8')
+        metadata = parse_fusion_metadata(script)
+        if metadata == None:
+            print(f'{Path(sample_path).name:<40} no units found')
+            continue
+        parser_ms = time_parser(parse_fusion_metadata, script, args.number)
+
+        try:
+            units, promotions, office_hours = parse_with_index_scans(script)
+            index_scans_ms = f'{time_parser(parse_with_index_scans, script, args.number):.3f}'
+            same_result = units == metadata.units and promotions == metadata.promotions and office_hours == metadata.get_office_hours_text()
+        except ValueError:    # The literals of the old parser aren't in the sample.
+            index_scans_ms = 'failed'
+            same_result = '-'
+
+        print(f'{Path(sample_path).name:<40} {len(script) / 1024:>6.0f} {len(metadata.units):>6} {parser_ms:>10.3f} {index_scans_ms:>15}  {same_result}')
+
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Microbenchmark of the fusion-metadata parser.')
+    parser.add_argument('--number', type=int, default=200, help='Calls per timing.')
+    parser.add_argument('--generate', action='store_true', help='Write the synthetic samples to benchmarks/samples.')
+    main(parser.parse_args())
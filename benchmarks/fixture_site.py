@@ -0,0 +1,250 @@
+import sys
+import json
+import random
+import asyncio
+import argparse
+from io import BytesIO
+from aiohttp import web
+from PIL import Image
+
+
+
+# Local stand-in of avaloncommunities.com, for benchmarks. It serves synthetic pages with the same markup that the scraper reads:
+#   /apartment-locations                           -> links to every city.
+#   /<state>/<city>-apartments                     -> community cards and the community-toggle button.
+#   /<state>/<city>-apartments/<community>         -> community details, fusion-metadata and unit cards.
+#   /images/<community>/<unit>.png                 -> unit images.
+# Run on its own with: python benchmarks/fixture_site.py --port 8700
+
+
+
+state_names = ['California', 'New York', 'New Jersey', 'Massachusetts', 'Virginia', 'Washington', 'Maryland', 'Colorado', 'Florida', 'Texas']
+state_codes = ['CA', 'NY', 'NJ', 'MA', 'VA', 'WA', 'MD', 'CO', 'FL', 'TX']
+
+
+
+def slug(value):
+    return value.lower().replace(' ', '-')
+
+
+
+def make_units(community_slug, community_path, num_units):
+    units = []
+    for i in range(num_units):
+        unit_name = str(101 + i)
+        units.append({
+            'unitId': f'AVB-{community_slug}-{unit_name}',
+            'name': unit_name,
+            'bedroom': 1 + i % 3,
+            'bathroom': 1 + i % 2,
+            'squareFeet': 600 + i * 10,
+            'url': f'{community_path}/unit-{unit_name}',
+            'availableDate': f'{1 + i % 12}/{1 + i % 28}/2025 12:00:00 AM',
+            'promotions': [{'promotionId': 'promo-1'}] if i % 2 == 0 else [],
+            'startingAtPricesUnfurnished': {'prices': {'price': 2000 + (i * 37) % 1500}},
+            'floorPlan': {'name': f'A{1 + i % 3}-{unit_name}', 'highResolutionImage': f'/images/{community_slug}/{unit_name}.png'},
+            'finishPackage': {'name': 'Avalon', 'description': 'Quartz countertops and stainless steel appliances'},
+            'virtualTour': {'space': f'https://example.com/tour/{community_slug}/{unit_name}'}
+        })
+    return units
+
+
+
+def make_fusion_metadata(community_slug, units, content_cache_bytes=0, reorder_keys=False):
+    # Text of the fusion-metadata script. content_cache_bytes adds an unrelated object of about that size before the community, like the content cache of the real pages.
+    # With reorder_keys, the keys of the community are in a different order and the json isn't compact, which the scraper has to handle too.
+    community = {
+        'communityId': f'AVB-{community_slug}',
+        'units': units,
+        'promotions': [{'promotionId': 'promo-1', 'promotionTitle': 'Up to 6 weeks free on select homes'}],
+        'fees': [{'name': 'Application fee', 'amount': 50}],
+        'officeHours': ['Mon-Fri 9:00am-6:00pm', 'Sat 10:00am-5:00pm', 'Sun Closed'],
+        'policies': {'pets': 'Cats and dogs welcome'}
+    }
+    script = ''
+    if content_cache_bytes > 0:
+        entry = {'type': 'story', 'headline': 'Apartment living', 'body': 'x' * 900}
+        content_cache = {f'content-{i}': entry for i in range(content_cache_bytes // 1000)}
+        script += 'Fusion.contentCache=' + json.dumps(content_cache, separators=(',', ':')) + ';'
+    if reorder_keys:
+        community = dict(reversed(community.items()))
+        script += 'Fusion.globalContent = ' + json.dumps(community, separators=(', ', ': ')) + ';'
+    else:
+        script += 'Fusion.globalContent=' + json.dumps(community, separators=(',', ':')) + ';'
+    return script + 'Fusion.deployment="1234";'
+
+
+
+class FixtureSite:
+
+    def __init__(self, num_states=2, cities_per_state=3, communities_per_city=4, units_per_community=20, latency_ms=0, jitter_ms=0, image_pixels=200, seed=1):
+        self.num_states = min(num_states, len(state_names))
+        self.cities_per_state = cities_per_state
+        self.communities_per_city = communities_per_city
+        self.units_per_community = units_per_community
+        self.latency_ms = latency_ms    # Added to every response.
+        self.jitter_ms = jitter_ms    # Random extra latency, up to this many milliseconds.
+        self.random = random.Random(seed)
+        self.image_bytes = self.make_image(image_pixels)
+        self.base_url = None
+        self.runner = None
+        self.num_requests = 0
+
+
+    def make_image(self, pixels):
+        # Random noise doesn't compress, so the size of the image grows with pixels^2.
+        image = Image.frombytes('RGB', (pixels, pixels), self.random.randbytes(pixels * pixels * 3))
+        buffer = BytesIO()
+        image.save(buffer, format='PNG')
+        return buffer.getvalue()
+
+
+    def get_states(self):
+        return state_names[:self.num_states]
+
+
+    def get_cities(self, state):
+        # [(city name, city url path)]
+        return [(f'{state} City {i + 1}', f'/{slug(state)}/{slug(state)}-city-{i + 1}-apartments') for i in range(self.cities_per_state)]
+
+
+    def get_communities(self, city_path):
+        return [f'{city_path}/avalon-{city_path.split("/")[2].replace("-apartments", "")}-{i + 1}' for i in range(self.communities_per_city)]
+
+
+    def get_city_names(self):
+        return [city_name for state in self.get_states() for city_name, city_path in self.get_cities(state)]
+
+
+    def get_community_urls(self):
+        return [self.base_url + community_path for state in self.get_states() for city_name, city_path in self.get_cities(state) for community_path in self.get_communities(city_path)]
+
+
+    def get_num_units(self):
+        return self.num_states * self.cities_per_state * self.communities_per_city * self.units_per_community
+
+
+    async def start(self, host='127.0.0.1', port=8700):
+        app = web.Application(middlewares=[self.add_latency])
+        app.router.add_get('/apartment-locations', self.handle_locations)
+        app.router.add_get('/images/{community}/{unit}', self.handle_image)
+        app.router.add_get('/{state}/{city}', self.handle_city)
+        app.router.add_get('/{state}/{city}/{community}', self.handle_community)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]    # The actual port, if port 0 was given.
+        self.base_url = f'http://{host}:{port}'
+
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+    @web.middleware
+    async def add_latency(self, request, handler):
+        self.num_requests += 1
+        delay_ms = self.latency_ms + self.random.uniform(0, self.jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+        return await handler(request)
+
+
+    def html(self, body):
+        return web.Response(text=f'<!DOCTYPE html><html><head><title>Fixture</title></head><body>{body}</body></html>', content_type='text/html')
+
+
+    async def handle_locations(self, request):
+        links = ''.join(f'<div class="col-sm"><a href="{self.base_url}{city_path}/">{city_name}</a></div>' for state in self.get_states() for city_name, city_path in self.get_cities(state))
+        return self.html(f'<div class="row">{links}</div>')
+
+
+    def find_city(self, state_slug, city_slug):
+        for state_number, state in enumerate(self.get_states()):
+            for city_name, city_path in self.get_cities(state):
+                if city_path == f'/{state_slug}/{city_slug}':
+                    return state_number, city_name, city_path
+        raise web.HTTPNotFound(text='<h1>404 Page Not Found</h1>', content_type='text/html')
+
+
+    async def handle_city(self, request):
+        state_number, city_name, city_path = self.find_city(request.match_info['state'], request.match_info['city'])
+        cards = []
+        for i, community_path in enumerate(self.get_communities(city_path)):
+            cards.append(
+                f'<div class="community-card-wrapper">'
+                f'<div class="community-card-name"><a class="community-card-link" href="{community_path}">Avalon {city_name} {i + 1}</a></div>'
+                f'<div>{100 + i} Main St. • {city_name}, {state_codes[state_number]} {10000 + i:05d}</div>'
+                f'</div>'
+            )
+        return self.html(f'<button id="community-toggle">Communities</button><div class="community-list">{"".join(cards)}</div>')
+
+
+    async def handle_community(self, request):
+        state_number, city_name, city_path = self.find_city(request.match_info['state'], request.match_info['city'])
+        community_path = f'{city_path}/{request.match_info["community"]}'
+        if community_path not in self.get_communities(city_path):
+            raise web.HTTPNotFound(text='<h1>404 Page Not Found</h1>', content_type='text/html')
+        community_number = int(community_path.rsplit('-', 1)[1])
+        community_slug = request.match_info['community']
+
+        units = make_units(community_slug, community_path, self.units_per_community)
+        cards = []
+        for unit in units:
+            rent = unit['startingAtPricesUnfurnished']['prices']['price']
+            cards.append(
+                f'<div class="ant-card-body">'
+                f'<div class="ant-card-meta-title">Apt. {unit["name"]}</div>'
+                f'<div class="description">{unit["bedroom"]} bed • {unit["bathroom"]} bath • {unit["squareFeet"]} sqft</div>'
+                f'<span class="unit-price">${rent:,}</span>'
+                f'<a class="unit-item-details-title" href="{unit["url"]}?tab=details">Details</a>'
+                f'<div>Furnished starting at ${rent + 800:,}</div>'
+                f'<div class="unit-image"><img src="{unit["floorPlan"]["highResolutionImage"]}"></div>'
+                f'</div>'
+            )
+        metadata = make_fusion_metadata(community_slug, units)
+
+        return self.html(
+            f'<h1 id="cdph-title-id">Avalon {city_name} {community_number}</h1>'
+            f'<div id="cdph-address-id">{99 + community_number} Main St. • {city_name}, {state_codes[state_number]} {9999 + community_number:05d}</div>'
+            f'<a href="tel:5555550{community_number:03d}">(555) 555-0{community_number:03d}</a>'
+            f'<div class="units">{"".join(cards)}</div>'
+            f'<script id="fusion-metadata" type="application/javascript">{metadata}</script>'
+        )
+
+
+    async def handle_image(self, request):
+        return web.Response(body=self.image_bytes, content_type='image/png')
+
+
+
+async def serve(args):
+    site = FixtureSite(args.states, args.cities, args.communities, args.units, args.latency_ms, args.jitter_ms, args.image_pixels)
+    await site.start(args.host, args.port)
+    print(f'Fixture site: {site.base_url}/apartment-locations ({len(site.get_community_urls())} apartments, {site.get_num_units()} units)')
+    await asyncio.Event().wait()    # Serve until interrupted.
+
+
+
+def add_site_arguments(parser):
+    # Shared with run_benchmark.py.
+    parser.add_argument('--states', type=int, default=2, help='Number of states (at most 10).')
+    parser.add_argument('--cities', type=int, default=3, help='Cities per state.')
+    parser.add_argument('--communities', type=int, default=4, help='Apartments per city.')
+    parser.add_argument('--units', type=int, default=20, help='Units per apartment.')
+    parser.add_argument('--latency-ms', type=float, default=0, help='Latency added to every response.')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='Random extra latency, up to this many milliseconds.')
+    parser.add_argument('--image-pixels', type=int, default=200, help='Width and height of the unit images.')
+
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local stand-in of the AvalonBay website.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8700)
+    add_site_arguments(parser)
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        sys.exit(0)
@@ -0,0 +1,260 @@
+import sys
+import json
+import time
+import glob
+import shutil
+import asyncio
+import argparse
+import tempfile
+import subprocess
+import configparser
+from pathlib import Path
+from datetime import datetime
+from fixture_site import FixtureSite, add_site_arguments
+
+
+try:
+    import psutil
+except:
+    subprocess.check_call([sys.executable, "-m", "pip", "install", 'psutil'])
+    import psutil
+
+
+
+# Runs execute.py against the local fixture site, and reports the throughput and resource usage of each run.
+# Examples:
+#   python benchmarks/run_benchmark.py --mode 1 --latency-ms 100
+#   python benchmarks/run_benchmark.py --variant "number_of_concurrent_communities=4" --variant "number_of_concurrent_communities=16"
+#   python benchmarks/run_benchmark.py --save baseline.json     (and later)     python benchmarks/run_benchmark.py --baseline baseline.json
+# Each run scrapes in a fresh copy of the scraper, so the output folder of the real scraper is never touched.
+
+
+
+repo_directory = Path(__file__).parent.parent
+
+# Settings of every benchmark run. Variants are applied on top of these.
+benchmark_settings = {
+    'use_proxies': 'no',
+    'send_report_email': 'no',
+    'city_list_cache_minutes': '0',
+    'skip_unchanged_apartments': 'no',
+    'browser_allowed_hosts': '127.0.0.1',
+    'metrics_port': '0'
+}
+
+
+
+def parse_variant(variant):
+    # 'key=value,key=value' -> {'key': 'value', ...}
+    settings = {}
+    for item in variant.split(','):
+        if item.strip():
+            key, value = item.split('=', 1)
+            settings[key.strip()] = value.strip()
+    return settings
+
+
+
+def make_scraper_copy(run_directory, site, settings):
+    # The scraper finds proxies.txt and global_config.ini four levels above python_files, so the copy is placed at <run directory>/scrapers/avalonbay.
+    scraper_directory = run_directory / 'scrapers/avalonbay'
+    scraper_directory.mkdir(parents=True)
+    shutil.copy(repo_directory / 'execute.py', scraper_directory / 'execute.py')
+    for directory in ('python_files', 'local_config'):
+        shutil.copytree(repo_directory / directory, scraper_directory / directory, ignore=shutil.ignore_patterns('__pycache__'))
+    (run_directory / 'global_config').mkdir()
+
+    config_local = configparser.ConfigParser(interpolation=None)
+    config_local.read(scraper_directory / 'local_config/local_config.ini')
+    for key, value in {**benchmark_settings, 'apartment_locations_url': f'{site.base_url}/apartment-locations', **settings}.items():
+        config_local['settings'][key] = value
+    with open(scraper_directory / 'local_config/local_config.ini', 'w') as f:
+        config_local.write(f)
+
+    # Input files of modes 4, 5 and 6.
+    (scraper_directory / 'input').mkdir()
+    (scraper_directory / 'input/states_to_scrape.txt').write_text('\n'.join(site.get_states()), encoding='utf-8')
+    (scraper_directory / 'input/cities_to_scrape.txt').write_text('\n'.join(site.get_city_names()), encoding='utf-8')
+    (scraper_directory / 'input/apartments_to_scrape.txt').write_text('\n'.join(site.get_community_urls()), encoding='utf-8')
+    return scraper_directory
+
+
+
+def get_process_tree(process):
+    try:
+        return [process] + process.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return []
+
+
+
+async def measure_run(scraper_directory, mode, timeout):
+    # Runs execute.py, and samples the memory and cpu time of its whole process tree (worker processes and browsers included).
+    start = time.monotonic()
+    child = await asyncio.create_subprocess_exec(sys.executable, 'execute.py', mode, cwd=scraper_directory, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    process = psutil.Process(child.pid)
+    peak_rss = 0
+    cpu_seconds = {}    # pid -> last sampled cpu time. Processes that exit keep their last sample.
+    while child.returncode == None:
+        rss = 0
+        for p in get_process_tree(process):
+            try:
+                with p.oneshot():
+                    rss += p.memory_info().rss
+                    cpu_times = p.cpu_times()
+                    cpu_seconds[p.pid] = cpu_times.user + cpu_times.system
+            except psutil.NoSuchProcess:
+                pass
+        peak_rss = max(peak_rss, rss)
+        if time.monotonic() - start > timeout:
+            for p in reversed(get_process_tree(process)):
+                p.kill()
+            raise Exception(f'Run timed out after {timeout} seconds.')
+        try:
+            await asyncio.wait_for(child.wait(), 0.2)
+        except asyncio.TimeoutError:
+            pass
+    return {
+        'exit_code': child.returncode,
+        'seconds': time.monotonic() - start,
+        'peak_rss_mb': peak_rss / 1024 / 1024,
+        'cpu_seconds': sum(cpu_seconds.values())
+    }
+
+
+
+def read_run_metrics(scraper_directory):
+    # The scraper writes a metrics file next to the report of each run.
+    metrics_files = glob.glob(str(scraper_directory / 'output/reports/metrics_*.json'))
+    if len(metrics_files) == 0:
+        raise Exception('No metrics file written. See the log of the run in: ' + str(scraper_directory / 'output/logs'))
+    with open(max(metrics_files), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+
+def count_scraped_output(scraper_directory):
+    # Apartments and units in the json files of the run. The coordinator and the parent process of worker mode write every file to the same output folder, so the counts are the same in every mode.
+    num_communities = 0
+    num_units = 0
+    for json_file_path in glob.glob(str(scraper_directory / 'output/*.json')):
+        if Path(json_file_path).stat().st_size == 0:    # The apartment failed while it was being extracted.
+            continue
+        with open(json_file_path, 'r', encoding='utf-8') as f:
+            community_data = json.load(f)
+        num_communities += 1
+        num_units += len(community_data[0]['listings'])
+    return num_communities, num_units
+
+
+
+def get_stage_seconds(run_metrics):
+    # Mean latency of each stage, e.g. {'page_goto_seconds': 0.21, ...}
+    stages = {}
+    for name, histograms in run_metrics['histograms'].items():
+        count = sum(histogram['count'] for labels, histogram in histograms)
+        total = sum(histogram['sum'] for labels, histogram in histograms)
+        if count > 0:
+            stages[name] = round(total / count, 4)
+    return stages
+
+
+
+async def run_variant(site, mode, name, settings, timeout, keep):
+    run_directory = Path(tempfile.mkdtemp(prefix='avalonbay_benchmark_'))
+    try:
+        scraper_directory = make_scraper_copy(run_directory, site, settings)
+        result = await measure_run(scraper_directory, mode, timeout)
+        run_metrics = read_run_metrics(scraper_directory)
+        num_communities, num_units = count_scraped_output(scraper_directory)
+        result.update({
+            'variant': name,
+            'settings': settings,
+            'communities': num_communities,
+            'communities_failed': run_metrics['progress']['apartments_failed'],
+            'units': num_units,
+            'communities_per_second': num_communities / result['seconds'],
+            'units_per_second': num_units / result['seconds'],
+            'stage_seconds': get_stage_seconds(run_metrics)
+        })
+        return result
+    finally:
+        if keep:
+            print(f'Kept the run directory: {run_directory}')
+        else:
+            shutil.rmtree(run_directory, ignore_errors=True)
+
+
+
+def print_results(results):
+    print(f'\n{"variant":<50} {"seconds":>8} {"comm/s":>8} {"units/s":>9} {"peak MB":>9} {"cpu s":>8} {"failed":>7}')
+    for result in results:
+        print(f'{result["variant"]:<50} {result["seconds"]:>8.1f} {result["communities_per_second"]:>8.2f} {result["units_per_second"]:>9.1f} {result["peak_rss_mb"]:>9.0f} {result["cpu_seconds"]:>8.1f} {result["communities_failed"]:>7}')
+
+
+
+def compare_to_baseline(results, baseline_path, max_slowdown):
+    # Returns False if a variant is slower than in the baseline by more than max_slowdown (e.g. 0.2 = 20%), or failed apartments that the baseline didn't.
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {result['variant']: result for result in json.load(f)['results']}
+    passed = True
+    for result in results:
+        previous = baseline.get(result['variant'])
+        if previous == None:
+            continue
+        if result['communities'] == 0:    # Nothing was scraped, so the run can't be compared.
+            print(f'-- No apartments were scraped in variant: {result["variant"]}')
+            passed = False
+            continue
+        if previous['communities_per_second'] == 0:
+            print(f'{result["variant"]}: The baseline scraped no apartments. Not compared.')
+            continue
+        change = result['communities_per_second'] / previous['communities_per_second'] - 1
+        print(f'{result["variant"]}: {change:+.1%} apartments/second compared to the baseline.')
+        if change < -max_slowdown or result['communities_failed'] > previous['communities_failed']:
+            print(f'-- Regression in variant: {result["variant"]}')
+            passed = False
+    return passed
+
+
+
+async def main(args):
+    site = FixtureSite(args.states, args.cities, args.communities, args.units, args.latency_ms, args.jitter_ms, args.image_pixels)
+    await site.start(port=0)
+    print(f'Fixture site: {site.base_url} ({len(site.get_community_urls())} apartments, {site.get_num_units()} units, {args.latency_ms} ms latency)')
+
+    variants = args.variant or ['']
+    results = []
+    try:
+        for variant in variants:
+            for run_number in range(args.runs):
+                name = variant or 'default'
+                print(f'Running mode {args.mode}, variant: {name} (run {run_number + 1} of {args.runs})')
+                results.append(await run_variant(site, args.mode, name, parse_variant(variant), args.timeout, args.keep))
+    finally:
+        await site.stop()
+
+    print_results(results)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'time': datetime.now().isoformat(timespec='seconds'), 'arguments': vars(args), 'results': results}, f, indent=2)
+        print(f'\nResults saved to: {args.save}')
+
+    if args.baseline and not compare_to_baseline(results, args.baseline, args.max_slowdown):
+        sys.exit(1)
+
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the scraper against a local fixture site.')
+    parser.add_argument('--mode', default='1', choices=['1', '4', '5', '6'], help='Mode of execute.py. Modes 4, 5 and 6 scrape every state, city or apartment of the fixture site.')
+    add_site_arguments(parser)
+    parser.add_argument('--variant', action='append', help='Settings of local_config.ini to benchmark, e.g. "number_of_concurrent_cities=4,max_open_browser_pages=8". Can be given several times.')
+    parser.add_argument('--runs', type=int, default=1, help='Runs of each variant.')
+    parser.add_argument('--timeout', type=float, default=1800, help='Seconds before a run is killed.')
+    parser.add_argument('--keep', action='store_true', help='Keep the run directories (output and logs of each run).')
+    parser.add_argument('--save', help='Write the results to this json file.')
+    parser.add_argument('--baseline', help='Results file of an earlier benchmark. Exits with status 1 if a variant got slower.')
+    parser.add_argument('--max-slowdown', type=float, default=0.2, help='Allowed drop of apartments/second compared to the baseline.')
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1 @@
+Fusion.contentCache={"content-0":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-1":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-2":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-3":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-4":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-5":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-6":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-7":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-8":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-9":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-10":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-11":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-12":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-13":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-14":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-15":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-16":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-17":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-18":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-19":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-20":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-21":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-22":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-23":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-24":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-25":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-26":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-27":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-28":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-29":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-30":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-31":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-32":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-33":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-34":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-35":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-36":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-37":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-38":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-39":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-40":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-41":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-42":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-43":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-44":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-45":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-46":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-47":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-48":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"},"content-49":{"type":"story","headline":"Apartment living","body":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"}};Fusion.globalContent={"communityId":"AVB-avalon-san-jose","units":[{"unitId":"AVB-avalon-san-jose-101","name":"101","bedroom":1,"bathroom":1,"squareFeet":600,"url":"/california/san-jose-apartments/avalon-san-jose/unit-101","availableDate":"1/1/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2000}},"floorPlan":{"name":"A1-101","highResolutionImage":"/images/avalon-san-jose/101.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/101"}},{"unitId":"AVB-avalon-san-jose-102","name":"102","bedroom":2,"bathroom":2,"squareFeet":610,"url":"/california/san-jose-apartments/avalon-san-jose/unit-102","availableDate":"2/2/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2037}},"floorPlan":{"name":"A2-102","highResolutionImage":"/images/avalon-san-jose/102.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/102"}},{"unitId":"AVB-avalon-san-jose-103","name":"103","bedroom":3,"bathroom":1,"squareFeet":620,"url":"/california/san-jose-apartments/avalon-san-jose/unit-103","availableDate":"3/3/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2074}},"floorPlan":{"name":"A3-103","highResolutionImage":"/images/avalon-san-jose/103.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/103"}},{"unitId":"AVB-avalon-san-jose-104","name":"104","bedroom":1,"bathroom":2,"squareFeet":630,"url":"/california/san-jose-apartments/avalon-san-jose/unit-104","availableDate":"4/4/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2111}},"floorPlan":{"name":"A1-104","highResolutionImage":"/images/avalon-san-jose/104.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/104"}},{"unitId":"AVB-avalon-san-jose-105","name":"105","bedroom":2,"bathroom":1,"squareFeet":640,"url":"/california/san-jose-apartments/avalon-san-jose/unit-105","availableDate":"5/5/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2148}},"floorPlan":{"name":"A2-105","highResolutionImage":"/images/avalon-san-jose/105.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/105"}},{"unitId":"AVB-avalon-san-jose-106","name":"106","bedroom":3,"bathroom":2,"squareFeet":650,"url":"/california/san-jose-apartments/avalon-san-jose/unit-106","availableDate":"6/6/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2185}},"floorPlan":{"name":"A3-106","highResolutionImage":"/images/avalon-san-jose/106.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/106"}},{"unitId":"AVB-avalon-san-jose-107","name":"107","bedroom":1,"bathroom":1,"squareFeet":660,"url":"/california/san-jose-apartments/avalon-san-jose/unit-107","availableDate":"7/7/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2222}},"floorPlan":{"name":"A1-107","highResolutionImage":"/images/avalon-san-jose/107.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/107"}},{"unitId":"AVB-avalon-san-jose-108","name":"108","bedroom":2,"bathroom":2,"squareFeet":670,"url":"/california/san-jose-apartments/avalon-san-jose/unit-108","availableDate":"8/8/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2259}},"floorPlan":{"name":"A2-108","highResolutionImage":"/images/avalon-san-jose/108.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/108"}},{"unitId":"AVB-avalon-san-jose-109","name":"109","bedroom":3,"bathroom":1,"squareFeet":680,"url":"/california/san-jose-apartments/avalon-san-jose/unit-109","availableDate":"9/9/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2296}},"floorPlan":{"name":"A3-109","highResolutionImage":"/images/avalon-san-jose/109.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/109"}},{"unitId":"AVB-avalon-san-jose-110","name":"110","bedroom":1,"bathroom":2,"squareFeet":690,"url":"/california/san-jose-apartments/avalon-san-jose/unit-110","availableDate":"10/10/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2333}},"floorPlan":{"name":"A1-110","highResolutionImage":"/images/avalon-san-jose/110.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/110"}},{"unitId":"AVB-avalon-san-jose-111","name":"111","bedroom":2,"bathroom":1,"squareFeet":700,"url":"/california/san-jose-apartments/avalon-san-jose/unit-111","availableDate":"11/11/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2370}},"floorPlan":{"name":"A2-111","highResolutionImage":"/images/avalon-san-jose/111.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/111"}},{"unitId":"AVB-avalon-san-jose-112","name":"112","bedroom":3,"bathroom":2,"squareFeet":710,"url":"/california/san-jose-apartments/avalon-san-jose/unit-112","availableDate":"12/12/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2407}},"floorPlan":{"name":"A3-112","highResolutionImage":"/images/avalon-san-jose/112.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/112"}},{"unitId":"AVB-avalon-san-jose-113","name":"113","bedroom":1,"bathroom":1,"squareFeet":720,"url":"/california/san-jose-apartments/avalon-san-jose/unit-113","availableDate":"1/13/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2444}},"floorPlan":{"name":"A1-113","highResolutionImage":"/images/avalon-san-jose/113.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/113"}},{"unitId":"AVB-avalon-san-jose-114","name":"114","bedroom":2,"bathroom":2,"squareFeet":730,"url":"/california/san-jose-apartments/avalon-san-jose/unit-114","availableDate":"2/14/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2481}},"floorPlan":{"name":"A2-114","highResolutionImage":"/images/avalon-san-jose/114.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/114"}},{"unitId":"AVB-avalon-san-jose-115","name":"115","bedroom":3,"bathroom":1,"squareFeet":740,"url":"/california/san-jose-apartments/avalon-san-jose/unit-115","availableDate":"3/15/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2518}},"floorPlan":{"name":"A3-115","highResolutionImage":"/images/avalon-san-jose/115.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/115"}},{"unitId":"AVB-avalon-san-jose-116","name":"116","bedroom":1,"bathroom":2,"squareFeet":750,"url":"/california/san-jose-apartments/avalon-san-jose/unit-116","availableDate":"4/16/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2555}},"floorPlan":{"name":"A1-116","highResolutionImage":"/images/avalon-san-jose/116.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/116"}},{"unitId":"AVB-avalon-san-jose-117","name":"117","bedroom":2,"bathroom":1,"squareFeet":760,"url":"/california/san-jose-apartments/avalon-san-jose/unit-117","availableDate":"5/17/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2592}},"floorPlan":{"name":"A2-117","highResolutionImage":"/images/avalon-san-jose/117.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/117"}},{"unitId":"AVB-avalon-san-jose-118","name":"118","bedroom":3,"bathroom":2,"squareFeet":770,"url":"/california/san-jose-apartments/avalon-san-jose/unit-118","availableDate":"6/18/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2629}},"floorPlan":{"name":"A3-118","highResolutionImage":"/images/avalon-san-jose/118.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/118"}},{"unitId":"AVB-avalon-san-jose-119","name":"119","bedroom":1,"bathroom":1,"squareFeet":780,"url":"/california/san-jose-apartments/avalon-san-jose/unit-119","availableDate":"7/19/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2666}},"floorPlan":{"name":"A1-119","highResolutionImage":"/images/avalon-san-jose/119.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/119"}},{"unitId":"AVB-avalon-san-jose-120","name":"120","bedroom":2,"bathroom":2,"squareFeet":790,"url":"/california/san-jose-apartments/avalon-san-jose/unit-120","availableDate":"8/20/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2703}},"floorPlan":{"name":"A2-120","highResolutionImage":"/images/avalon-san-jose/120.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/120"}},{"unitId":"AVB-avalon-san-jose-121","name":"121","bedroom":3,"bathroom":1,"squareFeet":800,"url":"/california/san-jose-apartments/avalon-san-jose/unit-121","availableDate":"9/21/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2740}},"floorPlan":{"name":"A3-121","highResolutionImage":"/images/avalon-san-jose/121.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/121"}},{"unitId":"AVB-avalon-san-jose-122","name":"122","bedroom":1,"bathroom":2,"squareFeet":810,"url":"/california/san-jose-apartments/avalon-san-jose/unit-122","availableDate":"10/22/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2777}},"floorPlan":{"name":"A1-122","highResolutionImage":"/images/avalon-san-jose/122.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/122"}},{"unitId":"AVB-avalon-san-jose-123","name":"123","bedroom":2,"bathroom":1,"squareFeet":820,"url":"/california/san-jose-apartments/avalon-san-jose/unit-123","availableDate":"11/23/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2814}},"floorPlan":{"name":"A2-123","highResolutionImage":"/images/avalon-san-jose/123.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/123"}},{"unitId":"AVB-avalon-san-jose-124","name":"124","bedroom":3,"bathroom":2,"squareFeet":830,"url":"/california/san-jose-apartments/avalon-san-jose/unit-124","availableDate":"12/24/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2851}},"floorPlan":{"name":"A3-124","highResolutionImage":"/images/avalon-san-jose/124.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/124"}},{"unitId":"AVB-avalon-san-jose-125","name":"125","bedroom":1,"bathroom":1,"squareFeet":840,"url":"/california/san-jose-apartments/avalon-san-jose/unit-125","availableDate":"1/25/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2888}},"floorPlan":{"name":"A1-125","highResolutionImage":"/images/avalon-san-jose/125.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/125"}},{"unitId":"AVB-avalon-san-jose-126","name":"126","bedroom":2,"bathroom":2,"squareFeet":850,"url":"/california/san-jose-apartments/avalon-san-jose/unit-126","availableDate":"2/26/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2925}},"floorPlan":{"name":"A2-126","highResolutionImage":"/images/avalon-san-jose/126.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/126"}},{"unitId":"AVB-avalon-san-jose-127","name":"127","bedroom":3,"bathroom":1,"squareFeet":860,"url":"/california/san-jose-apartments/avalon-san-jose/unit-127","availableDate":"3/27/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2962}},"floorPlan":{"name":"A3-127","highResolutionImage":"/images/avalon-san-jose/127.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/127"}},{"unitId":"AVB-avalon-san-jose-128","name":"128","bedroom":1,"bathroom":2,"squareFeet":870,"url":"/california/san-jose-apartments/avalon-san-jose/unit-128","availableDate":"4/28/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2999}},"floorPlan":{"name":"A1-128","highResolutionImage":"/images/avalon-san-jose/128.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/128"}},{"unitId":"AVB-avalon-san-jose-129","name":"129","bedroom":2,"bathroom":1,"squareFeet":880,"url":"/california/san-jose-apartments/avalon-san-jose/unit-129","availableDate":"5/1/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":3036}},"floorPlan":{"name":"A2-129","highResolutionImage":"/images/avalon-san-jose/129.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/129"}},{"unitId":"AVB-avalon-san-jose-130","name":"130","bedroom":3,"bathroom":2,"squareFeet":890,"url":"/california/san-jose-apartments/avalon-san-jose/unit-130","availableDate":"6/2/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":3073}},"floorPlan":{"name":"A3-130","highResolutionImage":"/images/avalon-san-jose/130.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/130"}},{"unitId":"AVB-avalon-san-jose-131","name":"131","bedroom":1,"bathroom":1,"squareFeet":900,"url":"/california/san-jose-apartments/avalon-san-jose/unit-131","availableDate":"7/3/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":3110}},"floorPlan":{"name":"A1-131","highResolutionImage":"/images/avalon-san-jose/131.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/131"}},{"unitId":"AVB-avalon-san-jose-132","name":"132","bedroom":2,"bathroom":2,"squareFeet":910,"url":"/california/san-jose-apartments/avalon-san-jose/unit-132","availableDate":"8/4/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":3147}},"floorPlan":{"name":"A2-132","highResolutionImage":"/images/avalon-san-jose/132.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/132"}},{"unitId":"AVB-avalon-san-jose-133","name":"133","bedroom":3,"bathroom":1,"squareFeet":920,"url":"/california/san-jose-apartments/avalon-san-jose/unit-133","availableDate":"9/5/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":3184}},"floorPlan":{"name":"A3-133","highResolutionImage":"/images/avalon-san-jose/133.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/133"}},{"unitId":"AVB-avalon-san-jose-134","name":"134","bedroom":1,"bathroom":2,"squareFeet":930,"url":"/california/san-jose-apartments/avalon-san-jose/unit-134","availableDate":"10/6/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":3221}},"floorPlan":{"name":"A1-134","highResolutionImage":"/images/avalon-san-jose/134.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/134"}},{"unitId":"AVB-avalon-san-jose-135","name":"135","bedroom":2,"bathroom":1,"squareFeet":940,"url":"/california/san-jose-apartments/avalon-san-jose/unit-135","availableDate":"11/7/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":3258}},"floorPlan":{"name":"A2-135","highResolutionImage":"/images/avalon-san-jose/135.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/135"}},{"unitId":"AVB-avalon-san-jose-136","name":"136","bedroom":3,"bathroom":2,"squareFeet":950,"url":"/california/san-jose-apartments/avalon-san-jose/unit-136","availableDate":"12/8/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":3295}},"floorPlan":{"name":"A3-136","highResolutionImage":"/images/avalon-san-jose/136.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/136"}},{"unitId":"AVB-avalon-san-jose-137","name":"137","bedroom":1,"bathroom":1,"squareFeet":960,"url":"/california/san-jose-apartments/avalon-san-jose/unit-137","availableDate":"1/9/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":3332}},"floorPlan":{"name":"A1-137","highResolutionImage":"/images/avalon-san-jose/137.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/137"}},{"unitId":"AVB-avalon-san-jose-138","name":"138","bedroom":2,"bathroom":2,"squareFeet":970,"url":"/california/san-jose-apartments/avalon-san-jose/unit-138","availableDate":"2/10/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":3369}},"floorPlan":{"name":"A2-138","highResolutionImage":"/images/avalon-san-jose/138.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/138"}},{"unitId":"AVB-avalon-san-jose-139","name":"139","bedroom":3,"bathroom":1,"squareFeet":980,"url":"/california/san-jose-apartments/avalon-san-jose/unit-139","availableDate":"3/11/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":3406}},"floorPlan":{"name":"A3-139","highResolutionImage":"/images/avalon-san-jose/139.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/139"}},{"unitId":"AVB-avalon-san-jose-140","name":"140","bedroom":1,"bathroom":2,"squareFeet":990,"url":"/california/san-jose-apartments/avalon-san-jose/unit-140","availableDate":"4/12/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":3443}},"floorPlan":{"name":"A1-140","highResolutionImage":"/images/avalon-san-jose/140.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/140"}},{"unitId":"AVB-avalon-san-jose-141","name":"141","bedroom":2,"bathroom":1,"squareFeet":1000,"url":"/california/san-jose-apartments/avalon-san-jose/unit-141","availableDate":"5/13/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":3480}},"floorPlan":{"name":"A2-141","highResolutionImage":"/images/avalon-san-jose/141.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/141"}},{"unitId":"AVB-avalon-san-jose-142","name":"142","bedroom":3,"bathroom":2,"squareFeet":1010,"url":"/california/san-jose-apartments/avalon-san-jose/unit-142","availableDate":"6/14/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2017}},"floorPlan":{"name":"A3-142","highResolutionImage":"/images/avalon-san-jose/142.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/142"}},{"unitId":"AVB-avalon-san-jose-143","name":"143","bedroom":1,"bathroom":1,"squareFeet":1020,"url":"/california/san-jose-apartments/avalon-san-jose/unit-143","availableDate":"7/15/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2054}},"floorPlan":{"name":"A1-143","highResolutionImage":"/images/avalon-san-jose/143.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/143"}},{"unitId":"AVB-avalon-san-jose-144","name":"144","bedroom":2,"bathroom":2,"squareFeet":1030,"url":"/california/san-jose-apartments/avalon-san-jose/unit-144","availableDate":"8/16/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2091}},"floorPlan":{"name":"A2-144","highResolutionImage":"/images/avalon-san-jose/144.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/144"}},{"unitId":"AVB-avalon-san-jose-145","name":"145","bedroom":3,"bathroom":1,"squareFeet":1040,"url":"/california/san-jose-apartments/avalon-san-jose/unit-145","availableDate":"9/17/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2128}},"floorPlan":{"name":"A3-145","highResolutionImage":"/images/avalon-san-jose/145.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/145"}},{"unitId":"AVB-avalon-san-jose-146","name":"146","bedroom":1,"bathroom":2,"squareFeet":1050,"url":"/california/san-jose-apartments/avalon-san-jose/unit-146","availableDate":"10/18/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2165}},"floorPlan":{"name":"A1-146","highResolutionImage":"/images/avalon-san-jose/146.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/146"}},{"unitId":"AVB-avalon-san-jose-147","name":"147","bedroom":2,"bathroom":1,"squareFeet":1060,"url":"/california/san-jose-apartments/avalon-san-jose/unit-147","availableDate":"11/19/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2202}},"floorPlan":{"name":"A2-147","highResolutionImage":"/images/avalon-san-jose/147.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/147"}},{"unitId":"AVB-avalon-san-jose-148","name":"148","bedroom":3,"bathroom":2,"squareFeet":1070,"url":"/california/san-jose-apartments/avalon-san-jose/unit-148","availableDate":"12/20/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2239}},"floorPlan":{"name":"A3-148","highResolutionImage":"/images/avalon-san-jose/148.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/148"}},{"unitId":"AVB-avalon-san-jose-149","name":"149","bedroom":1,"bathroom":1,"squareFeet":1080,"url":"/california/san-jose-apartments/avalon-san-jose/unit-149","availableDate":"1/21/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2276}},"floorPlan":{"name":"A1-149","highResolutionImage":"/images/avalon-san-jose/149.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/149"}},{"unitId":"AVB-avalon-san-jose-150","name":"150","bedroom":2,"bathroom":2,"squareFeet":1090,"url":"/california/san-jose-apartments/avalon-san-jose/unit-150","availableDate":"2/22/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2313}},"floorPlan":{"name":"A2-150","highResolutionImage":"/images/avalon-san-jose/150.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/150"}},{"unitId":"AVB-avalon-san-jose-151","name":"151","bedroom":3,"bathroom":1,"squareFeet":1100,"url":"/california/san-jose-apartments/avalon-san-jose/unit-151","availableDate":"3/23/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2350}},"floorPlan":{"name":"A3-151","highResolutionImage":"/images/avalon-san-jose/151.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/151"}},{"unitId":"AVB-avalon-san-jose-152","name":"152","bedroom":1,"bathroom":2,"squareFeet":1110,"url":"/california/san-jose-apartments/avalon-san-jose/unit-152","availableDate":"4/24/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2387}},"floorPlan":{"name":"A1-152","highResolutionImage":"/images/avalon-san-jose/152.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/152"}},{"unitId":"AVB-avalon-san-jose-153","name":"153","bedroom":2,"bathroom":1,"squareFeet":1120,"url":"/california/san-jose-apartments/avalon-san-jose/unit-153","availableDate":"5/25/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2424}},"floorPlan":{"name":"A2-153","highResolutionImage":"/images/avalon-san-jose/153.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/153"}},{"unitId":"AVB-avalon-san-jose-154","name":"154","bedroom":3,"bathroom":2,"squareFeet":1130,"url":"/california/san-jose-apartments/avalon-san-jose/unit-154","availableDate":"6/26/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2461}},"floorPlan":{"name":"A3-154","highResolutionImage":"/images/avalon-san-jose/154.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/154"}},{"unitId":"AVB-avalon-san-jose-155","name":"155","bedroom":1,"bathroom":1,"squareFeet":1140,"url":"/california/san-jose-apartments/avalon-san-jose/unit-155","availableDate":"7/27/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2498}},"floorPlan":{"name":"A1-155","highResolutionImage":"/images/avalon-san-jose/155.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/155"}},{"unitId":"AVB-avalon-san-jose-156","name":"156","bedroom":2,"bathroom":2,"squareFeet":1150,"url":"/california/san-jose-apartments/avalon-san-jose/unit-156","availableDate":"8/28/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2535}},"floorPlan":{"name":"A2-156","highResolutionImage":"/images/avalon-san-jose/156.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/156"}},{"unitId":"AVB-avalon-san-jose-157","name":"157","bedroom":3,"bathroom":1,"squareFeet":1160,"url":"/california/san-jose-apartments/avalon-san-jose/unit-157","availableDate":"9/1/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2572}},"floorPlan":{"name":"A3-157","highResolutionImage":"/images/avalon-san-jose/157.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/157"}},{"unitId":"AVB-avalon-san-jose-158","name":"158","bedroom":1,"bathroom":2,"squareFeet":1170,"url":"/california/san-jose-apartments/avalon-san-jose/unit-158","availableDate":"10/2/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2609}},"floorPlan":{"name":"A1-158","highResolutionImage":"/images/avalon-san-jose/158.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/158"}},{"unitId":"AVB-avalon-san-jose-159","name":"159","bedroom":2,"bathroom":1,"squareFeet":1180,"url":"/california/san-jose-apartments/avalon-san-jose/unit-159","availableDate":"11/3/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2646}},"floorPlan":{"name":"A2-159","highResolutionImage":"/images/avalon-san-jose/159.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/159"}},{"unitId":"AVB-avalon-san-jose-160","name":"160","bedroom":3,"bathroom":2,"squareFeet":1190,"url":"/california/san-jose-apartments/avalon-san-jose/unit-160","availableDate":"12/4/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2683}},"floorPlan":{"name":"A3-160","highResolutionImage":"/images/avalon-san-jose/160.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/160"}},{"unitId":"AVB-avalon-san-jose-161","name":"161","bedroom":1,"bathroom":1,"squareFeet":1200,"url":"/california/san-jose-apartments/avalon-san-jose/unit-161","availableDate":"1/5/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2720}},"floorPlan":{"name":"A1-161","highResolutionImage":"/images/avalon-san-jose/161.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/161"}},{"unitId":"AVB-avalon-san-jose-162","name":"162","bedroom":2,"bathroom":2,"squareFeet":1210,"url":"/california/san-jose-apartments/avalon-san-jose/unit-162","availableDate":"2/6/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2757}},"floorPlan":{"name":"A2-162","highResolutionImage":"/images/avalon-san-jose/162.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/162"}},{"unitId":"AVB-avalon-san-jose-163","name":"163","bedroom":3,"bathroom":1,"squareFeet":1220,"url":"/california/san-jose-apartments/avalon-san-jose/unit-163","availableDate":"3/7/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2794}},"floorPlan":{"name":"A3-163","highResolutionImage":"/images/avalon-san-jose/163.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/163"}},{"unitId":"AVB-avalon-san-jose-164","name":"164","bedroom":1,"bathroom":2,"squareFeet":1230,"url":"/california/san-jose-apartments/avalon-san-jose/unit-164","availableDate":"4/8/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2831}},"floorPlan":{"name":"A1-164","highResolutionImage":"/images/avalon-san-jose/164.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/164"}},{"unitId":"AVB-avalon-san-jose-165","name":"165","bedroom":2,"bathroom":1,"squareFeet":1240,"url":"/california/san-jose-apartments/avalon-san-jose/unit-165","availableDate":"5/9/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2868}},"floorPlan":{"name":"A2-165","highResolutionImage":"/images/avalon-san-jose/165.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/165"}},{"unitId":"AVB-avalon-san-jose-166","name":"166","bedroom":3,"bathroom":2,"squareFeet":1250,"url":"/california/san-jose-apartments/avalon-san-jose/unit-166","availableDate":"6/10/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2905}},"floorPlan":{"name":"A3-166","highResolutionImage":"/images/avalon-san-jose/166.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/166"}},{"unitId":"AVB-avalon-san-jose-167","name":"167","bedroom":1,"bathroom":1,"squareFeet":1260,"url":"/california/san-jose-apartments/avalon-san-jose/unit-167","availableDate":"7/11/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2942}},"floorPlan":{"name":"A1-167","highResolutionImage":"/images/avalon-san-jose/167.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/167"}},{"unitId":"AVB-avalon-san-jose-168","name":"168","bedroom":2,"bathroom":2,"squareFeet":1270,"url":"/california/san-jose-apartments/avalon-san-jose/unit-168","availableDate":"8/12/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2979}},"floorPlan":{"name":"A2-168","highResolutionImage":"/images/avalon-san-jose/168.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/168"}},{"unitId":"AVB-avalon-san-jose-169","name":"169","bedroom":3,"bathroom":1,"squareFeet":1280,"url":"/california/san-jose-apartments/avalon-san-jose/unit-169","availableDate":"9/13/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":3016}},"floorPlan":{"name":"A3-169","highResolutionImage":"/images/avalon-san-jose/169.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/169"}},{"unitId":"AVB-avalon-san-jose-170","name":"170","bedroom":1,"bathroom":2,"squareFeet":1290,"url":"/california/san-jose-apartments/avalon-san-jose/unit-170","availableDate":"10/14/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":3053}},"floorPlan":{"name":"A1-170","highResolutionImage":"/images/avalon-san-jose/170.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/170"}},{"unitId":"AVB-avalon-san-jose-171","name":"171","bedroom":2,"bathroom":1,"squareFeet":1300,"url":"/california/san-jose-apartments/avalon-san-jose/unit-171","availableDate":"11/15/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":3090}},"floorPlan":{"name":"A2-171","highResolutionImage":"/images/avalon-san-jose/171.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/171"}},{"unitId":"AVB-avalon-san-jose-172","name":"172","bedroom":3,"bathroom":2,"squareFeet":1310,"url":"/california/san-jose-apartments/avalon-san-jose/unit-172","availableDate":"12/16/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":3127}},"floorPlan":{"name":"A3-172","highResolutionImage":"/images/avalon-san-jose/172.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/172"}},{"unitId":"AVB-avalon-san-jose-173","name":"173","bedroom":1,"bathroom":1,"squareFeet":1320,"url":"/california/san-jose-apartments/avalon-san-jose/unit-173","availableDate":"1/17/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":3164}},"floorPlan":{"name":"A1-173","highResolutionImage":"/images/avalon-san-jose/173.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/173"}},{"unitId":"AVB-avalon-san-jose-174","name":"174","bedroom":2,"bathroom":2,"squareFeet":1330,"url":"/california/san-jose-apartments/avalon-san-jose/unit-174","availableDate":"2/18/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":3201}},"floorPlan":{"name":"A2-174","highResolutionImage":"/images/avalon-san-jose/174.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/174"}},{"unitId":"AVB-avalon-san-jose-175","name":"175","bedroom":3,"bathroom":1,"squareFeet":1340,"url":"/california/san-jose-apartments/avalon-san-jose/unit-175","availableDate":"3/19/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":3238}},"floorPlan":{"name":"A3-175","highResolutionImage":"/images/avalon-san-jose/175.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/175"}},{"unitId":"AVB-avalon-san-jose-176","name":"176","bedroom":1,"bathroom":2,"squareFeet":1350,"url":"/california/san-jose-apartments/avalon-san-jose/unit-176","availableDate":"4/20/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":3275}},"floorPlan":{"name":"A1-176","highResolutionImage":"/images/avalon-san-jose/176.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/176"}},{"unitId":"AVB-avalon-san-jose-177","name":"177","bedroom":2,"bathroom":1,"squareFeet":1360,"url":"/california/san-jose-apartments/avalon-san-jose/unit-177","availableDate":"5/21/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":3312}},"floorPlan":{"name":"A2-177","highResolutionImage":"/images/avalon-san-jose/177.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/177"}},{"unitId":"AVB-avalon-san-jose-178","name":"178","bedroom":3,"bathroom":2,"squareFeet":1370,"url":"/california/san-jose-apartments/avalon-san-jose/unit-178","availableDate":"6/22/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":3349}},"floorPlan":{"name":"A3-178","highResolutionImage":"/images/avalon-san-jose/178.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/178"}},{"unitId":"AVB-avalon-san-jose-179","name":"179","bedroom":1,"bathroom":1,"squareFeet":1380,"url":"/california/san-jose-apartments/avalon-san-jose/unit-179","availableDate":"7/23/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":3386}},"floorPlan":{"name":"A1-179","highResolutionImage":"/images/avalon-san-jose/179.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/179"}},{"unitId":"AVB-avalon-san-jose-180","name":"180","bedroom":2,"bathroom":2,"squareFeet":1390,"url":"/california/san-jose-apartments/avalon-san-jose/unit-180","availableDate":"8/24/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":3423}},"floorPlan":{"name":"A2-180","highResolutionImage":"/images/avalon-san-jose/180.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/180"}},{"unitId":"AVB-avalon-san-jose-181","name":"181","bedroom":3,"bathroom":1,"squareFeet":1400,"url":"/california/san-jose-apartments/avalon-san-jose/unit-181","availableDate":"9/25/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":3460}},"floorPlan":{"name":"A3-181","highResolutionImage":"/images/avalon-san-jose/181.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/181"}},{"unitId":"AVB-avalon-san-jose-182","name":"182","bedroom":1,"bathroom":2,"squareFeet":1410,"url":"/california/san-jose-apartments/avalon-san-jose/unit-182","availableDate":"10/26/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":3497}},"floorPlan":{"name":"A1-182","highResolutionImage":"/images/avalon-san-jose/182.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/182"}},{"unitId":"AVB-avalon-san-jose-183","name":"183","bedroom":2,"bathroom":1,"squareFeet":1420,"url":"/california/san-jose-apartments/avalon-san-jose/unit-183","availableDate":"11/27/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2034}},"floorPlan":{"name":"A2-183","highResolutionImage":"/images/avalon-san-jose/183.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/183"}},{"unitId":"AVB-avalon-san-jose-184","name":"184","bedroom":3,"bathroom":2,"squareFeet":1430,"url":"/california/san-jose-apartments/avalon-san-jose/unit-184","availableDate":"12/28/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2071}},"floorPlan":{"name":"A3-184","highResolutionImage":"/images/avalon-san-jose/184.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/184"}},{"unitId":"AVB-avalon-san-jose-185","name":"185","bedroom":1,"bathroom":1,"squareFeet":1440,"url":"/california/san-jose-apartments/avalon-san-jose/unit-185","availableDate":"1/1/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2108}},"floorPlan":{"name":"A1-185","highResolutionImage":"/images/avalon-san-jose/185.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/185"}},{"unitId":"AVB-avalon-san-jose-186","name":"186","bedroom":2,"bathroom":2,"squareFeet":1450,"url":"/california/san-jose-apartments/avalon-san-jose/unit-186","availableDate":"2/2/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2145}},"floorPlan":{"name":"A2-186","highResolutionImage":"/images/avalon-san-jose/186.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/186"}},{"unitId":"AVB-avalon-san-jose-187","name":"187","bedroom":3,"bathroom":1,"squareFeet":1460,"url":"/california/san-jose-apartments/avalon-san-jose/unit-187","availableDate":"3/3/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2182}},"floorPlan":{"name":"A3-187","highResolutionImage":"/images/avalon-san-jose/187.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/187"}},{"unitId":"AVB-avalon-san-jose-188","name":"188","bedroom":1,"bathroom":2,"squareFeet":1470,"url":"/california/san-jose-apartments/avalon-san-jose/unit-188","availableDate":"4/4/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2219}},"floorPlan":{"name":"A1-188","highResolutionImage":"/images/avalon-san-jose/188.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/188"}},{"unitId":"AVB-avalon-san-jose-189","name":"189","bedroom":2,"bathroom":1,"squareFeet":1480,"url":"/california/san-jose-apartments/avalon-san-jose/unit-189","availableDate":"5/5/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2256}},"floorPlan":{"name":"A2-189","highResolutionImage":"/images/avalon-san-jose/189.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/189"}},{"unitId":"AVB-avalon-san-jose-190","name":"190","bedroom":3,"bathroom":2,"squareFeet":1490,"url":"/california/san-jose-apartments/avalon-san-jose/unit-190","availableDate":"6/6/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2293}},"floorPlan":{"name":"A3-190","highResolutionImage":"/images/avalon-san-jose/190.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/190"}},{"unitId":"AVB-avalon-san-jose-191","name":"191","bedroom":1,"bathroom":1,"squareFeet":1500,"url":"/california/san-jose-apartments/avalon-san-jose/unit-191","availableDate":"7/7/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2330}},"floorPlan":{"name":"A1-191","highResolutionImage":"/images/avalon-san-jose/191.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/191"}},{"unitId":"AVB-avalon-san-jose-192","name":"192","bedroom":2,"bathroom":2,"squareFeet":1510,"url":"/california/san-jose-apartments/avalon-san-jose/unit-192","availableDate":"8/8/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2367}},"floorPlan":{"name":"A2-192","highResolutionImage":"/images/avalon-san-jose/192.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/192"}},{"unitId":"AVB-avalon-san-jose-193","name":"193","bedroom":3,"bathroom":1,"squareFeet":1520,"url":"/california/san-jose-apartments/avalon-san-jose/unit-193","availableDate":"9/9/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2404}},"floorPlan":{"name":"A3-193","highResolutionImage":"/images/avalon-san-jose/193.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/193"}},{"unitId":"AVB-avalon-san-jose-194","name":"194","bedroom":1,"bathroom":2,"squareFeet":1530,"url":"/california/san-jose-apartments/avalon-san-jose/unit-194","availableDate":"10/10/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2441}},"floorPlan":{"name":"A1-194","highResolutionImage":"/images/avalon-san-jose/194.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/194"}},{"unitId":"AVB-avalon-san-jose-195","name":"195","bedroom":2,"bathroom":1,"squareFeet":1540,"url":"/california/san-jose-apartments/avalon-san-jose/unit-195","availableDate":"11/11/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2478}},"floorPlan":{"name":"A2-195","highResolutionImage":"/images/avalon-san-jose/195.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/195"}},{"unitId":"AVB-avalon-san-jose-196","name":"196","bedroom":3,"bathroom":2,"squareFeet":1550,"url":"/california/san-jose-apartments/avalon-san-jose/unit-196","availableDate":"12/12/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2515}},"floorPlan":{"name":"A3-196","highResolutionImage":"/images/avalon-san-jose/196.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/196"}},{"unitId":"AVB-avalon-san-jose-197","name":"197","bedroom":1,"bathroom":1,"squareFeet":1560,"url":"/california/san-jose-apartments/avalon-san-jose/unit-197","availableDate":"1/13/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2552}},"floorPlan":{"name":"A1-197","highResolutionImage":"/images/avalon-san-jose/197.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/197"}},{"unitId":"AVB-avalon-san-jose-198","name":"198","bedroom":2,"bathroom":2,"squareFeet":1570,"url":"/california/san-jose-apartments/avalon-san-jose/unit-198","availableDate":"2/14/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2589}},"floorPlan":{"name":"A2-198","highResolutionImage":"/images/avalon-san-jose/198.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/198"}},{"unitId":"AVB-avalon-san-jose-199","name":"199","bedroom":3,"bathroom":1,"squareFeet":1580,"url":"/california/san-jose-apartments/avalon-san-jose/unit-199","availableDate":"3/15/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2626}},"floorPlan":{"name":"A3-199","highResolutionImage":"/images/avalon-san-jose/199.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/199"}},{"unitId":"AVB-avalon-san-jose-200","name":"200","bedroom":1,"bathroom":2,"squareFeet":1590,"url":"/california/san-jose-apartments/avalon-san-jose/unit-200","availableDate":"4/16/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2663}},"floorPlan":{"name":"A1-200","highResolutionImage":"/images/avalon-san-jose/200.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/200"}}],"promotions":[{"promotionId":"promo-1","promotionTitle":"Up to 6 weeks free on select homes"}],"fees":[{"name":"Application fee","amount":50}],"officeHours":["Mon-Fri 9:00am-6:00pm","Sat 10:00am-5:00pm","Sun Closed"],"policies":{"pets":"Cats and dogs welcome"}};Fusion.deployment="1234";
\ No newline at end of file
@@ -0,0 +1 @@
+Fusion.globalContent={"communityId":"AVB-avalon-san-jose","units":[{"unitId":"AVB-avalon-san-jose-101","name":"101","bedroom":1,"bathroom":1,"squareFeet":600,"url":"/california/san-jose-apartments/avalon-san-jose/unit-101","availableDate":"1/1/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2000}},"floorPlan":{"name":"A1-101","highResolutionImage":"/images/avalon-san-jose/101.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/101"}},{"unitId":"AVB-avalon-san-jose-102","name":"102","bedroom":2,"bathroom":2,"squareFeet":610,"url":"/california/san-jose-apartments/avalon-san-jose/unit-102","availableDate":"2/2/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2037}},"floorPlan":{"name":"A2-102","highResolutionImage":"/images/avalon-san-jose/102.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/102"}},{"unitId":"AVB-avalon-san-jose-103","name":"103","bedroom":3,"bathroom":1,"squareFeet":620,"url":"/california/san-jose-apartments/avalon-san-jose/unit-103","availableDate":"3/3/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2074}},"floorPlan":{"name":"A3-103","highResolutionImage":"/images/avalon-san-jose/103.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/103"}},{"unitId":"AVB-avalon-san-jose-104","name":"104","bedroom":1,"bathroom":2,"squareFeet":630,"url":"/california/san-jose-apartments/avalon-san-jose/unit-104","availableDate":"4/4/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2111}},"floorPlan":{"name":"A1-104","highResolutionImage":"/images/avalon-san-jose/104.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/104"}},{"unitId":"AVB-avalon-san-jose-105","name":"105","bedroom":2,"bathroom":1,"squareFeet":640,"url":"/california/san-jose-apartments/avalon-san-jose/unit-105","availableDate":"5/5/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2148}},"floorPlan":{"name":"A2-105","highResolutionImage":"/images/avalon-san-jose/105.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/105"}},{"unitId":"AVB-avalon-san-jose-106","name":"106","bedroom":3,"bathroom":2,"squareFeet":650,"url":"/california/san-jose-apartments/avalon-san-jose/unit-106","availableDate":"6/6/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2185}},"floorPlan":{"name":"A3-106","highResolutionImage":"/images/avalon-san-jose/106.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/106"}},{"unitId":"AVB-avalon-san-jose-107","name":"107","bedroom":1,"bathroom":1,"squareFeet":660,"url":"/california/san-jose-apartments/avalon-san-jose/unit-107","availableDate":"7/7/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2222}},"floorPlan":{"name":"A1-107","highResolutionImage":"/images/avalon-san-jose/107.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/107"}},{"unitId":"AVB-avalon-san-jose-108","name":"108","bedroom":2,"bathroom":2,"squareFeet":670,"url":"/california/san-jose-apartments/avalon-san-jose/unit-108","availableDate":"8/8/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2259}},"floorPlan":{"name":"A2-108","highResolutionImage":"/images/avalon-san-jose/108.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/108"}},{"unitId":"AVB-avalon-san-jose-109","name":"109","bedroom":3,"bathroom":1,"squareFeet":680,"url":"/california/san-jose-apartments/avalon-san-jose/unit-109","availableDate":"9/9/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2296}},"floorPlan":{"name":"A3-109","highResolutionImage":"/images/avalon-san-jose/109.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/109"}},{"unitId":"AVB-avalon-san-jose-110","name":"110","bedroom":1,"bathroom":2,"squareFeet":690,"url":"/california/san-jose-apartments/avalon-san-jose/unit-110","availableDate":"10/10/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2333}},"floorPlan":{"name":"A1-110","highResolutionImage":"/images/avalon-san-jose/110.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/110"}},{"unitId":"AVB-avalon-san-jose-111","name":"111","bedroom":2,"bathroom":1,"squareFeet":700,"url":"/california/san-jose-apartments/avalon-san-jose/unit-111","availableDate":"11/11/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2370}},"floorPlan":{"name":"A2-111","highResolutionImage":"/images/avalon-san-jose/111.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/111"}},{"unitId":"AVB-avalon-san-jose-112","name":"112","bedroom":3,"bathroom":2,"squareFeet":710,"url":"/california/san-jose-apartments/avalon-san-jose/unit-112","availableDate":"12/12/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2407}},"floorPlan":{"name":"A3-112","highResolutionImage":"/images/avalon-san-jose/112.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/112"}},{"unitId":"AVB-avalon-san-jose-113","name":"113","bedroom":1,"bathroom":1,"squareFeet":720,"url":"/california/san-jose-apartments/avalon-san-jose/unit-113","availableDate":"1/13/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2444}},"floorPlan":{"name":"A1-113","highResolutionImage":"/images/avalon-san-jose/113.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/113"}},{"unitId":"AVB-avalon-san-jose-114","name":"114","bedroom":2,"bathroom":2,"squareFeet":730,"url":"/california/san-jose-apartments/avalon-san-jose/unit-114","availableDate":"2/14/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2481}},"floorPlan":{"name":"A2-114","highResolutionImage":"/images/avalon-san-jose/114.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/114"}},{"unitId":"AVB-avalon-san-jose-115","name":"115","bedroom":3,"bathroom":1,"squareFeet":740,"url":"/california/san-jose-apartments/avalon-san-jose/unit-115","availableDate":"3/15/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2518}},"floorPlan":{"name":"A3-115","highResolutionImage":"/images/avalon-san-jose/115.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/115"}},{"unitId":"AVB-avalon-san-jose-116","name":"116","bedroom":1,"bathroom":2,"squareFeet":750,"url":"/california/san-jose-apartments/avalon-san-jose/unit-116","availableDate":"4/16/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2555}},"floorPlan":{"name":"A1-116","highResolutionImage":"/images/avalon-san-jose/116.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/116"}},{"unitId":"AVB-avalon-san-jose-117","name":"117","bedroom":2,"bathroom":1,"squareFeet":760,"url":"/california/san-jose-apartments/avalon-san-jose/unit-117","availableDate":"5/17/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2592}},"floorPlan":{"name":"A2-117","highResolutionImage":"/images/avalon-san-jose/117.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/117"}},{"unitId":"AVB-avalon-san-jose-118","name":"118","bedroom":3,"bathroom":2,"squareFeet":770,"url":"/california/san-jose-apartments/avalon-san-jose/unit-118","availableDate":"6/18/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2629}},"floorPlan":{"name":"A3-118","highResolutionImage":"/images/avalon-san-jose/118.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/118"}},{"unitId":"AVB-avalon-san-jose-119","name":"119","bedroom":1,"bathroom":1,"squareFeet":780,"url":"/california/san-jose-apartments/avalon-san-jose/unit-119","availableDate":"7/19/2025 12:00:00 AM","promotions":[{"promotionId":"promo-1"}],"startingAtPricesUnfurnished":{"prices":{"price":2666}},"floorPlan":{"name":"A1-119","highResolutionImage":"/images/avalon-san-jose/119.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/119"}},{"unitId":"AVB-avalon-san-jose-120","name":"120","bedroom":2,"bathroom":2,"squareFeet":790,"url":"/california/san-jose-apartments/avalon-san-jose/unit-120","availableDate":"8/20/2025 12:00:00 AM","promotions":[],"startingAtPricesUnfurnished":{"prices":{"price":2703}},"floorPlan":{"name":"A2-120","highResolutionImage":"/images/avalon-san-jose/120.png"},"finishPackage":{"name":"Avalon","description":"Quartz countertops and stainless steel appliances"},"virtualTour":{"space":"https://example.com/tour/avalon-san-jose/120"}}],"promotions":[{"promotionId":"promo-1","promotionTitle":"Up to 6 weeks free on select homes"}],"fees":[{"name":"Application fee","amount":50}],"officeHours":["Mon-Fri 9:00am-6:00pm","Sat 10:00am-5:00pm","Sun Closed"],"policies":{"pets":"Cats and dogs welcome"}};Fusion.deployment="1234";
\ No newline at end of file
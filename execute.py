@@ -1,21 +1,23 @@
 import os
 import sys
-import csv
 import json
 import glob
+import base64
 import logging
+import socket
 import asyncio
+import functools
 import subprocess
+import multiprocessing
 import configparser
-from io import BytesIO
-from time import sleep
+from time import sleep, monotonic
 from pathlib import Path
 from urllib import parse
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
 from python_files import data_manipulation
 from python_files.email_ import send_email
-from python_files.helper_functions import get_image_filename, get_proxy, slugify
+from python_files.helper_functions import get_image_filename, get_proxy, report_proxy_success, report_proxy_failure, disable_proxies, slugify
 
 
 try:
@@ -38,13 +40,30 @@ except:
     from parsel import Selector
 
 try:
-    from playwright.async_api import async_playwright
+    from playwright.async_api import async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 except:
     subprocess.check_call([sys.executable, "-m", "pip", "install", 'playwright'])
     sleep(1)
     subprocess.check_call([sys.executable, "-m", "playwright", "install"])
     sleep(2)
-    from playwright.async_api import async_playwright
+    from playwright.async_api import async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+# Imported after the dependency checks above, because these modules use parsel.
+from python_files.city_index import CityIndex, apartment_locations_url
+from python_files.image_queue import ImageQueue
+from python_files.image_processing import transcode_image
+from python_files.community_index import CommunityIndex
+from python_files.context_pool import ContextPool
+from python_files.resource_blocking import BlockingProfile, parse_list
+from python_files.checkpoint import CheckpointJournal
+from python_files.change_detection import CommunityHashStore, get_content_hash
+from python_files.listing_export import ListingExport
+from python_files.price_history import PriceHistory
+from python_files.rate_limit import HostRateLimiter, check_response_status, is_request_error
+from python_files.coordinator import Coordinator, CoordinatorClient
+from python_files.metrics import metrics, MetricsServer
+from python_files.log_queue import start_logging, stop_logging
+from python_files.fusion_metadata import parse_fusion_metadata
 
 
 
@@ -66,6 +85,37 @@ newly_scraped_communities = []          # List of communities (formatted strings
 # To keep track of error state.
 error_state = False
 
+browserless_mode = False              # If True, community pages are fetched over http and the browser is only used as a fallback.
+city_index = None                     # Cached list of cities from the apartment-locations page.
+image_queue = None                    # Queue of unit images, downloaded in the background by a pool of workers.
+image_executor = None                 # Process pool that converts downloaded images to jpg, off the event loop.
+community_index = None                # Communities in the apartments csv file, indexed by url.
+community_queue = None                # Communities waiting to be scraped by the community workers. Shared by all cities.
+queued_communities = set()            # Url of each community that was added to community_queue.
+context_pool = None                   # Warm browser contexts, one per proxy, shared by all pages.
+blocking_profile = None               # Decides which browser requests are allowed, and counts the bytes transferred and saved.
+rate_limiter = None                   # Limits the request rate to each host, and spaces out retries.
+checkpoint = None                     # Journal of queued, finished and failed cities and communities. Used to resume a run that died.
+resuming = False                      # True if this run resumes the unfinished run in the checkpoint journal.
+
+incremental_mode = False              # If True, communities whose units and promotions haven't changed since the last run are not extracted again.
+community_hashes = None               # Content hash of each community from the previous runs.
+kept_json_files = set()               # Json files that were written (or kept unchanged) in this run.
+changed_communities = []              # List of communities (formatted strings) whose units were extracted in this run. Intended for report.
+unchanged_communities = []            # List of communities (formatted strings) that were skipped because they haven't changed. Intended for report.
+listing_export = None                 # Writes all listings of the run to a single ndjson file and sqlite snapshot. None if disabled.
+price_history = None                  # Time series of the rent, availability and specials of each unit. None if disabled.
+num_worker_processes = 1              # If more than 1, the cities and communities are split across worker processes, each with its own browser.
+coordinator_mode = False              # If True, the work of the run is handed out to worker nodes by an http coordinator, instead of being scraped by this process.
+node_mode = False                     # If True, this process is a worker node that scrapes the work leased from a coordinator.
+daemon_mode = False                   # If True, the scraper keeps running, and scrapes modes 1, 4 and 6 on their intervals.
+refresh_run = False                   # True while the daemon refreshes the apartments of "apartment_refresh_intervals.txt". A refresh leaves the output of the other apartments alone.
+discovered_communities = []           # In node mode, the communities found in the cities of the current lease. They are handed back to the coordinator.
+lease_image_files = set()             # In node mode, the images of the units of the current lease. They are sent to the coordinator with the result of the lease.
+claimed_communities = None            # In worker mode, a dict shared by the worker processes: community url -> pid of the worker that scrapes it. A community reached from the cities of several workers is only scraped once.
+run_started_at = None                 # Time at which the current run (or resumed run) was started in this process. Used for the estimated time left.
+email_enabled = True                  # If False, the report of the run is not emailed.
+
 # These global variables will track the number of times that each function was called.
 total_calls_get_website = 0
 total_calls_get_state = 0
@@ -82,7 +132,35 @@ failed_calls_get_community = 0
 
 
 
-async def get_website(browser):
+def is_proxy_error(exception):
+    # Transport errors, timeouts and error statuses count against the proxy. Errors of the site or the parser (e.g. a missing element) don't.
+    if is_request_error(exception) or isinstance(exception, PlaywrightTimeoutError):
+        return True
+    # Navigation errors of the browser, e.g. NS_ERROR_PROXY_CONNECTION_REFUSED or NS_ERROR_NET_RESET.
+    return isinstance(exception, PlaywrightError) and ('NS_ERROR_' in str(exception) or 'net::ERR_' in str(exception))
+
+
+
+async def load_city_index(session):
+    # This function will make sure that the list of cities is loaded. It is fetched only once per run.
+    if city_index.cities != None:
+        return
+    proxy = get_proxy()
+    await rate_limiter.acquire(city_index.locations_url)
+    request_start = monotonic()
+    try:
+        with metrics.timer('city_index_fetch_seconds'):
+            await city_index.load(session, proxy[3])
+    except Exception as e:
+        if is_proxy_error(e):
+            report_proxy_failure(proxy)
+        raise
+    report_proxy_success(proxy, monotonic() - request_start)
+    rate_limiter.report_success(city_index.locations_url)
+
+
+
+async def get_website(browser, session):
     # This function will extract url of each city in the website.
     # It will then call get_city on each city.
     global total_calls_get_website
@@ -90,35 +168,22 @@ async def get_website(browser):
     max_attempts = 3
     for attempt_number in range(1,max_attempts+1):
         try:
-            proxy = get_proxy()
-            async with aiohttp.ClientSession() as session:
-                async with session.get('https://www2.avaloncommunities.com/apartment-locations', timeout=70, proxy=proxy[3]) as response:
-                    response_html = await response.text()
-                    response_status = response.status
-
-            selector = Selector(text=response_html)
-            city_a_list = selector.xpath('//div[@class="col-sm"]/a')
-            
-            cities = []
-            for element in city_a_list:
-                city_name = element.xpath('text()').get().strip()
-                city_url = element.xpath('@href').get().strip('/#? ')
-                if city_url.startswith('www'):
-                    city_url = 'https://' + city_url
-                city_state = city_url.split('/')[3].replace('-', ' ').title().strip()
-                cities.append({'url': city_url, 'name': city_name, 'state': city_state})
+            await load_city_index(session)    # The list of cities is fetched only once per run.
+            cities = city_index.get_all()
 
             logging.info(f'Cities found: {len(cities)}')
 
             tasks = set()
             for city in cities:
-                task = asyncio.create_task(get_city(browser, city['url'], city['name'], city['state']))
+                task = asyncio.create_task(get_city(browser, session, city['url'], city['name'], city['state']))
                 tasks.add(task)
                 task.add_done_callback(tasks.discard)
             await asyncio.gather(*tasks)
 
             break
         except:
+            if attempt_number < max_attempts:    # Wait before the next attempt.
+                await rate_limiter.wait_before_retry(attempt_number, sys.exc_info()[1], city_index.locations_url)
             if attempt_number == max_attempts:    # Print exception if all the attempts failed.
                 global failed_calls_get_website
                 failed_calls_get_website += 1
@@ -128,7 +193,7 @@ async def get_website(browser):
         
 
 
-async def get_state(browser, input_state):
+async def get_state(browser, session, input_state):
     # This function will extract url of each city in the state.
     # It will then call get_city on each city.
     global total_calls_get_state
@@ -137,36 +202,22 @@ async def get_state(browser, input_state):
     max_attempts = 3
     for attempt_number in range(1,max_attempts+1):
         try:
-            proxy = get_proxy()
-            async with aiohttp.ClientSession() as session:
-                async with session.get('https://www2.avaloncommunities.com/apartment-locations', timeout=70, proxy=proxy[3]) as response:
-                    response_html = await response.text()
-                    response_status = response.status
-
-            selector = Selector(text=response_html)
-            city_a_list = selector.xpath('//div[@class="col-sm"]/a')
-            
-            cities = []
-            for element in city_a_list:
-                city_name = element.xpath('text()').get().strip()
-                city_url = element.xpath('@href').get().strip('/#? ')
-                if city_url.startswith('www'):
-                    city_url = 'https://' + city_url
-                city_state = city_url.split('/')[3].replace('-', ' ').title().strip()
-                if city_state.lower() == input_state.lower():
-                    cities.append({'url': city_url, 'name': city_name, 'state': city_state})
+            await load_city_index(session)    # The list of cities is fetched only once per run.
+            cities = city_index.get_state(input_state)
             
             logging.info(f'Cities found: {len(cities)}')
 
             tasks = set()
             for city in cities:
-                task = asyncio.create_task(get_city(browser, city['url'], city['name'], city['state']))
+                task = asyncio.create_task(get_city(browser, session, city['url'], city['name'], city['state']))
                 tasks.add(task)
                 task.add_done_callback(tasks.discard)
             await asyncio.gather(*tasks)
 
             break
         except:
+            if attempt_number < max_attempts:    # Wait before the next attempt.
+                await rate_limiter.wait_before_retry(attempt_number, sys.exc_info()[1], city_index.locations_url)
             if attempt_number == max_attempts:    # Print exception if all the attempts failed.
                 global failed_calls_get_state
                 failed_calls_get_state += 1
@@ -176,7 +227,7 @@ async def get_state(browser, input_state):
 
 
 
-async def get_city_from_name(browser, input_city_name):
+async def get_city_from_name(browser, session, input_city_name):
     # This function will find the city whose name matches the input_city_name.
     # It will then call get_city on the city.
     global total_calls_get_city_name
@@ -184,37 +235,23 @@ async def get_city_from_name(browser, input_city_name):
     max_attempts = 3
     for attempt_number in range(1,max_attempts+1):
         try:
-            proxy = get_proxy()
-            async with aiohttp.ClientSession() as session:
-                async with session.get('https://www2.avaloncommunities.com/apartment-locations', timeout=70, proxy=proxy[3]) as response:
-                    response_html = await response.text()
-                    response_status = response.status
-
-            selector = Selector(text=response_html)
-            city_a_list = selector.xpath('//div[@class="col-sm"]/a')
-            
-            cities = []
-            for element in city_a_list:
-                city_name = element.xpath('text()').get().strip()
-                city_url = element.xpath('@href').get().strip('/#? ')
-                if city_url.startswith('www'):
-                    city_url = 'https://' + city_url
-                city_state = city_url.split('/')[3].replace('-', ' ').title().strip()
-                if input_city_name.lower() == city_name.lower():
-                    cities.append({'url': city_url, 'name': city_name, 'state': city_state})
+            await load_city_index(session)    # The list of cities is fetched only once per run.
+            cities = city_index.get_city(input_city_name)
 
             if len(cities)== 0:
                 logging.info(f'\n---- Found no city that matches name: {input_city_name}\n')
 
             tasks = set()
             for city in cities:
-                task = asyncio.create_task(get_city(browser, city['url'], city['name'], city['state']))
+                task = asyncio.create_task(get_city(browser, session, city['url'], city['name'], city['state']))
                 tasks.add(task)
                 task.add_done_callback(tasks.discard)
             await asyncio.gather(*tasks)
 
             break
         except:
+            if attempt_number < max_attempts:    # Wait before the next attempt.
+                await rate_limiter.wait_before_retry(attempt_number, sys.exc_info()[1], city_index.locations_url)
             if attempt_number == max_attempts:    # Print exception if all the attempts failed.
                 global failed_calls_get_city_name
                 failed_calls_get_city_name += 1
@@ -223,410 +260,630 @@ async def get_city_from_name(browser, input_city_name):
                 logging.exception('exception: ')
 
 
-async def get_city(browser, city_url, city_name, city_state):
+async def get_city(browser, session, city_url, city_name, city_state):
     # This function will extract url of each apartment/community in the city.
-    # It will then call get_community on each apartment.
+    # It will then add each apartment to the community queue, where it is scraped by the community workers.
+    if checkpoint.is_city_finished(city_url):    # City was finished before the run was resumed.
+        logging.info(f'-- Skipping city. Already finished: {city_name} ({city_state})')
+        return
+    checkpoint.record_city(city_url, 'queued')
     global semaphore_cities
-    async with semaphore_cities:    # The semaphore controls how many cities can be scraped simultaneously.
+    async with semaphore_cities:    # Controls how many cities can be scraped simultaneously. The page slot is only taken around the page below, so that retries and rate limit waits don't hold it.
         global total_calls_get_city
         total_calls_get_city += 1
         logging.info(f'\nFetching city: {city_name} ({city_state})\n')
-        page = None
-        context = None
+        proxy = None
         max_attempts = 3
         for attempt_number in range(1,max_attempts+1):
             try:
-                proxy = get_proxy()
-                context = await browser.new_context(
-                    viewport = {'height': 757, 'width': 1368},
-                    proxy = {
-                        'server': proxy[0],
-                        'username': proxy[1],
-                        'password': proxy[2]
-                    }
-                )
-                page = await context.new_page()
-
-                # Abort image requests to reduce network usage.
-                await page.route("**/*.{png,jpg,jpeg}", lambda route: route.abort())
-                await page.route("**/*", lambda route: route.abort() if route.request.resource_type == "image"  else route.continue_())
-
-                await page.goto(city_url, timeout=70000)
-
-                community_button = page.locator('xpath=//button[@id="community-toggle"]')
-
-                try:
-                    await community_button.click()
-                except:
-                    has_404 = await page.locator('xpath=//h1[text()="404 Page Not Found"]').is_visible()
-                    if has_404:
-                        logging.info(f'-- Skipping city. Page not found: {city_url}')
-                        await page.close()
-                        await context.close()
-                        return
-                    else:
-                        raise Exception('Community button not found.')
-
-                community_cards = page.locator('xpath=//div[contains(@class,"community-card-wrapper")]')
-
-                num_communities = await community_cards.count()
-
-                logging.info(f'\nNumber of communities: {num_communities}\n')
-
-                communities = []
-                for i in range(num_communities):
-                    community_card = community_cards.nth(i)
-                    community_a_element = community_card.locator('xpath=.//a[@class="community-card-link"]')
-                    community_name = await community_a_element.inner_text()
-                    community_url = await community_a_element.get_attribute('href')
-                    community_url = parse.urljoin(city_url, community_url)
-                    community_address = await community_card.locator('xpath=.//div[contains(@class,"community-card-name")]/following-sibling::div').inner_text()
-                    address_number, address_street, address_city, address_state, address_zip = data_manipulation.split_address(community_address)
-                    communities.append({'community_name':community_name, 'community_url':community_url, 'address_city':address_city, 'address_state':address_state, 'address_street':address_street, 'address_number':address_number, 'address_zip':address_zip})
-                    #logging.info(community_name)
-
+                proxy = None
+                proxy_succeeded = False    # Errors after the page loaded (e.g. a missing element) aren't the proxy's fault.
+                await rate_limiter.acquire(city_url)
+                async with semaphore_pages:    # Wait for a free page slot. The slot is only held while the page is open.
+                    request_start = monotonic()
+                    async with context_pool.page() as (page, proxy):    # The page is closed, and the context returned to the pool, when the block exits. The pool picks the proxy.
+                        with metrics.timer('page_goto_seconds', page_type='city'):
+                            response = await page.goto(city_url, timeout=70000)
+                        if response:
+                            check_response_status(response.status, response.headers.get('retry-after'))
+                        report_proxy_success(proxy, monotonic() - request_start)
+                        proxy_succeeded = True
+                        rate_limiter.report_success(city_url)
+
+                        community_button = page.locator('xpath=//button[@id="community-toggle"]')
+
+                        try:
+                            await community_button.click()
+                        except:
+                            has_404 = await page.locator('xpath=//h1[text()="404 Page Not Found"]').is_visible()
+                            if has_404:
+                                logging.info(f'-- Skipping city. Page not found: {city_url}')
+                                checkpoint.record_city(city_url, 'finished')
+                                return
+                            else:
+                                raise Exception('Community button not found.')
+
+                        community_cards = page.locator('xpath=//div[contains(@class,"community-card-wrapper")]')
+
+                        num_communities = await community_cards.count()
+
+                        logging.info(f'\nNumber of communities: {num_communities}\n')
+
+                        communities = []
+                        for i in range(num_communities):
+                            community_card = community_cards.nth(i)
+                            community_a_element = community_card.locator('xpath=.//a[@class="community-card-link"]')
+                            community_name = await community_a_element.inner_text()
+                            community_url = await community_a_element.get_attribute('href')
+                            community_url = parse.urljoin(city_url, community_url)
+                            community_address = await community_card.locator('xpath=.//div[contains(@class,"community-card-name")]/following-sibling::div').inner_text()
+                            address_number, address_street, address_city, address_state, address_zip = data_manipulation.split_address(community_address)
+                            communities.append({'community_name':community_name, 'community_url':community_url, 'address_city':address_city, 'address_state':address_state, 'address_street':address_street, 'address_number':address_number, 'address_zip':address_zip})
+                            #logging.info(community_name)
+
+                # The city doesn't wait for its communities. They are scraped by the community workers, so that big cities don't hold up a city slot.
                 for community in communities:
-                    if community['community_url'] not in scraped_communities:    # Do not scrape the same community more than once.
-                        await get_community_from_url(browser, community['community_url'])
-                    else:
-                        logging.info(logging.info(f'-- community is duplicate. not scraping again: {community_url}'))
-
-                await page.close()
-                await context.close()
+                    queue_community(community['community_url'])
+                checkpoint.record_city(city_url, 'finished')
 
                 break
             except:
+                if not proxy_succeeded and is_proxy_error(sys.exc_info()[1]):
+                    report_proxy_failure(proxy)
+                if attempt_number < max_attempts:    # Wait before the next attempt.
+                    await rate_limiter.wait_before_retry(attempt_number, sys.exc_info()[1], city_url)
                 if attempt_number == max_attempts:    # Print exception if all the attempts failed.
                     global failed_calls_get_city
                     failed_calls_get_city += 1
+                    checkpoint.record_city(city_url, 'failed')
                     logging.info(f'Exception in get_city: {city_url}')
                     #logging.info(f'Exception in attempt {attempt_number}')
                     logging.exception('exception: ')
-                if page:
-                    await page.close()
-                if context:
-                    await context.close()
     
 
 
-async def get_community_from_url(browser, community_url):
+async def get_community_from_url(browser, session, community_url):
     # This function will extract each unit it the community/apartment.
     # It will then write the data to csv and json files.
+    if checkpoint.is_community_finished(community_url.split('#')[0].split('?')[0].strip('/')):    # Community was finished before the run was resumed.
+        logging.info(f'-- Skipping apartment. Already finished: {community_url}')
+        return
     global total_calls_get_community
     total_calls_get_community += 1
     logging.info(f'\nFetching apartment: {community_url}')
-    page = None
-    context = None
+    proxy = None
     max_attempts = 3
     for attempt_number in range(1,max_attempts+1):
         try:
             community_url = community_url.split('#')[0].split('?')[0].strip('/')
             scraped_communities.add(community_url)    # The community is added to scraped_communities before the function actually completes, to avoid making multiple requests to the same community. This will save resources and make the script faster.
             
-            proxy = get_proxy()
-            context = await browser.new_context(
-                viewport = {'height': 757, 'width': 1368},
-                proxy = {
-                    'server': proxy[0],
-                    'username': proxy[1],
-                    'password': proxy[2]
-                }
-            )
-            page = await context.new_page()
-
-            # Abort image requests to reduce network usage.
-            await page.route("**/*.{png,jpg,jpeg}", lambda route: route.abort())
-            await page.route("**/*", lambda route: route.abort() if route.request.resource_type == "image"  else route.continue_())
-
-            await page.goto(community_url, timeout=70000)
-
-            community_name = await page.locator('xpath=//h1[@id="cdph-title-id"]').inner_text()
-            community_name = community_name.strip()
-            
-            community_address = await page.locator('xpath=//div[@id="cdph-address-id"]').inner_text()
-            address_number, address_street, address_city, address_state, address_zip = data_manipulation.split_address(community_address)
-
-            community_phone = await page.locator('xpath=//a[contains(@href,"tel:")]').first.inner_text()
-            community_phone = data_manipulation.format_phone(community_phone)
+            proxy = None
+            proxy_succeeded = False    # Errors after the page loaded (e.g. in save_community) aren't the proxy's fault.
 
-            # A lot of the data is embedded inside a script tag.
-            embedded_script = await page.locator('xpath=//script[@id="fusion-metadata"]').inner_html()
-            
-            json_start_index = embedded_script.index('[{"unitId":')
-            json_end_index = embedded_script.index('}}],"promotions":')
-            embedded_json_units = embedded_script[json_start_index:json_end_index] + '}}]'
-            embedded_json_units = json.loads(embedded_json_units)
-
-            json_start_index = embedded_script.index('}}],"promotions":')
-            json_end_index = embedded_script.index(',"fees"')
-            embedded_json_promos = embedded_script[json_start_index:json_end_index].replace('}}],"promotions":','',1)
-            embedded_json_promos = json.loads(embedded_json_promos)
-
-            time_start_index = embedded_script.index('"officeHours":[')
-            time_end_index = embedded_script.index('],"policies":')
-            times_string = embedded_script[time_start_index:time_end_index].replace('"officeHours":[','',1)
-            times_string = times_string.replace('"','').replace(',',', ')
-
-            # Create a dict object that will be later written to a json file.
-            community_data = [
-                {
-                    "additional_data": {
-                        "original_url": community_url
-                    },
-                    "apartment_address_data": {
-                        "city": address_city,
-                        "state": address_state,
-                        "street_name": address_street,
-                        "street_number": address_number,
-                        "zip_code": address_zip
-                    },
-                    "contact_information": {
-                        "Office Hours": times_string,
-                        "name": community_name.replace(' ', '_'),
-                        "phone": community_phone
-                    },
-                    "listings": [],
-                    "error": None
-                }
-            ]
-
-            # Create _avalonbay_apartments.csv if it doesn't already exist.
-            if not Path.exists(this_directory / 'output/_avalonbay_apartments.csv'):
-                with open(Path('output/_avalonbay_apartments.csv'), 'w', encoding='utf-8', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(community_csv_headers)
-
-            # Read all content from _avalonbay_apartments.csv
-            with open(Path(this_directory / 'output/_avalonbay_apartments.csv'), 'r', encoding='utf-8') as f:
-                file_content = f.read()
-
-            # Add community info to _avalonbay_apartments.csv if community is not already in file.
-            with open(Path(this_directory / 'output/_avalonbay_apartments.csv'), 'a', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-                if community_url not in file_content:    # Do not add duplicates. Using community_url as unique identifier.
-                    csv_row = [community_name, community_url, address_number, address_street, address_city, address_state, address_zip]
-                    writer.writerow(csv_row)
-                    newly_scraped_communities.append(f'• {community_name} - {address_number} {address_street}, {address_city}, {address_state} {address_zip} - {community_url}')
-                else:
-                    logging.info(f'-- community already in file: {community_url}')
-                    existing_scraped_communities.append(f'• {community_name} - {address_number} {address_street}, {address_city}, {address_state} {address_zip} - {community_url}')
-
-            # Create json file for this community.
-            json_file_name = slugify(f'{address_state}_{address_city}_{community_name}').replace('-', '_') + '.json'
-            with open(Path(this_directory, f'output/{json_file_name}'), 'w', encoding='utf-8') as f:
-                pass
-
-            logging.info(f'\nCommunity: {community_name}')
-            #logging.info(f'Phone: {community_phone}')
-            #logging.info(f'Times: {times_string}\n')
-
-            logging.debug('--- waiting for popup button')
-            close_specials_button = page.locator('xpath=//span[@aria-label="close"]')
-            if await close_specials_button.is_visible():
-                await close_specials_button.click()
-                logging.debug('--- closed popup')
-            else:
-                logging.debug('--- popup not found')
-
-            logging.debug('--- waiting for load button')
-            load_all_button = page.locator('xpath=//button[@id="load-all-units"]')
-            if await load_all_button.is_visible():
-                await load_all_button.click()
-                logging.debug('--- clicked load button')
-            else:
-                logging.debug('--- load button not found')
-            
-            unit_cards = page.locator(f'xpath=//div[@class="ant-card-body"]')
-
-            num_units = await unit_cards.count()
+            # In browserless mode the community page is fetched over plain http. The browser is only used if the static html lacks the embedded metadata.
+            if browserless_mode:
+                proxy = get_proxy()
+                await rate_limiter.acquire(community_url)
+                request_start = monotonic()
+                community_page = await fetch_community_page(session, community_url, proxy)
+                report_proxy_success(proxy, monotonic() - request_start)
+                proxy_succeeded = True
+                rate_limiter.report_success(community_url)
+                if community_page:
+                    community_summary = await save_community(session, community_url, community_page, proxy)
+                    checkpoint.record_community(community_url, 'finished', **community_summary)
+                    break
+                logging.info(f'-- metadata not found in static html. Falling back to browser: {community_url}')
+
+            async with semaphore_pages:    # Wait for a free page slot.
+                await rate_limiter.acquire(community_url)
+                request_start = monotonic()
+                proxy_succeeded = False
+                async with context_pool.page(proxy) as (page, proxy):    # The page is closed, and the context returned to the pool, when the block exits. The proxy of the http fetch is used if its context is warm.
+                    with metrics.timer('page_goto_seconds', page_type='community'):
+                        response = await page.goto(community_url, timeout=70000)
+                    if response:
+                        check_response_status(response.status, response.headers.get('retry-after'))
+                    await page.locator('xpath=//h1[@id="cdph-title-id"]').wait_for()    # Wait for the page to render before reading it.
+                    report_proxy_success(proxy, monotonic() - request_start)
+                    proxy_succeeded = True
+                    rate_limiter.report_success(community_url)
+
+                    logging.debug('--- waiting for popup button')
+                    close_specials_button = page.locator('xpath=//span[@aria-label="close"]')
+                    if await close_specials_button.is_visible():
+                        await close_specials_button.click()
+                        logging.debug('--- closed popup')
+                    else:
+                        logging.debug('--- popup not found')
 
-            logging.info(f'Num of units: {num_units}')
-            
-            # Extract data for all the units.
-            # Foe each unit data is extracted in 2 steps.
-            # 1) Available data is extracted from the html.
-            # 2) Remaining data items are extracted from embedded_json.
-            for i in range(num_units):
-                # 1) Extract unit data from cards.
-                unit_card = unit_cards.nth(i)
-                title = await unit_card.locator('xpath=.//div[@class="ant-card-meta-title"]').inner_text()
-                unit_number = title.split('\n')[0].replace('Apt.', '',1).strip()
-                
-                unit_specs = await unit_card.locator('xpath=.//div[@class="description"]').inner_text()
-                unit_specs = unit_specs.split('•')
-                
-                unit_price = await unit_card.locator('xpath=.//span[contains(@class,"unit-price")]').inner_text()
-                unit_url = await unit_card.locator('xpath=.//a[contains(@class,"unit-item-details-title")]').get_attribute('href')
-                unit_url = unit_url.split('?')[0]
-                
-                unit_furnish_price = None
-                furnish_div = unit_card.locator('xpath=.//div[contains(text(),"Furnished starting at")]')
-                if await furnish_div.is_visible():
-                    unit_furnish_price = await furnish_div.inner_text()
-                    unit_furnish_price = unit_furnish_price.replace('Furnished starting at','').strip()
-
-                unit_img_url = await unit_card.locator('xpath=.//div[contains(@class,"unit-image")]//img').first.get_attribute('src')
-                unit_img_url = parse.urljoin(community_url, unit_img_url)  # Some image urls like '/pf/resources/img/notfound-borderless.png?d=80' need joining.
-                unit_img_filename = get_image_filename(unit_img_url)
-
-                # 2) Extract remaining unit data from embedded_json_units
-                for unit_json in embedded_json_units:
-                    # In order to find the object associated with the unit in the json, the unit_number has to manipulated to remove the building number.
-                    if '-' in unit_number:
-                        unit_number_half = unit_number.split('-')[1]    # Remove number before dash. (remove the building number) 
+                    logging.debug('--- waiting for load button')
+                    load_all_button = page.locator('xpath=//button[@id="load-all-units"]')
+                    if await load_all_button.is_visible():
+                        await load_all_button.click()
+                        logging.debug('--- clicked load button')
                     else:
-                        unit_number_half = unit_number
+                        logging.debug('--- load button not found')
                     
-                    if unit_json['name'] == unit_number_half:          # Look for relevant object in json that contains unit's data. Matching based on unit_number_half (without the building number).
-                        unit_beds = unit_json['bedroom']
-                        if unit_beds:    # Convert from integer to string.
-                            unit_beds = str(unit_beds)
-                        unit_baths = unit_json['bathroom']
-                        if unit_baths:    # Convert from integer to string.
-                            unit_baths = str(unit_baths)
-                        unit_sqft = unit_json['squareFeet']
-                        if unit_sqft:    # Convert from integer to string.
-                            unit_sqft = str(unit_sqft)
-                        
-                        unit_floorplan_name = None
-                        if 'floorPlan' in unit_json:
-                            unit_floorplan_name = unit_json['floorPlan']['name']
-                            unit_floorplan_name = unit_floorplan_name.split('-')[0]
-                        
-                        unit_adate = None
-                        if 'availableDate' in unit_json:
-                            unit_adate = unit_json['availableDate']
-                        else:
-                            unit_adate = unit_json['furnishedAvailableDate']
-                        unit_adate = data_manipulation.manipulate_date(unit_adate)
-                        
-                        unit_specials = []
-                        if 'promotions' in unit_json:
-                            for promo in unit_json['promotions']:
-                                promo_id = promo['promotionId']
-                                for promo2 in embedded_json_promos:   # Match promo id from embedded_json_units with promo id in embedded_json_promos to get promo title.
-                                    if promo_id == promo2['promotionId']:
-                                        promo_title = promo2['promotionTitle']
-                                        unit_specials.append(promo_title)
-                        unit_specials = '\n'.join(s for s in unit_specials)
-                        if unit_specials == '':
-                            unit_specials = None
-                        
-                        unit_package = None
-                        if 'finishPackage' in unit_json:
-                            package_name = unit_json['finishPackage']['name']
-                            package_disc = unit_json['finishPackage']['description']
-                            unit_package = package_disc
-                        
-                        # Add unit_package and unit_furnish_price to unit_details.
-                        unit_details = []
-                        if unit_package:
-                            unit_details.append(unit_package)
-                        if unit_furnish_price:
-                            unit_details.append(f'Furnished starting at {unit_furnish_price}')
-                        unit_details = '\n'.join(s for s in unit_details)
-                        if unit_details == '':
-                            unit_details = None
-                        
-                        unit_virtual = None
-                        if 'virtualTour' in unit_json:
-                            unit_virtual = unit_json['virtualTour']['space']
-                        
-                        break
-
-                logging.info('\n')
-                logging.info(f'Unit no: {unit_number}')
-                #logging.info(f'Half unit no: {unit_number_half}')
-                #logging.info(f'Floorplan: {unit_floorplan_name}')
-                #logging.info(f'Spec list: {unit_specs}')
-                logging.info(f'Beds: {unit_beds}')
-                logging.info(f'Baths: {unit_baths}')
-                logging.info(f'Sqft: {unit_sqft}')
-                logging.info(f'Price: {unit_price}')
-                #logging.info(f'Fur price: {unit_furnish_price}')
-                logging.info(f'Apt url: {community_url}')
-                #logging.info(f'Url: {unit_url}')
-                #logging.info(f'Image url: {unit_img_url}')
-                #logging.info(f'Virtual tour: {unit_virtual}')
-                #logging.info(f'Move in: {unit_adate}')
-                #logging.info(f'Specials: {unit_specials}')
-                #logging.info(f'Packages: {unit_package}')
-                #logging.info(f'Details: {unit_details}')
-
-                # Add the unit's data to community_data dict, inside the listings object.
-                community_data[0]['listings'].append(
-                    {
-                        "available": unit_adate,
-                        "bathrooms": unit_baths,
-                        "bedrooms": unit_beds,
-                        "floor_plan_name": unit_floorplan_name,
-                        "rent": unit_price,
-                        "furnishedRent": unit_furnish_price,
-                        "sqft": unit_sqft,
-                        "unitId": unit_number,
-                        "unit_url": unit_url,
-                        "image_url": unit_img_url,
-                        "image_filename": unit_img_filename,
-                        "virtual_tour": unit_virtual,
-                        "specials": unit_specials,
-                        "unit_details": unit_details
-                    }
-                )
-
-                await download_image(unit_img_url, proxy)
-                global num_scraped_units
-                num_scraped_units += 1
-
-            # Write 'community_data' to json file.
-            with open(Path(this_directory, f'output/{json_file_name}'), 'a', encoding='utf-8') as f:
-                json.dump(community_data, f)
-
-            await page.close()
-            await context.close()
+                    # All data is extracted from a single snapshot of the page html, instead of querying the browser separately for each field of each unit.
+                    page_html = await page.content()
+
+            community_page = parse_community_html(page_html, community_url)
+            if community_page == None:
+                raise Exception('Community data not found in page.')
+            community_page['units_from_json'] = False
+
+            community_summary = await save_community(session, community_url, community_page, proxy)
+            checkpoint.record_community(community_url, 'finished', **community_summary)
             
             break
         except:
+            if not proxy_succeeded and is_proxy_error(sys.exc_info()[1]):
+                report_proxy_failure(proxy)
+            if attempt_number < max_attempts:    # Wait before the next attempt.
+                await rate_limiter.wait_before_retry(attempt_number, sys.exc_info()[1], community_url)
             if attempt_number == max_attempts:    # Print exception if all the attempts failed.
                 global failed_calls_get_community
                 failed_calls_get_community += 1
+                checkpoint.record_community(community_url, 'failed')
                 logging.info(f'Exception in get_community: {community_url}')
                 #logging.info(f'Exception in attempt {attempt_number}')
                 logging.exception('exception: ')
-            if page:
-                await page.close()
-            if context:
-                await context.close()
 
 
 
-async def download_image(url, proxy):
+def queue_community(community_url):
+    # This function will add the community to the community queue, unless it was already scraped or queued.
+    community_url = community_url.split('#')[0].split('?')[0].strip('/')
+    if community_url in scraped_communities or community_url in queued_communities:    # Do not scrape the same community more than once.
+        logging.info(f'-- community is duplicate. not scraping again: {community_url}')
+        return
+    if claimed_communities != None and claimed_communities.setdefault(community_url, os.getpid()) != os.getpid():    # Another worker process scrapes it.
+        logging.info(f'-- community is scraped by another worker process: {community_url}')
+        return
+    queued_communities.add(community_url)
+    if node_mode:    # The coordinator leases the community out, possibly to another node.
+        discovered_communities.append(community_url)
+        return
+    community_queue.put_nowait(community_url)
+    checkpoint.record_community(community_url, 'queued')
+
+
+
+async def community_worker(browser, session):
+    # Community workers take communities from the shared community queue, until the queue is empty and the worker is cancelled.
+    while True:
+        community_url = await community_queue.get()
+        try:
+            await get_community_from_url(browser, session, community_url)
+        finally:
+            community_queue.task_done()
+
+
+
+async def setup_browser_context(context, proxy_server):
+    # This function is called by the context pool for each new browser context.
+    # Abort requests that the scrape doesn't need (images, fonts, third party scripts etc.) to reduce network usage.
+    await context.route("**/*", blocking_profile.handle_route)
+    context.on('requestfinished', functools.partial(on_request_finished, proxy_server))
+
+
+
+async def on_request_finished(proxy_server, request):
+    # Count the bytes of each browser response, for the network usage report and the bytes of each proxy.
+    num_bytes = await blocking_profile.on_request_finished(request)
+    metrics.increment('proxy_bytes', num_bytes, proxy=proxy_server)
+
+
+
+async def fetch_community_page(session, community_url, proxy):
+    # This function will fetch the community page over plain http (without the browser) and parse it with parsel.
+    # It returns None if the static html doesn't contain the data that is needed, so that the caller can fall back to the browser.
+    with metrics.timer('http_fetch_seconds', page_type='community'):
+        async with session.get(community_url, timeout=70, proxy=proxy[3]) as response:
+            check_response_status(response.status, response.headers.get('Retry-After'))
+            response_bytes = await response.read()
+            response_html = response_bytes.decode(response.get_encoding())
+            response_status = response.status
+    metrics.increment('proxy_bytes', len(response_bytes), proxy=proxy[0])
+
+    if response_status == 404:
+        raise Exception(f'Page not found: {community_url}')
+
+    community_page = parse_community_html(response_html, community_url)
+    if community_page:
+        community_page['units_from_json'] = True    # Unit cards are usually rendered client side, so the list of units comes from the json.
+    return community_page
+
+
+
+def parse_community_html(html, community_url):
+    # This function will extract the community details, the embedded metadata and all the unit cards from the html of a community page.
+    # It returns None if the html doesn't contain the community details or the embedded data.
+    selector = Selector(text=html)
+
+    embedded_script = selector.xpath('//script[@id="fusion-metadata"]/text()').get()
+    community_name = ' '.join(t.strip() for t in selector.xpath('//h1[@id="cdph-title-id"]//text()').getall() if t.strip())
+    community_address = ' '.join(t.strip() for t in selector.xpath('//div[@id="cdph-address-id"]//text()').getall() if t.strip())
+    community_phone = ''.join(selector.xpath('(//a[contains(@href,"tel:")])[1]//text()').getall())
+
+    if not embedded_script or not community_name or '•' not in community_address:
+        return None
+
+    with metrics.timer('json_parse_seconds'):
+        metadata = parse_fusion_metadata(embedded_script)    # Units, promotions, office hours, fees and policies of the community.
+    if metadata == None:
+        return None
+
+    with metrics.timer('card_extraction_seconds'):
+        cards = []
+        for unit_card in selector.xpath('//div[@class="ant-card-body"]'):
+            title = '\n'.join(t.strip() for t in unit_card.xpath('.//div[@class="ant-card-meta-title"]//text()').getall() if t.strip())
+            unit_specs = ' '.join(t.strip() for t in unit_card.xpath('.//div[@class="description"]//text()').getall() if t.strip())
+            unit_price = ''.join(t.strip() for t in unit_card.xpath('.//span[contains(@class,"unit-price")]//text()').getall())
+            unit_url = unit_card.xpath('.//a[contains(@class,"unit-item-details-title")]/@href').get()
+            unit_furnish_price = unit_card.xpath('string(.//div[contains(text(),"Furnished starting at")])').get() or None
+            unit_img_url = unit_card.xpath('.//div[contains(@class,"unit-image")]//img/@src').get()
+            cards.append(make_unit_card(community_url, title, unit_specs, unit_price, unit_url, unit_furnish_price, unit_img_url))
+
+    return {
+        'community_name': community_name,
+        'community_address': community_address,
+        'community_phone': community_phone,
+        'metadata': metadata,
+        'unit_cards': cards
+    }
+
+
+
+def make_unit_card(community_url, title, unit_specs, unit_price, unit_url, unit_furnish_price, unit_img_url):
+    # This function will clean up the raw text extracted from a unit card and return it as a dict.
+    unit_number = title.split('\n')[0].replace('Apt.', '',1).strip()
+    unit_specs = unit_specs.split('•')
+
+    if unit_url:
+        unit_url = unit_url.split('?')[0]
+
+    if unit_furnish_price:
+        unit_furnish_price = unit_furnish_price.replace('Furnished starting at','').strip()
+
+    if unit_img_url:
+        unit_img_url = parse.urljoin(community_url, unit_img_url)  # Some image urls like '/pf/resources/img/notfound-borderless.png?d=80' need joining.
+
+    return {
+        'unit_number': unit_number,
+        'unit_specs': unit_specs,
+        'unit_price': unit_price,
+        'unit_url': unit_url,
+        'unit_furnish_price': unit_furnish_price,
+        'unit_img_url': unit_img_url
+    }
+
+
+
+def make_unit_card_from_json(community_url, unit_json):
+    # This function will build a unit card from the embedded json, for units whose card is not present in the static html.
+    unit_number = unit_json['name']
+    if unit_json.get('buildingNumber'):
+        unit_number = f"{unit_json['buildingNumber']}-{unit_number}"
+
+    unit_price = data_manipulation.format_price(get_nested(unit_json, 'startingAtPricesUnfurnished', 'prices', 'price'))
+    unit_furnish_price = data_manipulation.format_price(get_nested(unit_json, 'startingAtPricesFurnished', 'prices', 'price'))
+
+    unit_url = unit_json.get('url')
+    if unit_url:
+        unit_url = unit_url.split('?')[0]    # Kept relative, like the href of the unit cards.
+
+    unit_img_url = get_nested(unit_json, 'floorPlan', 'highResolutionImage') or get_nested(unit_json, 'floorPlan', 'lowResolutionImage')
+    if unit_img_url:
+        unit_img_url = parse.urljoin(community_url, unit_img_url)
+
+    return {
+        'unit_number': unit_number,
+        'unit_specs': [],
+        'unit_price': unit_price,
+        'unit_url': unit_url,
+        'unit_furnish_price': unit_furnish_price,
+        'unit_img_url': unit_img_url
+    }
+
+
+
+def find_unit_json(units_by_name, unit_number, community_url):
+    # This function will return the object in the embedded json that contains the unit's data.
+    # In order to find the object associated with the unit in the json, the unit_number has to manipulated to remove the building number.
+    if '-' in unit_number:
+        building_number, unit_number_half = unit_number.split('-', 1)    # Remove number before dash. (remove the building number)
+    else:
+        building_number, unit_number_half = None, unit_number
+
+    matches = units_by_name.get(unit_number_half, [])    # Matching based on unit_number_half (without the building number).
+    if len(matches) == 1:
+        return matches[0]
+    if len(matches) == 0:
+        logging.info(f'-- unit not found in embedded json: {unit_number} ({community_url})')
+        return None
+
+    # Several buildings have a unit with this name. Use the building number to pick the right one, rather than attaching another unit's data.
+    if building_number:
+        building_matches = [m for m in matches if str(m.get('buildingNumber')) == building_number]
+        if len(building_matches) == 1:
+            return building_matches[0]
+    logging.info(f'-- unit name is ambiguous in embedded json ({len(matches)} matches). Not using json data for unit: {unit_number} ({community_url})')
+    return None
+
+
+
+def get_nested(data, *keys):
+    # This function will return the value at the given path of keys, or None if any key along the path is missing.
+    for key in keys:
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+
+
+async def save_community(session, community_url, community_page, proxy):
+    # This function will combine the html data and the embedded json of a community, and write it to the csv and json files.
+    # It returns a summary of the community, which is recorded in the checkpoint journal.
+    community_name = community_page['community_name'].strip()
+    address_number, address_street, address_city, address_state, address_zip = data_manipulation.split_address(community_page['community_address'])
+    community_phone = data_manipulation.format_phone(community_page['community_phone'])
+    
+    metadata = community_page['metadata']    # Decoded from the fusion-metadata script by parse_community_html.
+    embedded_json_units = metadata.units
+    embedded_json_promos = metadata.promotions
+    times_string = metadata.get_office_hours_text()
+
+    # Create a dict object that will be later written to a json file.
+    community_data = [
+        {
+            "additional_data": {
+                "original_url": community_url
+            },
+            "apartment_address_data": {
+                "city": address_city,
+                "state": address_state,
+                "street_name": address_street,
+                "street_number": address_number,
+                "zip_code": address_zip
+            },
+            "contact_information": {
+                "Office Hours": times_string,
+                "name": community_name.replace(' ', '_'),
+                "phone": community_phone
+            },
+            "listings": [],
+            "error": None
+        }
+    ]
+
+    # Add community info to _avalonbay_apartments.csv if community is not already in file.
+    csv_row = [community_name, community_url, address_number, address_street, address_city, address_state, address_zip]
+    report_line = f'• {community_name} - {address_number} {address_street}, {address_city}, {address_state} {address_zip} - {community_url}'
+    is_new_community = community_index.add(csv_row)    # Do not add duplicates. Using community_url as unique identifier.
+    if is_new_community:
+        newly_scraped_communities.append(report_line)
+    else:
+        logging.info(f'-- community already in file: {community_url}')
+        existing_scraped_communities.append(report_line)
+
+    json_file_name = slugify(f'{address_state}_{address_city}_{community_name}').replace('-', '_') + '.json'
+    kept_json_files.add(json_file_name)
+
+    # In incremental mode, a community whose units and promotions are the same as in the last run keeps its json file from that run.
+    content_hash = get_content_hash(embedded_json_units, embedded_json_promos)
+    if incremental_mode and community_hashes.is_unchanged(community_url, content_hash, Path(this_directory, f'output/{json_file_name}')):
+        logging.info(f'-- community unchanged since last run. Skipping units: {community_url}')
+        unchanged_communities.append(report_line)
+        if listing_export:    # The listings of the unchanged community are exported from its json file.
+            with open(Path(this_directory, f'output/{json_file_name}'), 'r', encoding='utf-8') as f:
+                listing_export.write_community(json.load(f))
+        return {'units': 0, 'new': is_new_community, 'csv_row': csv_row, 'report_line': report_line, 'json_file_name': json_file_name, 'unchanged': True}
+
+    # Create json file for this community.
+    with open(Path(this_directory, f'output/{json_file_name}'), 'w', encoding='utf-8') as f:
+        pass
+
+    logging.info(f'\nCommunity: {community_name}')
+    #logging.info(f'Phone: {community_phone}')
+    #logging.info(f'Times: {times_string}\n')
+
+    unit_cards = community_page['unit_cards']
+
+    # Without the browser, the list of units comes from embedded_json_units. Cards found in the static html are used where available.
+    if community_page['units_from_json']:
+        cards_by_number = {card['unit_number']: card for card in unit_cards}
+        unit_cards = []
+        for unit_json in embedded_json_units:
+            json_card = make_unit_card_from_json(community_url, unit_json)
+            unit_cards.append(cards_by_number.get(json_card['unit_number'], json_card))
+
+    logging.info(f'Num of units: {len(unit_cards)}')
+
+    # Index the embedded json once per community, so that finding each unit and promotion is a dict lookup.
+    units_by_name = {}
+    for unit_json in embedded_json_units:
+        units_by_name.setdefault(unit_json['name'], []).append(unit_json)
+    promo_titles = metadata.get_promo_titles()
+    
+    # Extract data for all the units.
+    # Foe each unit data is extracted in 2 steps.
+    # 1) Available data is taken from the unit card.
+    # 2) Remaining data items are extracted from embedded_json.
+    for card in unit_cards:
+        # 1) Unit data from cards.
+        unit_number = card['unit_number']
+        unit_price = card['unit_price']
+        unit_url = card['unit_url']
+        unit_furnish_price = card['unit_furnish_price']
+        unit_img_url = card['unit_img_url']
+        unit_img_filename = get_image_filename(unit_img_url) if unit_img_url else None
+
+        unit_beds = None
+        unit_baths = None
+        unit_sqft = None
+        unit_floorplan_name = None
+        unit_adate = None
+        unit_specials = None
+        unit_package = None
+        unit_details = None
+        unit_virtual = None
+
+        # 2) Extract remaining unit data from embedded_json_units
+        unit_json = find_unit_json(units_by_name, unit_number, community_url)
+        if unit_json:
+            unit_beds = unit_json['bedroom']
+            if unit_beds:    # Convert from integer to string.
+                unit_beds = str(unit_beds)
+            unit_baths = unit_json['bathroom']
+            if unit_baths:    # Convert from integer to string.
+                unit_baths = str(unit_baths)
+            unit_sqft = unit_json['squareFeet']
+            if unit_sqft:    # Convert from integer to string.
+                unit_sqft = str(unit_sqft)
+            
+            unit_floorplan_name = None
+            if 'floorPlan' in unit_json:
+                unit_floorplan_name = unit_json['floorPlan']['name']
+                unit_floorplan_name = unit_floorplan_name.split('-')[0]
+            
+            unit_adate = None
+            if 'availableDate' in unit_json:
+                unit_adate = unit_json['availableDate']
+            else:
+                unit_adate = unit_json['furnishedAvailableDate']
+            unit_adate = data_manipulation.manipulate_date(unit_adate)
+            
+            unit_specials = []
+            if 'promotions' in unit_json:
+                for promo in unit_json['promotions']:
+                    promo_id = promo['promotionId']
+                    if promo_id in promo_titles:   # Match promo id from embedded_json_units with promo id in embedded_json_promos to get promo title.
+                        unit_specials.append(promo_titles[promo_id])
+            unit_specials = '\n'.join(s for s in unit_specials)
+            if unit_specials == '':
+                unit_specials = None
+            
+            unit_package = None
+            if 'finishPackage' in unit_json:
+                package_name = unit_json['finishPackage']['name']
+                package_disc = unit_json['finishPackage']['description']
+                unit_package = package_disc
+            
+            # Add unit_package and unit_furnish_price to unit_details.
+            unit_details = []
+            if unit_package:
+                unit_details.append(unit_package)
+            if unit_furnish_price:
+                unit_details.append(f'Furnished starting at {unit_furnish_price}')
+            unit_details = '\n'.join(s for s in unit_details)
+            if unit_details == '':
+                unit_details = None
+            
+            unit_virtual = None
+            if 'virtualTour' in unit_json:
+                unit_virtual = unit_json['virtualTour']['space']
+
+        # Per-unit detail is only logged at DEBUG level (log_level in the config file), as it is most of the log of a full run.
+        logging.debug(f'Unit no: {unit_number}   Beds: {unit_beds}   Baths: {unit_baths}   Sqft: {unit_sqft}   Price: {unit_price}   Apt url: {community_url}')
+        #logging.info(f'Half unit no: {unit_number_half}')
+        #logging.info(f'Floorplan: {unit_floorplan_name}')
+        #logging.info(f'Spec list: {unit_specs}')
+        #logging.info(f'Fur price: {unit_furnish_price}')
+        #logging.info(f'Url: {unit_url}')
+        #logging.info(f'Image url: {unit_img_url}')
+        #logging.info(f'Virtual tour: {unit_virtual}')
+        #logging.info(f'Move in: {unit_adate}')
+        #logging.info(f'Specials: {unit_specials}')
+        #logging.info(f'Packages: {unit_package}')
+        #logging.info(f'Details: {unit_details}')
+
+        # Add the unit's data to community_data dict, inside the listings object.
+        community_data[0]['listings'].append(
+            {
+                "available": unit_adate,
+                "bathrooms": unit_baths,
+                "bedrooms": unit_beds,
+                "floor_plan_name": unit_floorplan_name,
+                "rent": unit_price,
+                "furnishedRent": unit_furnish_price,
+                "sqft": unit_sqft,
+                "unitId": unit_number,
+                "unit_url": unit_url,
+                "image_url": unit_img_url,
+                "image_filename": unit_img_filename,
+                "virtual_tour": unit_virtual,
+                "specials": unit_specials,
+                "unit_details": unit_details
+            }
+        )
+
+        await image_queue.put(session, unit_img_url, proxy)    # The image is downloaded in the background.
+        global num_scraped_units
+        num_scraped_units += 1
+
+    # Write 'community_data' to json file.
+    with open(Path(this_directory, f'output/{json_file_name}'), 'a', encoding='utf-8') as f:
+        json.dump(community_data, f)
+
+    # Stream the listings to the combined export file.
+    if listing_export:
+        listing_export.write_community(community_data)
+
+    # Store the changes in rent, availability and specials since the last run.
+    if price_history:
+        price_history.record_community(community_url, community_data[0]['listings'], datetime.now())
+
+    community_hashes.set(community_url, content_hash, json_file_name, len(community_data[0]['listings']))
+    changed_communities.append(report_line)
+
+    # Summary of the community for the checkpoint journal.
+    return {'units': len(community_data[0]['listings']), 'new': is_new_community, 'csv_row': csv_row, 'report_line': report_line, 'json_file_name': json_file_name, 'unchanged': False}
+
+
+
+async def download_image(session, url, proxy):
     # The purpose of this function is self evident from its name.
     if url == None:
-        logging.info('Missing image.')
+        logging.debug('Missing image.')
         return
     
     # Use image url to generate a unique file name.
     filename = get_image_filename(url)
+    if node_mode:    # The coordinator keeps the images of the run.
+        lease_image_files.add(filename)
 
     # Check if image is already saved in images folder. If not, download it to images folder.
     file_exists = os.path.exists(Path(this_directory, f'output/images/{filename}'))
     if not file_exists:
-        logging.info('Downloading image...')
+        logging.debug('Downloading image...')
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=70, proxy=proxy[3]) as response:
-                    #response = requests.get(url, stream=True, timeout=40, proxies={'http': proxy[3], 'https': proxy[3]})
-                    if response.status == 200:
-                        im = Image.open(BytesIO(await response.read()))
-                        rgb_im = im.convert('RGB')    # Convert image to jpg format.
-                        rgb_im.save(Path(this_directory, f'output/images/{filename}'))
-                        #new_images_list.append(filename)    # Append image filename to new_images_list.
-                        logging.info('Image successfully downloaded.')
-                    #del response
-        except Exception:
+            await rate_limiter.acquire(url)
+            request_start = monotonic()
+            async with session.get(url, timeout=70, proxy=proxy[3]) as response:
+                #response = requests.get(url, stream=True, timeout=40, proxies={'http': proxy[3], 'https': proxy[3]})
+                check_response_status(response.status, response.headers.get('Retry-After'))
+                if response.status == 200:
+                    image_bytes = await response.read()
+                    metrics.observe('image_download_seconds', monotonic() - request_start)
+                    metrics.increment('proxy_bytes', len(image_bytes), proxy=proxy[0])
+                    report_proxy_success(proxy, monotonic() - request_start)
+                    rate_limiter.report_success(url)
+                    # Convert image to jpg format in the process pool.
+                    await asyncio.get_running_loop().run_in_executor(image_executor, transcode_image, image_bytes, Path(this_directory, f'output/images/{filename}'))
+                    #new_images_list.append(filename)    # Append image filename to new_images_list.
+                    logging.debug('Image successfully downloaded.')
+                #del response
+        except Exception as e:
+            if is_proxy_error(e):
+                report_proxy_failure(proxy)
+            rate_limiter.report_error(url, e)
             logging.exception('exception: ')
     else:
-        logging.info('Image already exists.')
+        logging.debug('Image already exists.')
 
 
 
@@ -637,13 +894,7 @@ def get_missing_communities(mode):
     if mode != '1':    # This function is only intended to work with mode website.
         return []
     else:      # Mode is 1 (This logic only works if entire website was scraped.)
-        file_communities = []
-        with open(Path(this_directory / 'output/_avalonbay_apartments.csv'), 'r', encoding='utf-8',  newline='') as f:
-            reader = csv.reader(f)
-            for row in reader:
-                file_communities.append(row)
-
-        for file_comm in file_communities[1:]:     # Ignore header row.
+        for file_comm in community_index.rows():
             file_comm_url = file_comm[1]
             #logging.info(file_comm_url)
             if file_comm_url not in scraped_communities:   # Community is missing.
@@ -660,6 +911,14 @@ def get_missing_communities(mode):
     
 
 
+def remove_stale_json_files():
+    # This function will delete the json files in the output folder that weren't written or kept in this run.
+    for file_path in glob.glob(f'{this_directory}\output\*.json'):
+        if Path(file_path).name not in kept_json_files:
+            os.remove(file_path)
+
+
+
 def get_empty_files():
     # This function will return a list of all empty csv and json files in the output folder.
     empty_files = []
@@ -683,11 +942,11 @@ def get_empty_files():
 
 
 
-def generate_report(scraping_start_time, scraping_end_time, num_scraped_communities, num_scraped_units, empty_files, existing_scraped_communities, newly_scraped_communities, missing_communities):
+def generate_report(scraping_start_time, scraping_end_time, num_scraped_communities, num_scraped_units, empty_files, existing_scraped_communities, newly_scraped_communities, missing_communities, changed_communities, unchanged_communities, network_usage):
     # This function will generate a detailed report once scraping is complete.
     report_items = []
 
-    intro = f'Scrape has been completed! Please view the detailed report below.\n\nStart Time: {scraping_start_time.strftime("%Y-%m-%d %I:%M %p")}   \t\r\nEnd Time: {scraping_end_time.strftime("%Y-%m-%d %I:%M %p")}   \t\r\nApartments scraped: {num_scraped_communities}   \t\r\nUnits scraped: {num_scraped_units}   \t\r\nEmpty files: {len(empty_files)}   \t\r\nExisting apartments: {len(existing_scraped_communities)}   \t\r\nNew apartments: {len(newly_scraped_communities)}   \t\r\nMissing apartments: {len(missing_communities)}\n\n'
+    intro = f'Scrape has been completed! Please view the detailed report below.\n\nStart Time: {scraping_start_time.strftime("%Y-%m-%d %I:%M %p")}   \t\r\nEnd Time: {scraping_end_time.strftime("%Y-%m-%d %I:%M %p")}   \t\r\nApartments scraped: {num_scraped_communities}   \t\r\nUnits scraped: {num_scraped_units}   \t\r\nEmpty files: {len(empty_files)}   \t\r\nExisting apartments: {len(existing_scraped_communities)}   \t\r\nNew apartments: {len(newly_scraped_communities)}   \t\r\nMissing apartments: {len(missing_communities)}   \t\r\nChanged apartments: {len(changed_communities)}   \t\r\nUnchanged apartments: {len(unchanged_communities)}\n\n'
 
     report_items.append(intro)
 
@@ -711,6 +970,14 @@ def generate_report(scraping_start_time, scraping_end_time, num_scraped_communit
         item = f'Existing apartments scraped:\n{existing_apartments_str}\n\n'
         report_items.append(item)
 
+    if len(unchanged_communities) > 0:
+        unchanged_apartments_str = ''.join((e + '\n') for e in unchanged_communities)
+        item = f'Unchanged apartments (not extracted again):\n{unchanged_apartments_str}\n\n'
+        report_items.append(item)
+
+    item = f'Network usage:\n{network_usage}\n\n'
+    report_items.append(item)
+
     report = '\n'.join(item for item in report_items)
 
 
@@ -718,14 +985,899 @@ def generate_report(scraping_start_time, scraping_end_time, num_scraped_communit
     time_now = datetime.now()
     with open(this_directory / f'output/reports/report_{time_now.strftime("%Y_%m_%d_%H_%M_%S")}.txt', 'w', encoding='utf-8') as f:
         f.write(report.replace('   \t\r\n', '\n'))
+    # Write the metrics of the run next to the report.
+    metrics.write_json(this_directory / f'output/reports/metrics_{time_now.strftime("%Y_%m_%d_%H_%M_%S")}.json', get_progress())
 
     return report
 
     
 
+def restore_checkpoint():
+    # This function will restore the report data of the cities and communities that were finished before the run was resumed.
+    global num_scraped_units
+    global total_calls_get_city, total_calls_get_community
+    # A resumed run skips the finished cities and communities, so their calls are counted from the journal. Failed ones are tried again, and their calls are counted by the resumed run, like in a run that didn't die.
+    # The website, state and city name pages are fetched again by the resumed run, so their calls are counted then.
+    total_calls_get_city += len(checkpoint.get_finished_cities())
+    total_calls_get_community += len(checkpoint.get_finished_communities())
+    for record in checkpoint.get_finished_communities():
+        scraped_communities.add(record['url'])
+        num_scraped_units += record['units']
+        if record['new']:
+            newly_scraped_communities.append(record['report_line'])
+            if record.get('csv_row'):    # In worker mode, the row may not have been written before the run died.
+                community_index.add(record['csv_row'])
+        else:
+            existing_scraped_communities.append(record['report_line'])
+        kept_json_files.add(record['json_file_name'])
+        if record['unchanged']:
+            unchanged_communities.append(record['report_line'])
+        else:
+            changed_communities.append(record['report_line'])
+    logging.info(f'Resuming run. Apartments already finished: {len(scraped_communities)}')
+
+
+
+def start_run(mode, run_input=None):
+    # This function will start the checkpoint journal and return the start time of the run.
+    global run_started_at
+    run_started_at = datetime.now()
+    # A resumed run keeps the start time of the original run, and re-queues the communities that were not finished.
+    if resuming:
+        start_time = checkpoint.get_start_time()
+        checkpoint.start(mode, start_time, resume=True)
+        if num_worker_processes == 1 and not coordinator_mode:    # Otherwise, they are handed to the worker processes or nodes.
+            for community_url in checkpoint.get_unfinished_communities():
+                queue_community(community_url)
+    else:
+        start_time = datetime.now()
+        checkpoint.start(mode, start_time, run_input=run_input)
+    if listing_export:
+        listing_export.open(append=resuming or refresh_run)    # A refresh adds its listings to those of the last run. The snapshot keeps the latest listings of each apartment.
+    if price_history:
+        price_history.start_run(start_time)
+    logging.info('Start time: ' + str(start_time.strftime("%Y-%m-%d %I:%M %p")))
+    return start_time
+
+
+
+def configure_scraper(config_local, num_workers=1):
+    # This function will set up the globals that every process of the run needs, from the config file.
+    # It returns the number of concurrent cities, concurrent communities and open pages, for logging.
+    global semaphore_cities      # Number of cities to scrape concurrently.
+    concurrency = config_local['settings']['number_of_concurrent_cities']
+    concurrency = int(concurrency)
+    semaphore_cities = asyncio.Semaphore(concurrency)
+
+    global semaphore_pages      # Number of browser pages (city and community pages) that can be open at the same time.
+    max_open_pages = config_local.getint('settings', 'max_open_browser_pages', fallback=concurrency)
+    semaphore_pages = asyncio.Semaphore(max_open_pages)
+
+    global community_queue      # Communities of all cities are scraped from one queue, by a fixed number of workers.
+    community_queue = asyncio.Queue()
+    community_workers = config_local.getint('settings', 'number_of_concurrent_communities', fallback=concurrency)
+
+    global browserless_mode      # Fetch community pages over http, and only use the browser as a fallback.
+    browserless_mode = config_local.getboolean('settings', 'scrape_community_pages_without_browser', fallback=False)
+
+    global city_index      # List of cities on the website. Fetched once, and shared by all modes.
+    city_index_ttl = config_local.getint('settings', 'city_list_cache_minutes', fallback=0)
+    locations_url = config_local.get('settings', 'apartment_locations_url', fallback=apartment_locations_url)
+    city_index = CityIndex(this_directory / 'output/cache/city_index.json', city_index_ttl, locations_url)
+
+    # Without proxies, requests are made directly. Used to scrape a local copy of the site (see benchmarks).
+    if not config_local.getboolean('settings', 'use_proxies', fallback=True):
+        disable_proxies()
+
+    global rate_limiter      # The request rate to each host adapts to the errors, and retries back off exponentially. Worker processes split the rate between them.
+    rate_limiter = HostRateLimiter(
+        initial_rate = config_local.getfloat('settings', 'requests_per_second_per_host', fallback=5) / num_workers,
+        min_rate = config_local.getfloat('settings', 'min_requests_per_second_per_host', fallback=0.2) / num_workers,
+        max_rate = config_local.getfloat('settings', 'max_requests_per_second_per_host', fallback=20) / num_workers,
+        retry_base_delay = config_local.getfloat('settings', 'retry_base_delay_seconds', fallback=2),
+        retry_max_delay = config_local.getfloat('settings', 'retry_max_delay_seconds', fallback=60),
+        is_request_error = is_proxy_error    # The browser's network errors lower the rate too.
+    )
+
+    # DEBUG also logs the details of each unit.
+    logging.getLogger().setLevel(config_local.get('settings', 'log_level', fallback='INFO').strip().upper())
+
+    global blocking_profile      # Only the resource types and hosts in the allow-lists are loaded by the browser.
+    allowed_resource_types = parse_list(config_local.get('settings', 'browser_allowed_resource_types', fallback='document, script, xhr, fetch'))
+    allowed_hosts = parse_list(config_local.get('settings', 'browser_allowed_hosts', fallback='avaloncommunities.com'))
+    blocking_profile = BlockingProfile(allowed_resource_types, allowed_hosts)
+
+    register_gauges()
+
+    return concurrency, community_workers, max_open_pages
+
+
+
+def register_gauges():
+    # Gauges are read whenever the metrics are exported. The queues and the context pool are created later, so they are looked up at that time.
+    metrics.set_gauge('community_queue_size', lambda: community_queue.qsize())
+    metrics.set_gauge('image_queue_size', lambda: image_queue.queue.qsize() if image_queue else 0)
+    metrics.set_gauge('open_browser_pages', lambda: context_pool.get_open_pages() if context_pool else 0)
+    metrics.set_gauge('open_browser_contexts', lambda: len(context_pool.contexts) + len(context_pool.retired_contexts) if context_pool else 0)
+    metrics.set_gauge('apartments_scraped', lambda: len(scraped_communities))
+    metrics.set_gauge('units_scraped', lambda: num_scraped_units)
+    metrics.set_gauge('calls', lambda: total_calls_get_website, function='get_website')
+    metrics.set_gauge('calls', lambda: total_calls_get_state, function='get_state')
+    metrics.set_gauge('calls', lambda: total_calls_get_city, function='get_city')
+    metrics.set_gauge('calls', lambda: total_calls_get_city_name, function='get_city_from_name')
+    metrics.set_gauge('calls', lambda: total_calls_get_community, function='get_community')
+    metrics.set_gauge('failed_calls', lambda: failed_calls_get_website, function='get_website')
+    metrics.set_gauge('failed_calls', lambda: failed_calls_get_state, function='get_state')
+    metrics.set_gauge('failed_calls', lambda: failed_calls_get_city, function='get_city')
+    metrics.set_gauge('failed_calls', lambda: failed_calls_get_city_name, function='get_city_from_name')
+    metrics.set_gauge('failed_calls', lambda: failed_calls_get_community, function='get_community')
+
+
+
+def get_progress():
+    # Progress of the current run, from the checkpoint journal. The time left is extrapolated from the share of finished cities (or apartments, in modes without cities).
+    # Worker processes append to the journal of this process, and the coordinator records the work of each lease in it, so the progress covers every mode.
+    progress = {}
+    if checkpoint == None or run_started_at == None:
+        return {'status': 'not started'}
+    checkpoint.read_new_records()
+    for name, records in (('cities', checkpoint.cities), ('apartments', checkpoint.communities)):
+        statuses = [record['status'] for record in records.values()]
+        progress[f'{name}_total'] = len(statuses)
+        progress[f'{name}_finished'] = statuses.count('finished')
+        progress[f'{name}_failed'] = statuses.count('failed')
+    progress['units_scraped'] = sum(record['units'] for record in checkpoint.get_finished_communities())
+
+    elapsed_seconds = (datetime.now() - run_started_at).total_seconds()
+    progress['elapsed_minutes'] = round(elapsed_seconds / 60, 1)
+    progress['apartments_per_minute'] = round(progress['apartments_finished'] / max(elapsed_seconds / 60, 1/60), 2)
+
+    unit = 'cities' if progress['cities_total'] > 0 else 'apartments'
+    done = progress[f'{unit}_finished'] + progress[f'{unit}_failed']
+    progress['estimated_minutes_left'] = None
+    if 0 < done < progress[f'{unit}_total']:
+        progress['estimated_minutes_left'] = round(elapsed_seconds * (progress[f'{unit}_total'] - done) / done / 60, 1)
+    elif done > 0:
+        progress['estimated_minutes_left'] = 0
+    return progress
+
+
+
+async def start_metrics_server(config_local):
+    # Optional endpoint with the live metrics and progress of the run. Disabled if the port is 0.
+    metrics_port = config_local.getint('settings', 'metrics_port', fallback=0)
+    if metrics_port <= 0:
+        return None
+    metrics_server = MetricsServer(metrics, config_local.get('settings', 'metrics_host', fallback='127.0.0.1'), metrics_port, get_progress)
+    await metrics_server.start()
+    return metrics_server
+
+
+
+def open_storage(config_local, worker_number=None):
+    # This function will open the files and databases that the results of the run are written to.
+    global incremental_mode      # Skip the extraction of communities that haven't changed since the last run.
+    incremental_mode = config_local.getboolean('settings', 'skip_unchanged_apartments', fallback=False)
+    global community_hashes
+    community_hashes = CommunityHashStore(this_directory / 'output/cache/community_hashes.json')
+    if incremental_mode:
+        community_hashes.load()
+
+    global listing_export      # All listings of the run are also written to one ndjson file, and to a sqlite snapshot at the end of the run.
+    listing_export = get_listing_export(config_local, worker_number)
+
+    global price_history      # History of the rent of each unit, kept across runs.
+    if config_local.getboolean('settings', 'record_price_history', fallback=True):
+        price_history = PriceHistory(this_directory / 'output/price_history.sqlite')
+        price_history.open()
+
+    global community_index      # The apartments csv file is read once, and then kept up to date in memory. Worker processes leave the writing to the parent process.
+    community_index = CommunityIndex(this_directory / 'output/_avalonbay_apartments.csv', community_csv_headers, defer_writes = worker_number != None)
+    community_index.load()
+
+
+
+def get_listing_export(config_local, worker_number=None):
+    # This function will return the listing export of the process, or None if the export is disabled.
+    # Worker processes write to their own file, which the parent process merges into the file of the run.
+    if not config_local.getboolean('settings', 'export_listings_ndjson', fallback=True):
+        return None
+    use_gzip = config_local.getboolean('settings', 'compress_listings_ndjson', fallback=False)
+    if worker_number != None:
+        return ListingExport(this_directory / f'output/listings_worker_{worker_number}.ndjson', use_gzip, None)
+    snapshot_path = None
+    if config_local.getboolean('settings', 'export_listings_snapshot', fallback=True):
+        snapshot_path = this_directory / 'output/listings.sqlite'
+    return ListingExport(this_directory / 'output/listings.ndjson', use_gzip, snapshot_path)
+
+
+
+def create_session(config_local):
+    # A single http session is shared by all requests of the run, so that connections (and their TLS handshakes) are reused.
+    # aiohttp pools connections separately for each proxy.
+    connector = aiohttp.TCPConnector(
+        limit = config_local.getint('settings', 'http_connection_pool_size', fallback=100),
+        keepalive_timeout = config_local.getint('settings', 'http_keepalive_seconds', fallback=30),
+        ttl_dns_cache = config_local.getint('settings', 'dns_cache_seconds', fallback=300)
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+
+async def start_browser(config_local, session, community_workers):
+    # This function will start the browser, the image workers and the community workers. It returns what stop_browser needs.
+    global image_executor      # Processes that convert images to jpg.
+    image_processes = config_local.getint('settings', 'number_of_image_processes', fallback=2)
+    image_executor = ProcessPoolExecutor(max_workers=image_processes)
+
+    global image_queue      # Images are downloaded by their own pool of workers, separate from the cities concurrency.
+    image_workers = config_local.getint('settings', 'number_of_concurrent_image_downloads', fallback=10)
+    image_queue_size = config_local.getint('settings', 'image_queue_size', fallback=500)
+    image_queue = ImageQueue(download_image, image_workers, image_queue_size)
+    image_queue.start()
+
+    # Start a browser session with playwright.
+    playwright = await async_playwright().start()
+    firefox = playwright.firefox
+    browser = await firefox.launch(headless=True)
+
+    global context_pool      # Browser contexts are reused across pages, and recycled after a number of pages or an error.
+    context_pool_size = config_local.getint('settings', 'browser_context_pool_size', fallback=10)
+    pages_per_context = config_local.getint('settings', 'pages_per_browser_context', fallback=20)
+    context_pool = ContextPool(browser, context_pool_size, pages_per_context, get_proxy, setup_browser_context)
+
+    community_worker_tasks = [asyncio.create_task(community_worker(browser, session)) for i in range(community_workers)]
+    return playwright, browser, community_worker_tasks
+
+
+
+async def wait_for_queues():
+    # Wait for the queued communities to finish scraping.
+    await community_queue.join()
+
+    # Wait for the remaining images to finish downloading.
+    logging.info('\nWaiting for image downloads to finish...')
+    await image_queue.join()
+
+
+
+async def stop_browser(playwright, browser, community_worker_tasks):
+    await wait_for_queues()
+    for task in community_worker_tasks:
+        task.cancel()
+    await asyncio.gather(*community_worker_tasks, return_exceptions=True)
+    await image_queue.stop()
+    image_executor.shutdown()
+
+    # Close playwright properly.    
+    await context_pool.close_all()
+    await browser.close()
+    await playwright.stop()
+
+
+
+def read_input_lines(file_name):
+    # This function will return the non-empty lines of a file in the input folder, without duplicates.
+    with open(Path(this_directory, 'input', file_name), 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    return list(dict.fromkeys(line.strip() for line in lines if len(line.strip()) > 1))
+
+
+
+async def find_cities(session, mode, names):
+    # This function will return the cities to scrape in worker mode: all cities in mode 1, the cities of the states in names in modes 2 and 4, and the cities in names in mode 5.
+    max_attempts = 3
+    for attempt_number in range(1,max_attempts+1):
+        try:
+            await load_city_index(session)
+            break
+        except:
+            if attempt_number == max_attempts:
+                raise
+            await rate_limiter.wait_before_retry(attempt_number, sys.exc_info()[1], city_index.locations_url)
+
+    if mode == '1':
+        return city_index.get_all()
+    cities = []
+    for name in names:
+        if mode == '5':
+            found_cities = city_index.get_city(name)
+            if len(found_cities) == 0:
+                logging.info(f'\n---- Found no city that matches name: {name}\n')
+            cities.extend(found_cities)
+        else:
+            cities.extend(city_index.get_state(name))
+    return cities
+
+
+
+async def run_distributed(config_local, mode, start_time, cities, community_urls):
+    # This function will hand the work of the run to the worker nodes in coordinator mode, and to the worker processes otherwise.
+    if coordinator_mode:
+        await run_coordinator(config_local, cities, community_urls)
+    else:
+        await run_workers(config_local, mode, start_time, cities, community_urls)
+
+
+
+async def run_workers(config_local, mode, start_time, cities, community_urls):
+    # This function will split the cities and communities across the worker processes, and wait for them to finish.
+    # Each worker process has its own event loop and browser. Their results are merged into the globals of this process, so that the report covers the whole run.
+    global error_state
+    if resuming:    # Communities that were queued but not finished before the run died.
+        community_urls = community_urls + checkpoint.get_unfinished_communities()
+    num_workers = max(1, min(num_worker_processes, len(cities) + len(community_urls)))
+    logging.info(f'Splitting {len(cities)} cities and {len(community_urls)} apartments across {num_workers} worker processes.')
+
+    price_run_id = price_history.run_id if price_history else None
+    loop = asyncio.get_running_loop()
+    # Worker processes are spawned rather than forked, so that they don't inherit the event loop of this process.
+    # The workers claim each community in a shared dict before they queue it, so that every community is scraped (and counted) by one worker only.
+    mp_context = multiprocessing.get_context('spawn')
+    with mp_context.Manager() as manager, ProcessPoolExecutor(max_workers=num_workers, mp_context=mp_context) as worker_executor:
+        claimed = manager.dict()
+        futures = []
+        for worker_number in range(num_workers):
+            futures.append(loop.run_in_executor(worker_executor, run_worker, worker_number, num_workers, mode, start_time, resuming, price_run_id, cities[worker_number::num_workers], community_urls[worker_number::num_workers], claimed))
+        results = await asyncio.gather(*futures, return_exceptions=True)
+
+    for worker_number, result in enumerate(results):
+        if isinstance(result, BaseException):
+            error_state = True
+            logging.info(f'Worker process {worker_number} failed.')
+            logging.error('exception: ', exc_info=result)
+            continue
+        merge_worker_result(result)
+        if listing_export:
+            listing_export.merge(get_listing_export(config_local, worker_number))
+
+    remove_duplicate_report_lines()
+
+
+
+def remove_duplicate_report_lines():
+    # Each community is claimed by one worker process (or leased to one node), so the report lines should already be unique. Kept as a safety net.
+    newly_scraped_communities[:] = list(dict.fromkeys(newly_scraped_communities))
+    existing_scraped_communities[:] = [line for line in dict.fromkeys(existing_scraped_communities) if line not in newly_scraped_communities]
+    changed_communities[:] = list(dict.fromkeys(changed_communities))
+    unchanged_communities[:] = [line for line in dict.fromkeys(unchanged_communities) if line not in changed_communities]
+
+
+
+def run_worker(worker_number, num_workers, mode, start_time, resume, price_run_id, cities, community_urls, claimed):
+    # Entry point of a worker process.
+    global claimed_communities
+    claimed_communities = claimed
+    try:
+        return asyncio.run(scrape_worker(worker_number, num_workers, mode, start_time, resume, price_run_id, cities, community_urls))
+    finally:
+        stop_logging()    # Worker processes don't run exit handlers, so the queued log records are written here.
+
+
+
+async def scrape_worker(worker_number, num_workers, mode, start_time, resume, price_run_id, cities, community_urls):
+    # This function will scrape the given cities and communities in a worker process, and return the results for the parent process to merge.
+    global checkpoint
+    global resuming
+
+    setup_worker_logging(f'worker_{worker_number}')
+    config_local = configparser.ConfigParser(interpolation=None)
+    config_local.read(config_file_local)
+    concurrency, community_workers, max_open_pages = configure_scraper(config_local, num_workers)
+    open_storage(config_local, worker_number)
+    session = create_session(config_local)
+
+    # Workers append to the journal of the parent process. When resuming, they read it to skip the finished cities and communities.
+    checkpoint = CheckpointJournal(this_directory / 'output/checkpoint/checkpoint.jsonl')
+    if resume:
+        checkpoint.load()
+        resuming = True
+    checkpoint.start(mode, start_time, resume=True)
+    if listing_export:
+        listing_export.open(append=resume)
+    if price_history:
+        price_history.join_run(price_run_id)
+
+    playwright, browser, community_worker_tasks = await start_browser(config_local, session, community_workers)
+    logging.info(f'Worker process {worker_number}: Scraping {len(cities)} cities and {len(community_urls)} apartments.')
+    for community_url in community_urls:
+        queue_community(community_url)
+    await asyncio.gather(*(get_city(browser, session, city['url'], city['name'], city['state']) for city in cities))
+
+    await stop_browser(playwright, browser, community_worker_tasks)
+    await session.close()
+    if listing_export:
+        listing_export.close()
+    if price_history:
+        price_history.close()
+    checkpoint.close()
+
+    return get_worker_result()
+
+
+
+def setup_worker_logging(log_name):
+    # Each worker process (or node) logs to its own file.
+    start_logging(Path(this_directory, f'output/logs/log_file_{log_name}.log'))
+
+
+
+def get_worker_result():
+    # This function will return the results of a worker process (or of a lease, in a worker node), for merge_worker_result.
+    return {
+        'total_calls': [total_calls_get_website, total_calls_get_state, total_calls_get_city, total_calls_get_city_name, total_calls_get_community],
+        'failed_calls': [failed_calls_get_website, failed_calls_get_state, failed_calls_get_city, failed_calls_get_city_name, failed_calls_get_community],
+        'num_scraped_units': num_scraped_units,
+        'scraped_communities': list(scraped_communities),
+        'existing_scraped_communities': list(existing_scraped_communities),
+        'newly_scraped_communities': list(newly_scraped_communities),
+        'changed_communities': list(changed_communities),
+        'unchanged_communities': list(unchanged_communities),
+        'kept_json_files': list(kept_json_files),
+        'new_csv_rows': list(community_index.new_rows),
+        'community_hashes': community_hashes.get_updated(),
+        'network_usage': blocking_profile.get_stats(),
+        'metrics': metrics.get_state(),
+        'error_state': error_state
+    }
+
+
+
+def reset_worker_result():
+    # This function will clear the results, after a worker node has handed them to the coordinator. The communities that were seen are kept, so that they aren't scraped again.
+    global error_state
+    global num_scraped_units
+    global total_calls_get_website, total_calls_get_state, total_calls_get_city, total_calls_get_city_name, total_calls_get_community
+    global failed_calls_get_website, failed_calls_get_state, failed_calls_get_city, failed_calls_get_city_name, failed_calls_get_community
+
+    total_calls_get_website = total_calls_get_state = total_calls_get_city = total_calls_get_city_name = total_calls_get_community = 0
+    failed_calls_get_website = failed_calls_get_state = failed_calls_get_city = failed_calls_get_city_name = failed_calls_get_community = 0
+    num_scraped_units = 0
+    error_state = False
+    existing_scraped_communities.clear()
+    newly_scraped_communities.clear()
+    changed_communities.clear()
+    unchanged_communities.clear()
+    kept_json_files.clear()
+    discovered_communities.clear()
+    lease_image_files.clear()
+    community_index.new_rows.clear()
+    community_hashes.updated_urls.clear()
+    blocking_profile.bytes_transferred.clear()
+    blocking_profile.requests_transferred.clear()
+    blocking_profile.requests_blocked.clear()
+    metrics.reset()
+
+
+
+def merge_worker_result(result):
+    # This function will add the results of a worker process to the globals of this process.
+    global error_state
+    global num_scraped_units
+    global total_calls_get_website, total_calls_get_state, total_calls_get_city, total_calls_get_city_name, total_calls_get_community
+    global failed_calls_get_website, failed_calls_get_state, failed_calls_get_city, failed_calls_get_city_name, failed_calls_get_community
+
+    total_calls_get_website += result['total_calls'][0]
+    total_calls_get_state += result['total_calls'][1]
+    total_calls_get_city += result['total_calls'][2]
+    total_calls_get_city_name += result['total_calls'][3]
+    total_calls_get_community += result['total_calls'][4]
+    failed_calls_get_website += result['failed_calls'][0]
+    failed_calls_get_state += result['failed_calls'][1]
+    failed_calls_get_city += result['failed_calls'][2]
+    failed_calls_get_city_name += result['failed_calls'][3]
+    failed_calls_get_community += result['failed_calls'][4]
+
+    num_scraped_units += result['num_scraped_units']
+    scraped_communities.update(result['scraped_communities'])
+    existing_scraped_communities.extend(result['existing_scraped_communities'])
+    newly_scraped_communities.extend(result['newly_scraped_communities'])
+    changed_communities.extend(result['changed_communities'])
+    unchanged_communities.extend(result['unchanged_communities'])
+    kept_json_files.update(result['kept_json_files'])
+    for row in result['new_csv_rows']:    # Worker processes leave the writing of new communities to the parent process.
+        community_index.add(row)
+    community_hashes.hashes.update(result['community_hashes'])
+    blocking_profile.add_stats(result['network_usage'])
+    metrics.merge(result['metrics'])
+    if result['error_state']:
+        error_state = True
+
+
+
+async def run_coordinator(config_local, cities, community_urls):
+    # This function will hand out the cities and communities of the run to the worker nodes in leases, and merge the result of each lease as it comes in.
+    if resuming:    # Communities that were queued but not finished before the run died.
+        community_urls = community_urls + checkpoint.get_unfinished_communities()
+    coordinator = Coordinator(
+        config_local.get('settings', 'coordinator_host', fallback='0.0.0.0'),
+        config_local.getint('settings', 'coordinator_port', fallback=8765),
+        config_local.getint('settings', 'coordinator_lease_seconds', fallback=300),
+        merge_node_result,
+        community_index.rows
+    )
+    # The journal of the coordinator holds the work of every lease, so a resumed run skips what the nodes finished.
+    for city in cities:
+        if checkpoint.is_city_finished(city['url']):
+            continue
+        coordinator.add_work({'type': 'city', 'url': city['url'], 'name': city['name'], 'state': city['state']})
+        checkpoint.record_city(city['url'], 'queued')
+    for community_url in community_urls:
+        community_url = community_url.split('#')[0].split('?')[0].strip('/')
+        if checkpoint.is_community_finished(community_url):
+            continue
+        coordinator.add_work({'type': 'community', 'url': community_url})
+        checkpoint.record_community(community_url, 'queued')
+
+    await coordinator.start()
+    logging.info(f'Coordinator is waiting for worker nodes on port {coordinator.port}. Items to scrape: {len(coordinator.work_queue.pending)}')
+    await coordinator.wait_until_done()
+    await asyncio.sleep(10)    # Give the idle nodes time to ask for work, and be told that the run is done.
+    await coordinator.stop()
+    logging.info(f'All work is done. Leases completed: {coordinator.work_queue.num_completed}, leases queued again: {coordinator.work_queue.num_requeued}')
+
+    remove_duplicate_report_lines()
+
+
+
+def merge_node_result(result):
+    # This function will write the json files and images of a lease to the output folder, and merge the rest of the result like that of a worker process.
+    for json_file_name, community_data in result['json_files'].items():
+        with open(Path(this_directory, f'output/{json_file_name}'), 'w', encoding='utf-8') as f:
+            json.dump(community_data, f)
+        if listing_export:
+            listing_export.write_community(community_data)
+        if price_history:
+            price_history.record_community(community_data[0]['additional_data']['original_url'], community_data[0]['listings'], datetime.now())
+    for filename, image_data in result['images'].items():
+        image_path = Path(this_directory, f'output/images/{filename}')
+        if not image_path.exists():    # The image may have been sent by another node already.
+            image_path.write_bytes(base64.b64decode(image_data))
+    # The cities and communities of the lease, and the communities that it found, are recorded in the journal of the run.
+    new_communities = [{'type': 'community', 'url': item['url'], 'status': 'queued'} for item in result['new_work'] if item['type'] == 'community']
+    checkpoint.add_records(result['checkpoint_records'] + new_communities)
+    merge_worker_result(result)
+
+
+
+async def run_node(coordinator_url):
+    # Entry point of a worker node. The node scrapes the work that it leases from the coordinator, until the run is done.
+    # The results are sent to the coordinator, which owns the output files, so the node doesn't keep its own apartments csv, listings or price history.
+    global checkpoint
+    global community_index
+    global community_hashes
+    global node_mode
+
+    setup_worker_logging('node')
+    try:
+        config_local = configparser.ConfigParser(interpolation=None)
+        config_local.read(config_file_local)
+        concurrency, community_workers, max_open_pages = configure_scraper(config_local)
+        session = create_session(config_local)
+        node_mode = True
+        client = CoordinatorClient(session, coordinator_url, f'{socket.gethostname()}-{os.getpid()}')
+
+        checkpoint = CheckpointJournal(this_directory / 'output/checkpoint/checkpoint_node.jsonl')    # Never started, so nothing is written. The coordinator re-queues the work of dead nodes.
+        community_hashes = CommunityHashStore(this_directory / 'output/cache/community_hashes.json')    # Not loaded, because the json files of unchanged communities are on the coordinator.
+        community_index = CommunityIndex(this_directory / 'output/_avalonbay_apartments.csv', community_csv_headers, defer_writes=True)
+        community_index.set_rows(await client.get_community_rows())    # Decides which communities are new.
+
+        playwright, browser, community_worker_tasks = await start_browser(config_local, session, community_workers)
+        logging.info(f'Worker node {client.node} is scraping for the coordinator at {coordinator_url}')
+        lease_size = config_local.getint('settings', 'coordinator_lease_size', fallback=5)
+        while True:
+            lease = await get_lease(client, lease_size)
+            if lease == None:    # The run is done.
+                break
+            if len(lease['items']) == 0:    # Other nodes are still scraping the remaining work, and may find more.
+                await asyncio.sleep(5)
+                continue
+            result = await scrape_lease(client, browser, session, lease)
+            await client.complete(lease['lease_id'], result)
+
+        await stop_browser(playwright, browser, community_worker_tasks)
+        await session.close()
+        logging.info(f'Worker node {client.node} is done.')
+    except:
+        logging.info('Error in worker node.')
+        logging.exception('exception:' )
+
+
+
+async def get_lease(client, lease_size):
+    # This function will ask the coordinator for a lease, retrying if the coordinator can't be reached.
+    max_attempts = 3
+    for attempt_number in range(1,max_attempts+1):
+        try:
+            return await client.lease(lease_size)
+        except:
+            if attempt_number == max_attempts:
+                raise
+            logging.info('Unable to reach the coordinator. Trying again...')
+            await asyncio.sleep(5 * attempt_number)
+
+
+
+async def scrape_lease(client, browser, session, lease):
+    # This function will scrape the cities and communities of a lease, and return the result for the coordinator.
+    # The lease is renewed while its items are scraped, so that the coordinator knows that the node is alive.
+    logging.info(f'\nScraping lease of {len(lease["items"])} items.')
+    renew_task = asyncio.create_task(renew_lease(client, lease))
+    try:
+        cities = [item for item in lease['items'] if item['type'] == 'city']
+        for item in lease['items']:
+            if item['type'] == 'community':
+                community_queue.put_nowait(item['url'])
+        await asyncio.gather(*(get_city(browser, session, city['url'], city['name'], city['state']) for city in cities))
+        await community_queue.join()
+        await image_queue.join()    # The images are sent with the result.
+    finally:
+        renew_task.cancel()
+
+    result = get_worker_result()
+    result['checkpoint_records'] = checkpoint.pop_new_records()    # The coordinator writes them to its journal.
+    result['new_work'] = [{'type': 'community', 'url': community_url} for community_url in discovered_communities]
+    result['json_files'] = {}
+    for json_file_name in kept_json_files:
+        json_file_path = Path(this_directory, f'output/{json_file_name}')
+        if json_file_path.exists() and json_file_path.stat().st_size > 0:    # The file is empty if the community failed while it was being extracted.
+            with open(json_file_path, 'r', encoding='utf-8') as f:
+                result['json_files'][json_file_name] = json.load(f)
+    result['images'] = {}
+    for filename in lease_image_files:
+        image_path = Path(this_directory, f'output/images/{filename}')
+        if image_path.exists():    # Failed downloads are left out.
+            result['images'][filename] = base64.b64encode(image_path.read_bytes()).decode('ascii')
+    reset_worker_result()
+    return result
+
+
+
+async def renew_lease(client, lease):
+    while True:
+        await asyncio.sleep(lease['lease_seconds'] / 3)
+        try:
+            if not await client.renew(lease['lease_id']):
+                logging.info('-- Lease expired before its items were scraped. The coordinator has queued them again.')
+        except Exception:
+            logging.info('-- Unable to renew lease.')
+
+
+async def scrape_states(browser, session, input_states):
+    # This function will scrape the cities of each state in input_states.
+    # All states are started at once. Their cities are scraped concurrently, bounded by semaphore_cities, as in a run of the entire website.
+    input_states = list({input_state.lower(): input_state for input_state in input_states}.values())    # Remove duplicates.
+    await asyncio.gather(*(get_state(browser, session, input_state) for input_state in input_states))
+
+
+
+async def scrape_cities(browser, session, city_names):
+    # This function will scrape each city in city_names. The cities are scraped concurrently, bounded by semaphore_cities.
+    city_names = list({city_name.lower(): city_name for city_name in city_names}.values())    # Remove duplicates.
+    await asyncio.gather(*(get_city_from_name(browser, session, city_name) for city_name in city_names))
+
+
+
+def scrape_communities(browser, session, community_urls):
+    # This function will add each community in community_urls to the community queue, where the community workers scrape them concurrently.
+    # Duplicates are skipped by queue_community. The caller waits for the queue to finish.
+    for community_url in community_urls:
+        queue_community(community_url)
+
+
+
+def remove_old_json_files():
+    # Delete old json files output directory. A resumed run keeps the files of the communities that were already finished.
+    # In incremental mode, files of unchanged communities are kept, and the remaining old files are deleted at the end of the run.
+    # A refresh of single apartments only overwrites their own files.
+    if not resuming and not incremental_mode and not refresh_run:
+        existing_csv_files = glob.glob(f'{this_directory}\output\*.json')
+        #logging.info('\nDeleting existing json files...')
+        for f in existing_csv_files:
+            os.remove(f)
+
+
+
+def finish_run(mode, start_time):
+    # This function will write the outputs that are only complete at the end of a run, and return the report of the run.
+    global error_state
+    scraping_end_time = datetime.now()
+
+    # Check stats at end of scraping.
+    # If any of the functions failed to get data more than 20% of the times, set error_state to True.
+    logging.info('\nScraping stats (failed / total calls):')
+    logging.info(f'get_website: {failed_calls_get_website} / {total_calls_get_website}')
+    logging.info(f'get_state: {failed_calls_get_state} / {total_calls_get_state}')
+    logging.info(f'get_city: {failed_calls_get_city} / {total_calls_get_city}')
+    logging.info(f'get_city_from_name: {failed_calls_get_city_name} / {total_calls_get_city_name}')
+    logging.info(f'get_community: {failed_calls_get_community} / {total_calls_get_community}')
+    if (failed_calls_get_website > (0.2*total_calls_get_website)) or (failed_calls_get_state > (0.2*total_calls_get_state)) or (failed_calls_get_city > (0.2*total_calls_get_city)) or (failed_calls_get_city_name > (0.2*total_calls_get_city_name)) or (failed_calls_get_community > (0.2*total_calls_get_community)):
+        logging.info('\nStats indicate a problem with scraping.')
+        error_state = True
+    
+    if listing_export:
+        listing_export.close()
+        logging.info(f'Listings exported: {listing_export.num_records}')
+
+    if price_history:
+        logging.info(f'Units with a rent change since the last run: {len(price_history.get_price_changes())}')
+
+    if incremental_mode:
+        # Json files from the previous run that weren't kept in this run are deleted, so that the output folder has the same files as a full run.
+        if not refresh_run:
+            remove_stale_json_files()
+        community_hashes.save()
+
+    # Check for empty files in output folder.
+    empty_files = get_empty_files()
+    
+    # Check for communities that are in the apartments csv file, but no longer on the website.
+    missing_communities = get_missing_communities(mode)
+    
+    num_scraped_communities = len(scraped_communities)
+    
+    # Bytes transferred by the browser, and bytes saved by blocking requests.
+    network_usage = blocking_profile.get_report()
+
+    # Generate a detailed report on the scrape.
+    scraping_report = generate_report(start_time, scraping_end_time, num_scraped_communities, num_scraped_units, empty_files, existing_scraped_communities, newly_scraped_communities, missing_communities, changed_communities, unchanged_communities, network_usage)
+
+    logging.info('\nTotal apartments scraped: ' + str(num_scraped_communities))
+    logging.info('Total units scraped: ' + str(num_scraped_units))
+    logging.info(f'Empty files: {len(empty_files)}')
+    logging.info(f'Existing apartments: {len(existing_scraped_communities)}')
+    logging.info(f'New apartments: {len(newly_scraped_communities)}')
+    logging.info(f'Missing apartments: {len(missing_communities)}')
+    logging.info(f'Changed apartments: {len(changed_communities)}')
+    logging.info(f'Unchanged apartments: {len(unchanged_communities)}')
+    logging.info(f'\n{network_usage}')
+  
+    logging.info('\nScraping started: ' + str(start_time.strftime("%Y-%m-%d %I:%M %p")))
+    logging.info('Scraping ended:   ' + str(scraping_end_time.strftime("%Y-%m-%d %I:%M %p")))
+    logging.info('Script ended:     ' + str(datetime.now().strftime('%Y-%m-%d %I:%M %p')))
+
+    # The run is complete, so there is nothing left to resume.
+    checkpoint.finish()
+
+    return scraping_report
+
+
+
+def send_report_email(scraping_report):
+    # This function will email the report of the run, or an error notification if error_state is True.
+    if error_state == True:
+        # Send an email notifying that there was an error.
+        logging.info('\nThere was an error in scraping.')
+        time_now = datetime.now()
+        email_subject = 'Error in AvalonBay Scraper'
+        email_body = f'There was a problem while scraping the website. Please check the log file for details.   \t\r\nTime of event:  {time_now.strftime("%Y-%m-%d %I:%M %p")}'
+        
+        # Write error to reports folder.
+        with open(this_directory / f'output/reports/report_{time_now.strftime("%Y_%m_%d_%H_%M_%S")}.txt', 'w', encoding='utf-8') as f:
+            f.write(email_body)
+
+        if email_enabled:
+            logging.info('Sending error notification via email...')
+            send_email(email_subject, email_body)
+    elif email_enabled:
+        # Send an email that contains scraping report.
+        logging.info('Sending report via email...')
+        email_subject = 'AvalonBay Scraper - Completion Report'
+        send_email(email_subject, scraping_report)
+
+
+
+def reset_run_state():
+    # This function will clear the results of the previous run, so that the daemon can start the next run in the same process.
+    global resuming
+    reset_worker_result()
+    scraped_communities.clear()
+    queued_communities.clear()
+    resuming = False
+    city_index.cities = None    # The next run reads the list of cities from the cache again, or fetches it once the cache has expired.
+    image_queue.queued_filenames.clear()
+
+
+
+def read_refresh_intervals():
+    # This function will return the apartments listed in "apartment_refresh_intervals.txt", with the number of minutes between their refreshes.
+    # Each line is an apartment url and a number of minutes, e.g.: https://www.avaloncommunities.com/california/berkeley-apartments/avalon-berkeley 30
+    if not Path(this_directory, 'input/apartment_refresh_intervals.txt').exists():
+        return []
+    refresh_intervals = []
+    for line in read_input_lines('apartment_refresh_intervals.txt'):
+        if line.startswith('#'):
+            continue
+        try:
+            community_url, minutes = line.split()
+            refresh_intervals.append((community_url.split('#')[0].split('?')[0].strip('/'), float(minutes)))
+        except ValueError:
+            logging.info(f'Invalid line in apartment_refresh_intervals.txt: {line}')
+    return refresh_intervals
+
+
+
+async def run_daemon(config_local, browser, session):
+    # This function will keep running, and start a run of mode 1, 4 or 6 whenever the interval of the mode has passed. The browser and the http session stay open between runs.
+    # The apartments in "apartment_refresh_intervals.txt" are also refreshed on their own intervals, so that apartments whose prices change often can be scraped more often.
+    mode_intervals = {
+        '1': config_local.getfloat('settings', 'daemon_website_interval_minutes', fallback=1440),
+        '4': config_local.getfloat('settings', 'daemon_states_interval_minutes', fallback=0),
+        '6': config_local.getfloat('settings', 'daemon_apartments_interval_minutes', fallback=0)
+    }
+    last_run_times = {}    # mode -> start time of its last run
+    last_refresh_times = {}    # community url -> start time of the last run that scraped it
+    logging.info(f'Daemon mode: Minutes between runs of mode 1: {mode_intervals["1"]}, mode 4: {mode_intervals["4"]}, mode 6: {mode_intervals["6"]} (0 means never).\n')
+
+    try:
+        while True:
+            time_now = datetime.now()
+            due_modes = [mode for mode, minutes in mode_intervals.items() if minutes > 0 and (mode not in last_run_times or time_now - last_run_times[mode] >= timedelta(minutes=minutes))]
+            due_communities = [url for url, minutes in read_refresh_intervals() if url not in last_refresh_times or time_now - last_refresh_times[url] >= timedelta(minutes=minutes)]
+            if len(due_modes) > 0:
+                mode = due_modes[0]
+                community_urls = None
+            elif len(due_communities) > 0:
+                mode = '6'
+                community_urls = due_communities
+            else:
+                await asyncio.sleep(60)
+                continue
+
+            reset_run_state()
+            await run_scheduled(mode, browser, session, community_urls)
+
+            if community_urls == None:
+                last_run_times[mode] = time_now
+                if mode == '1':    # The entire website includes the states and apartments of modes 4 and 6.
+                    last_run_times['4'] = time_now
+                    last_run_times['6'] = time_now
+            for community_url in scraped_communities:
+                last_refresh_times[community_url] = time_now
+    except asyncio.CancelledError:
+        logging.info('\nDaemon stopped.')
+
+
+
+async def run_scheduled(mode, browser, session, community_urls=None):
+    # This function will run mode 1, 4 or 6 for the daemon. If community_urls is given, mode 6 scrapes those apartments instead of the apartments file.
+    # Refreshes of single apartments only send an email if there was an error.
+    # Refreshes keep their own checkpoint journal, so that the journal of the last scheduled run isn't truncated.
+    global error_state
+    global refresh_run
+    global checkpoint
+    scraping_report = None
+    scheduled_checkpoint = checkpoint
+    refresh_run = community_urls != None
+    if refresh_run:
+        checkpoint = CheckpointJournal(this_directory / 'output/checkpoint/checkpoint_refresh.jsonl')
+    try:
+        logging.info(f'\nScheduled run of mode {mode}.')
+        remove_old_json_files()
+        start_time = start_run(mode)
+        if mode == '1':
+            await get_website(browser, session)
+        elif mode == '4':
+            await scrape_states(browser, session, read_input_lines('states_to_scrape.txt'))
+        elif mode == '6':
+            scrape_communities(browser, session, community_urls or read_input_lines('apartments_to_scrape.txt'))
+        await wait_for_queues()
+        scraping_report = finish_run(mode, start_time)
+    except Exception:
+        error_state = True
+        logging.info('Error in scheduled run.')
+        logging.exception('exception:' )
+    finally:
+        refresh_run = False
+        checkpoint = scheduled_checkpoint
+    if error_state or community_urls == None:
+        send_report_email(scraping_report)
+
+
 async def main():
     # Use the global error_state variable to check and update error state if anything goes wrong.
     global error_state
+    scraping_report = None
 
     ######################################################
     # Setup logging.
@@ -736,16 +1888,9 @@ async def main():
     if not Path.exists(this_directory / 'output/logs'):
         Path.mkdir(this_directory / 'output/logs')
 
-    # Write logs to both stdout and file. 
+    # Write logs to both stdout and file (as json lines), from a background thread.
     # Note: Playwright does not use Python's logger. Workaround: Catch playwright's exceptions and log them in the 'except' block.
-    logging.basicConfig(
-        level=logging.INFO,
-        format = '',
-        handlers=[
-            RotatingFileHandler(Path(this_directory, 'output/logs/log_file.log'), encoding='utf-8', maxBytes=1024*1024*20, backupCount=1),
-            logging.StreamHandler(sys.stdout)
-        ]    
-    )
+    start_logging(Path(this_directory, 'output/logs/log_file.log'))
     ######################################################
 
     try:
@@ -764,167 +1909,164 @@ async def main():
         #config_global = configparser.ConfigParser(interpolation=None)    # Setting interpolation to None means "%" won't be treated as a special character.
         #config_global.read(config_file_global)
 
-        global semaphore_cities      # Number of cities to scrape concurrently.
-        concurrency = config_local['settings']['number_of_concurrent_cities']
-        concurrency = int(concurrency)
-        semaphore_cities = asyncio.Semaphore(concurrency)
+        global email_enabled      # The report is emailed at the end of each run, unless disabled (e.g. for benchmark runs).
+        email_enabled = config_local.getboolean('settings', 'send_report_email', fallback=True)
 
-        
-        # Start a browser session with playwright.
-        playwright = await async_playwright().start()
-        firefox = playwright.firefox
-        browser = await firefox.launch(headless=True)
+        global num_worker_processes      # Cities and communities are split across this many processes, each with its own browser.
+        num_worker_processes = config_local.getint('settings', 'number_of_worker_processes', fallback=1)
+
+        # With --coordinator, worker nodes scrape the work of the run. They are started with: execute.py --node http://<coordinator host>:<port>
+        global coordinator_mode
+        coordinator_mode = '--coordinator' in sys.argv
+        # With --daemon, the scraper stays running, and scrapes modes 1, 4 and 6 on the intervals in the config file. The daemon keeps its browser warm, so it scrapes in this process.
+        global daemon_mode
+        daemon_mode = '--daemon' in sys.argv
+        split_work = (coordinator_mode or num_worker_processes > 1) and not daemon_mode
+
+        concurrency, community_workers, max_open_pages = configure_scraper(config_local, num_workers=num_worker_processes)
+        open_storage(config_local)
+        session = create_session(config_local)
+        metrics_server = await start_metrics_server(config_local)
+
+        # In worker mode and coordinator mode, only the worker processes (or nodes) start a browser.
+        browser = None
+        if not split_work:
+            playwright, browser, community_worker_tasks = await start_browser(config_local, session, community_workers)
 
         logging.info('\nWelcome to the AvalonBay scraper.\n')
-        logging.info(f'Concurrency: Scraping {concurrency} cities at a time.\n')
+        logging.info(f'Concurrency: Scraping {concurrency} cities and {community_workers} apartments at a time, with at most {max_open_pages} browser pages open.\n')
+        if coordinator_mode:
+            logging.info('Coordinator mode: The work will be scraped by worker nodes.\n')
+        elif num_worker_processes > 1:
+            logging.info(f'Worker mode: The concurrency above applies to each of {num_worker_processes} worker processes.\n')
+        if browserless_mode:
+            logging.info('Browserless mode: Community pages will be fetched without the browser when possible.\n')
+
+        # The --resume option continues the unfinished run in the checkpoint journal, instead of starting over.
+        args = [arg for arg in sys.argv[1:] if arg not in ('--resume', '--coordinator', '--daemon')]
+        global checkpoint
+        global resuming
+        checkpoint = CheckpointJournal(this_directory / 'output/checkpoint/checkpoint.jsonl')
+        if '--resume' in sys.argv:
+            if checkpoint.load():
+                resuming = True
+                restore_checkpoint()
+            else:
+                logging.info('No unfinished run to resume. Starting a new run.')
+
+        if daemon_mode:
+            await run_daemon(config_local, browser, session)
+            await stop_browser(playwright, browser, community_worker_tasks)
+            await session.close()
+            if metrics_server:
+                await metrics_server.stop()
+            if price_history:
+                price_history.close()
+            return
 
         # Ask user to input mode. The crawler has 5 modes.
         while True:
-            if len(sys.argv) == 1:
+            if resuming:
+                mode = checkpoint.run['mode']
+            elif len(args) == 0:
                 logging.info('Modes:\n\t1:  Scrape entire website.\n\t2:  Enter a state.\n\t3:  Enter apartment url.\n\t4:  Scrape states listed in "states_to_scrape.txt".\n\t5:  Scrape cities listed in "cities_to_scrape.txt".\n\t6:  Scrape apartments listed in "apartments_to_scrape.txt"')
                 mode = input('\nEnter mode:\n').lower()
-            elif len(sys.argv) == 2 :
-                mode = sys.argv[1]
+            elif len(args) == 1 :
+                mode = args[0]
 
             logging.info(f'Selected mode: {mode}' )
 
-            # Delete old json files output directory.
-            existing_csv_files = glob.glob(f'{this_directory}\output\*.json')
-            #logging.info('\nDeleting existing json files...')
-            for f in existing_csv_files:
-                os.remove(f)
+            remove_old_json_files()
 
             if mode == '1':
                 # Scrape all cities.
-                start_time = datetime.now()
-                logging.info('Start time: ' + str(start_time.strftime("%Y-%m-%d %I:%M %p")))
-                await get_website(browser)
+                start_time = start_run(mode)
+                if split_work:
+                    await run_distributed(config_local, mode, start_time, await find_cities(session, mode, []), [])
+                else:
+                    await get_website(browser, session)
                 break
             elif mode == '2':
                 # Scrape all cities from a particular state.
-                input_state = input('Enter state name:\n').strip()
-                start_time = datetime.now()
-                logging.info('Start time: ' + str(start_time.strftime("%Y-%m-%d %I:%M %p")))
-                await get_state(browser, input_state)
+                input_state = checkpoint.get_run_input() if resuming else None
+                if not input_state:
+                    input_state = input('Enter state name:\n').strip()
+                start_time = start_run(mode, input_state)
+                if split_work:
+                    await run_distributed(config_local, mode, start_time, await find_cities(session, mode, [input_state]), [])
+                else:
+                    await get_state(browser, session, input_state)
                 break
             elif mode == '3':
                 # Scrape a particular community from url.
-                community_url = input('\nExample: https://www.avaloncommunities.com/california/berkeley-apartments/avalon-berkeley\n\nEnter apartment url:\n').split('?')[0].strip().strip('/')
+                community_url = checkpoint.get_run_input() if resuming else None
+                if not community_url:
+                    community_url = input('\nExample: https://www.avaloncommunities.com/california/berkeley-apartments/avalon-berkeley\n\nEnter apartment url:\n').split('?')[0].strip().strip('/')
                 if 'https://www.avaloncommunities.com/' not in community_url:
                     logging.info('\n-----------------------------------------------------------------------')
                     logging.info('Invalid url entered.\n')
                     continue
-                start_time = datetime.now()
-                logging.info('Start time: ' + str(start_time.strftime("%Y-%m-%d %I:%M %p")))
                 community_url = community_url.split('#')[0].split('?')[0].strip('/')
-                await get_community_from_url(browser, community_url)
+                start_time = start_run(mode, community_url)
+                if split_work:
+                    await run_distributed(config_local, mode, start_time, [], [community_url])
+                elif community_url not in queued_communities:    # A resumed run has queued it already, if it failed before.
+                    await get_community_from_url(browser, session, community_url)
                 break
             elif mode == '4':
                 # Scrape states listed in states_to_scrape.txt
-                start_time = datetime.now()
-                logging.info('Start time: ' + str(start_time.strftime("%Y-%m-%d %I:%M %p")))
-                with open(Path(this_directory, 'input/states_to_scrape.txt'), 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    for line in lines:
-                        line = line.strip()
-                        if len(line) > 1:
-                            input_state = line
-                            await get_state(browser, input_state)
+                start_time = start_run(mode)
+                input_states = read_input_lines('states_to_scrape.txt')
+                if split_work:
+                    await run_distributed(config_local, mode, start_time, await find_cities(session, mode, input_states), [])
+                else:
+                    await scrape_states(browser, session, input_states)
                 break
             elif mode == '5':
                 # Scrape cities listed in cities_to_scrape.txt
-                start_time = datetime.now()
-                logging.info('Start time: ' + str(start_time.strftime("%Y-%m-%d %I:%M %p")))
-                with open(Path(this_directory, 'input/cities_to_scrape.txt'), 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    for line in lines:
-                        line = line.strip()
-                        if len(line) > 1:
-                            city_name = line
-                            await get_city_from_name(browser, city_name)
+                start_time = start_run(mode)
+                city_names = read_input_lines('cities_to_scrape.txt')
+                if split_work:
+                    await run_distributed(config_local, mode, start_time, await find_cities(session, mode, city_names), [])
+                else:
+                    await scrape_cities(browser, session, city_names)
                 break
             elif mode == '6':
                 # Scrape apartments listed in apartments_to_scrape.txt
-                start_time = datetime.now()
-                logging.info('Start time: ' + str(start_time.strftime("%Y-%m-%d %I:%M %p")))
-                with open(Path(this_directory, 'input/apartments_to_scrape.txt'), 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    for line in lines:
-                        line = line.strip()
-                        if len(line) > 1:
-                            community_url = line
-                            await get_community_from_url(browser, community_url)
+                start_time = start_run(mode)
+                community_urls = read_input_lines('apartments_to_scrape.txt')
+                if split_work:
+                    await run_distributed(config_local, mode, start_time, [], community_urls)
+                else:
+                    scrape_communities(browser, session, community_urls)
                 break
             else:
                 logging.info('\n-----------------------------------------------------------------------')
                 logging.info('Invalid mode entered.\n')
 
-        # Close playwright properly.    
-        await browser.close()
-        await playwright.stop()
-
-        scraping_end_time = datetime.now()
+        if browser:
+            await stop_browser(playwright, browser, community_worker_tasks)
+        await session.close()
 
-        # Check stats at end of scraping.
-        # If any of the functions failed to get data more than 20% of the times, set error_state to True.
-        logging.info('\nScraping stats:')
-        logging.info(f'{total_calls_get_website}, {total_calls_get_state}, {total_calls_get_city}, {total_calls_get_city_name}, {total_calls_get_community}')
-        logging.info(f'{failed_calls_get_website}, {failed_calls_get_state}, {failed_calls_get_city}, {failed_calls_get_city_name}, {failed_calls_get_community}')
-        if (failed_calls_get_website > (0.2*total_calls_get_website)) or (failed_calls_get_state > (0.2*total_calls_get_state)) or (failed_calls_get_city > (0.2*total_calls_get_city)) or (failed_calls_get_city_name > (0.2*total_calls_get_city_name)) or (failed_calls_get_community > (0.2*total_calls_get_community)):
-            logging.info('\nStats indicate a problem with scraping.')
-            error_state = True
-        
-        # Check for empty files in output folder.
-        empty_files = get_empty_files()
-        
-        # Check for communities that are in the apartments csv file, but no longer on the website.
-        missing_communities = get_missing_communities(mode)
-        
-        global num_scraped_units
-        global scraped_communities
-        global existing_scraped_communities
-        global newly_scraped_communities
-        num_scraped_communities = len(scraped_communities)
-        
-        # Generate a detailed report on the scrape.
-        scraping_report = generate_report(start_time, scraping_end_time, num_scraped_communities, num_scraped_units, empty_files, existing_scraped_communities, newly_scraped_communities, missing_communities)
-
-        logging.info('\nTotal apartments scraped: ' + str(num_scraped_communities))
-        logging.info('Total units scraped: ' + str(num_scraped_units))
-        logging.info(f'Empty files: {len(empty_files)}')
-        logging.info(f'Existing apartments: {len(existing_scraped_communities)}')
-        logging.info(f'New apartments: {len(newly_scraped_communities)}')
-        logging.info(f'Missing apartments: {len(missing_communities)}')
-      
-        logging.info('\nScraping started: ' + str(start_time.strftime("%Y-%m-%d %I:%M %p")))
-        logging.info('Scraping ended:   ' + str(scraping_end_time.strftime("%Y-%m-%d %I:%M %p")))
-        logging.info('Script ended:     ' + str(datetime.now().strftime('%Y-%m-%d %I:%M %p')))
+        scraping_report = finish_run(mode, start_time)
+        if metrics_server:
+            await metrics_server.stop()
+        if price_history:
+            price_history.close()
 
     except:
         error_state = True
         logging.info('Error in main function.')
         logging.exception('exception:' )
     finally:    # Regardless of whether there was an exception in main function or not, there are other ways that error_state can be true. So check error_state and act accordingly.
-        if error_state == True:
-            # Send an email notifying that there was an error.
-            logging.info('\nThere was an error in scraping.\nSending error notification via email...')
-            time_now = datetime.now()
-            email_subject = 'Error in AvalonBay Scraper'
-            email_body = f'There was a problem while scraping the website. Please check the log file for details.   \t\r\nTime of event:  {time_now.strftime("%Y-%m-%d %I:%M %p")}'
-            
-            # Write error to reports folder.
-            with open(this_directory / f'output/reports/report_{time_now.strftime("%Y_%m_%d_%H_%M_%S")}.txt', 'w', encoding='utf-8') as f:
-                f.write(email_body)
+        if error_state or not daemon_mode:    # The daemon sends the email of each run itself.
+            send_report_email(scraping_report)
+
 
-            send_email(email_subject, email_body)
-        else:
-            # Send an email that contains scraping report.
-            logging.info('Sending report via email...')
-            email_subject = 'AvalonBay Scraper - Completion Report'
-            send_email(email_subject, scraping_report)
-            
-            
 
 
 if __name__ == '__main__':
-    asyncio.run(main())  # Start the asyncio event loop and run the main coroutine.
\ No newline at end of file
+    if '--node' in sys.argv:    # Worker node: execute.py --node http://<coordinator host>:<port>
+        asyncio.run(run_node(sys.argv[sys.argv.index('--node') + 1]))
+    else:
+        asyncio.run(main())  # Start the asyncio event loop and run the main coroutine.
\ No newline at end of file
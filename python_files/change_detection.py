@@ -0,0 +1,52 @@
+import json
+import hashlib
+from pathlib import Path
+
+
+
+def get_content_hash(embedded_json_units, embedded_json_promos):
+    # Hash of the unit and promotion data of a community. If it hasn't changed since the last run, neither have the community's listings.
+    content = json.dumps([embedded_json_units, embedded_json_promos], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+
+class CommunityHashStore:
+    # Content hash of each community from the previous runs, keyed by community url, saved as a json file.
+
+    def __init__(self, store_path):
+        self.store_path = Path(store_path)
+        self.hashes = {}    # community url -> {'hash': ..., 'json_file_name': ..., 'units': ...}
+        self.updated_urls = set()    # Communities whose hash was set in this run.
+
+
+    def load(self):
+        if self.store_path.exists():
+            with open(self.store_path, 'r', encoding='utf-8') as f:
+                self.hashes = json.load(f)
+
+
+    def is_unchanged(self, community_url, content_hash, json_file_path):
+        # The community can only be skipped if its json file from the previous run is still there.
+        entry = self.hashes.get(community_url)
+        if entry == None or entry['hash'] != content_hash:
+            return False
+        return Path(json_file_path).exists() and Path(json_file_path).stat().st_size > 0
+
+
+    def set(self, community_url, content_hash, json_file_name, units):
+        self.hashes[community_url] = {'hash': content_hash, 'json_file_name': json_file_name, 'units': units}
+        self.updated_urls.add(community_url)
+
+
+    def get_updated(self):
+        # The hashes set in this run. Worker processes send these to the parent process, which saves the store.
+        return {url: self.hashes[url] for url in self.updated_urls}
+
+
+    def save(self):
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.store_path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.hashes, f)
+        temp_path.replace(self.store_path)
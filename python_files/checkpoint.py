@@ -0,0 +1,150 @@
+import json
+from pathlib import Path
+from datetime import datetime
+
+
+
+class CheckpointJournal:
+    # Append-only journal of the cities and communities of a run, and whether they were queued, finished or failed.
+    # If a run dies, the next run can be started with --resume to skip the finished work instead of starting over.
+    # Each line of the file is a json object. The last line written for a city or community is its current status.
+
+    def __init__(self, journal_path):
+        self.journal_path = Path(journal_path)
+        self.file = None
+        self.run = None    # The 'run' record of the journal: mode and start time.
+        self.cities = {}    # city url -> last record
+        self.communities = {}    # community url -> last record
+        self.read_offset = 0    # Bytes of the journal that have been read. Worker processes append to the same journal.
+        self.new_records = []    # City and community records since the last call of pop_new_records. Used by worker nodes, which don't write a journal.
+
+
+    def load(self):
+        # Read the journal of the previous run. Returns False if there is no unfinished run to resume.
+        if not self.journal_path.exists():
+            return False
+        self.read_offset = 0
+        self.read_new_records()
+        return self.run != None and self.run['status'] != 'finished'
+
+
+    def read_new_records(self):
+        # Read the lines that were appended to the journal since it was last read, e.g. by worker processes.
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, 'rb') as f:
+            f.seek(self.read_offset)
+            for line in f:
+                if not line.endswith(b'\n'):    # The line is still being written. It is read again next time.
+                    break
+                self.read_offset += len(line)
+                if line.strip() == b'':
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:    # The last line may be incomplete if the run was killed while writing it.
+                    continue
+                if record['type'] == 'run':
+                    self.run = {**(self.run or {}), **record}
+                elif record['type'] == 'city':
+                    self.cities[record['url']] = record
+                elif record['type'] == 'community':
+                    self.communities[record['url']] = record
+
+
+    def start(self, mode, start_time, resume=False, run_input=None):
+        # A new run truncates the journal. A resumed run keeps appending to it.
+        # run_input is what the user entered for the mode (the state of mode 2, the apartment url of mode 3), so that a resumed run doesn't ask again.
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        if not resume:
+            self.journal_path.write_text('', encoding='utf-8')
+        self.file = open(self.journal_path, 'a', encoding='utf-8')    # Always appended to, so that the lines of worker processes aren't overwritten.
+        if resume:
+            self.file.write('\n')    # In case the last line was left incomplete. Blank lines are skipped when loading.
+        else:
+            self.cities = {}
+            self.communities = {}
+            self.new_records = []
+            self.run = {'type': 'run', 'mode': mode, 'start_time': start_time.isoformat(), 'status': 'started', 'input': run_input}
+            self.write(self.run)
+        self.read_offset = self.journal_path.stat().st_size
+
+
+    def finish(self):
+        self.write({'type': 'run', 'status': 'finished'})
+        self.close()
+
+
+    def close(self):
+        # Worker processes close their handle without finishing the run. The parent process finishes it.
+        self.file.close()
+        self.file = None
+
+
+    def get_start_time(self):
+        return datetime.fromisoformat(self.run['start_time'])
+
+
+    def get_run_input(self):
+        return self.run.get('input')
+
+
+    def get_finished_cities(self):
+        return [record for record in self.cities.values() if record['status'] == 'finished']
+
+
+    def record_city(self, city_url, status):
+        record = {'type': 'city', 'url': city_url, 'status': status}
+        self.cities[city_url] = record
+        self.new_records.append(record)
+        self.write(record)
+
+
+    def record_community(self, community_url, status, **data):
+        record = {'type': 'community', 'url': community_url, 'status': status, **data}
+        self.communities[community_url] = record
+        self.new_records.append(record)
+        self.write(record)
+
+
+    def add_records(self, records):
+        # Record the cities and communities that a worker node scraped. A finished city or community stays finished, even if another node queued it again.
+        for record in records:
+            records_by_url = self.cities if record['type'] == 'city' else self.communities
+            if records_by_url.get(record['url'], {}).get('status') == 'finished' and record['status'] != 'finished':
+                continue
+            data = {key: value for key, value in record.items() if key not in ('type', 'url', 'status')}
+            if record['type'] == 'city':
+                self.record_city(record['url'], record['status'])
+            else:
+                self.record_community(record['url'], record['status'], **data)
+
+
+    def pop_new_records(self):
+        records = self.new_records
+        self.new_records = []
+        return records
+
+
+    def is_city_finished(self, city_url):
+        return self.cities.get(city_url, {}).get('status') == 'finished'
+
+
+    def is_community_finished(self, community_url):
+        return self.communities.get(community_url, {}).get('status') == 'finished'
+
+
+    def get_finished_communities(self):
+        return [record for record in self.communities.values() if record['status'] == 'finished']
+
+
+    def get_unfinished_communities(self):
+        # Communities that were queued or failed, but never finished.
+        return [url for url, record in self.communities.items() if record['status'] != 'finished']
+
+
+    def write(self, record):
+        if self.file == None:
+            return
+        self.file.write(json.dumps(record) + '\n')
+        self.file.flush()
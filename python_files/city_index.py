@@ -0,0 +1,108 @@
+import json
+import time
+import asyncio
+import logging
+from pathlib import Path
+from parsel import Selector
+from python_files.rate_limit import check_response_status
+
+
+
+# Page that lists every city on the website.
+apartment_locations_url = 'https://www2.avaloncommunities.com/apartment-locations'
+
+
+
+def parse_cities(html):
+    # This function will extract name, url and state of each city listed in the apartment-locations page.
+    selector = Selector(text=html)
+    city_a_list = selector.xpath('//div[@class="col-sm"]/a')
+
+    cities = []
+    for element in city_a_list:
+        city_name = element.xpath('text()').get().strip()
+        city_url = element.xpath('@href').get().strip('/#? ')
+        if city_url.startswith('www'):
+            city_url = 'https://' + city_url
+        city_state = city_url.split('/')[3].replace('-', ' ').title().strip()
+        cities.append({'url': city_url, 'name': city_name, 'state': city_state})
+
+    return cities
+
+
+
+class CityIndex:
+    # In-memory lookup of the cities on the website, by state and by lower-cased city name.
+    # The apartment-locations page is fetched at most once per run, and a copy is kept on disk for ttl_minutes so that consecutive runs can skip the fetch.
+
+    def __init__(self, cache_file, ttl_minutes, locations_url=apartment_locations_url):
+        self.cache_file = Path(cache_file)
+        self.ttl_minutes = ttl_minutes
+        self.locations_url = locations_url    # Only differs from apartment_locations_url when scraping a local copy of the site.
+        self.cities = None
+        self.cities_by_state = {}
+        self.cities_by_name = {}
+        self.lock = asyncio.Lock()
+
+
+    async def load(self, session, proxy_url):
+        # Concurrent callers wait on the lock, so the page is only fetched by the first of them.
+        async with self.lock:
+            if self.cities is not None:
+                return
+
+            cities = self.read_cache()
+            if cities is None:
+                async with session.get(self.locations_url, timeout=70, proxy=proxy_url) as response:
+                    check_response_status(response.status, response.headers.get('Retry-After'))
+                    response_html = await response.text()
+                    response_status = response.status
+
+                cities = parse_cities(response_html)
+                if len(cities) == 0:
+                    raise Exception(f'No cities found in apartment-locations page. Status: {response_status}')
+                self.write_cache(cities)
+
+            self.cities = cities
+            self.cities_by_state = {}
+            self.cities_by_name = {}
+            for city in cities:
+                self.cities_by_state.setdefault(city['state'].lower(), []).append(city)
+                self.cities_by_name.setdefault(city['name'].lower(), []).append(city)
+
+
+    def read_cache(self):
+        # Return the cached list of cities, or None if the cache is missing, expired or unreadable.
+        if self.ttl_minutes <= 0 or not self.cache_file.exists():
+            return None
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            age_minutes = (time.time() - cache['fetched_at']) / 60
+            if age_minutes > self.ttl_minutes:
+                return None
+            logging.info(f'Using cached list of cities ({int(age_minutes)} minutes old).')
+            return cache['cities']
+        except Exception:
+            logging.info('Unable to read cached list of cities.')
+            return None
+
+
+    def write_cache(self, cities):
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.cache_file.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({'fetched_at': time.time(), 'cities': cities}, f)
+        temp_file.replace(self.cache_file)
+
+
+    def get_all(self):
+        return list(self.cities)
+
+
+    def get_state(self, state):
+        return list(self.cities_by_state.get(state.strip().lower(), []))
+
+
+    def get_city(self, city_name):
+        return list(self.cities_by_name.get(city_name.strip().lower(), []))
@@ -0,0 +1,56 @@
+import csv
+from pathlib import Path
+
+
+
+class CommunityIndex:
+    # In-memory index of the communities in the apartments csv file, keyed by community url.
+    # The file is read once at startup. New communities are appended to it, so the file stays an append-only record of every community seen.
+
+    def __init__(self, csv_path, csv_headers, defer_writes=False):
+        self.csv_path = Path(csv_path)
+        self.csv_headers = csv_headers
+        self.defer_writes = defer_writes    # Worker processes only collect their new rows. The parent process writes them to the file.
+        self.rows_by_url = {}
+        self.new_rows = []    # Rows added in this run.
+
+
+    def load(self):
+        # Create the csv file if it doesn't already exist.
+        if not self.csv_path.exists():
+            with open(self.csv_path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(self.csv_headers)
+
+        self.rows_by_url = {}
+        with open(self.csv_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)    # Skip header row.
+            for row in reader:
+                if len(row) > 1:
+                    self.rows_by_url.setdefault(row[1], row)    # Url is the second column.
+
+
+    def set_rows(self, rows):
+        # Used by worker nodes, which get the rows from the coordinator instead of reading the file.
+        self.rows_by_url = {}
+        for row in rows:
+            self.rows_by_url.setdefault(row[1], row)
+
+
+    def add(self, row):
+        # Append the community to the csv file. Returns False if the community is already in the index.
+        community_url = row[1]
+        if community_url in self.rows_by_url:
+            return False
+        if not self.defer_writes:
+            with open(self.csv_path, 'a', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(row)
+        self.rows_by_url[community_url] = row
+        self.new_rows.append(row)
+        return True
+
+
+    def rows(self):
+        return list(self.rows_by_url.values())
@@ -0,0 +1,163 @@
+import time
+import logging
+from contextlib import asynccontextmanager
+from python_files.metrics import metrics
+
+
+
+class PooledContext:
+    # A browser context and the bookkeeping needed to decide when to recycle it.
+
+    def __init__(self, context, proxy):
+        self.context = context
+        self.proxy = proxy
+        self.proxy_server = proxy[0]
+        self.pages_served = 0
+        self.open_pages = 0
+        self.retired = False    # Retired contexts get no new pages, and are closed once their open pages are closed.
+        self.last_used = time.monotonic()
+
+
+
+class ContextPool:
+    # Pool of warm browser contexts, one per proxy endpoint.
+    # Pages are checked out with "async with context_pool.page() as (page, proxy):". The context is kept open for later pages, and is recycled after max_pages_per_context pages or after an error.
+    # A page goes to an idle warm context when there is one. A new proxy is only drawn (and a context created for it) while the pool has room, so most pages reuse a warm context.
+
+    def __init__(self, browser, max_contexts, max_pages_per_context, get_proxy, setup_context=None):
+        self.browser = browser
+        self.max_contexts = max_contexts
+        self.max_pages_per_context = max_pages_per_context
+        self.get_proxy = get_proxy    # Called for the proxy of each new context.
+        self.setup_context = setup_context    # Optional coroutine function called with each new context and its proxy server, e.g. to register routes.
+        self.contexts = {}    # proxy server -> PooledContext
+        self.retired_contexts = set()
+        self.num_creating = 0    # Contexts being created. They count towards max_contexts.
+        self.contexts_created = 0
+
+
+    @asynccontextmanager
+    async def page(self, proxy=None):
+        # proxy is preferred if it already has a warm context, e.g. the proxy that a page was just fetched through without the browser.
+        # Yields the page and the proxy of its context, for reporting the outcome of the request.
+        pooled = await self.checkout(proxy)
+        page = None
+        failed = False
+        try:
+            page = await pooled.context.new_page()
+            yield page, pooled.proxy
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            if page:
+                try:
+                    await page.close()
+                except Exception:
+                    failed = True
+            await self.checkin(pooled, failed)
+
+
+    async def checkout(self, proxy=None):
+        # The choice of context doesn't await, so concurrent checkouts see each other's bookkeeping without a lock. Contexts are created and closed without holding up other checkouts.
+        pooled = self.find_warm_context(proxy)
+        if pooled == None:
+            if proxy == None:
+                proxy = self.get_proxy()
+            pooled = self.contexts.get(proxy[0])
+            if pooled == None:
+                pooled = await self.create_context(proxy)
+
+        pooled.open_pages += 1
+        pooled.pages_served += 1
+        pooled.last_used = time.monotonic()
+        if pooled.pages_served >= self.max_pages_per_context:
+            self.retire(pooled)
+        return pooled
+
+
+    def find_warm_context(self, proxy):
+        # Returns None if a context should be created instead.
+        if proxy and proxy[0] in self.contexts:
+            return self.contexts[proxy[0]]
+        idle = [pooled for pooled in self.contexts.values() if pooled.open_pages == 0]
+        if len(idle) > 0:
+            return max(idle, key=lambda p: p.last_used)
+        if len(self.contexts) + self.num_creating < self.max_contexts or len(self.contexts) == 0:
+            return None
+        return min(self.contexts.values(), key=lambda p: p.open_pages)    # The pool is full. Share the least busy context.
+
+
+    async def create_context(self, proxy):
+        if len(self.contexts) + self.num_creating >= self.max_contexts:
+            await self.close_idle_context()
+        self.num_creating += 1
+        try:
+            with metrics.timer('browser_context_create_seconds'):
+                context = await self.browser.new_context(
+                    viewport = {'height': 757, 'width': 1368},
+                    proxy = {
+                        'server': proxy[0],
+                        'username': proxy[1],
+                        'password': proxy[2]
+                    } if proxy[0] else None    # No proxy when proxies are disabled.
+                )
+                if self.setup_context:
+                    await self.setup_context(context, proxy[0])
+        finally:
+            self.num_creating -= 1
+
+        pooled = self.contexts.get(proxy[0])
+        if pooled:    # Another checkout created a context for the same proxy in the meantime.
+            await self.close_context(PooledContext(context, proxy))
+            return pooled
+        pooled = PooledContext(context, proxy)
+        self.contexts[proxy[0]] = pooled
+        self.contexts_created += 1
+        return pooled
+
+
+    async def checkin(self, pooled, failed):
+        pooled.open_pages -= 1
+        if failed:
+            self.retire(pooled)
+        if pooled.retired and pooled.open_pages == 0:
+            self.retired_contexts.discard(pooled)
+            await self.close_context(pooled)
+
+
+    def retire(self, pooled):
+        if pooled.retired:
+            return
+        pooled.retired = True
+        if self.contexts.get(pooled.proxy_server) is pooled:
+            del self.contexts[pooled.proxy_server]
+        self.retired_contexts.add(pooled)
+
+
+    async def close_idle_context(self):
+        # Close the least recently used context that has no open pages. If every context is busy, the pool grows past max_contexts until one frees up.
+        idle = [pooled for pooled in self.contexts.values() if pooled.open_pages == 0]
+        if len(idle) == 0:
+            return
+        pooled = min(idle, key=lambda p: p.last_used)
+        del self.contexts[pooled.proxy_server]
+        await self.close_context(pooled)
+
+
+    async def close_context(self, pooled):
+        try:
+            await pooled.context.close()
+        except Exception:
+            logging.info('Unable to close browser context.')
+
+
+    def get_open_pages(self):
+        return sum(pooled.open_pages for pooled in list(self.contexts.values()) + list(self.retired_contexts))
+
+
+    async def close_all(self):
+        for pooled in list(self.contexts.values()) + list(self.retired_contexts):
+            await self.close_context(pooled)
+        self.contexts = {}
+        self.retired_contexts = set()
@@ -0,0 +1,198 @@
+import time
+import uuid
+import asyncio
+import logging
+from collections import deque
+from aiohttp import web
+
+
+
+class WorkQueue:
+    # Work items (cities and communities, keyed by url) that are handed out in leases.
+    # A lease that isn't completed or renewed within lease_seconds is assumed to belong to a dead worker node, and its items are queued again.
+
+    def __init__(self, lease_seconds):
+        self.lease_seconds = lease_seconds
+        self.pending = deque()
+        self.known_urls = set()    # Url of each item ever added. Used to skip duplicates.
+        self.leases = {}    # lease id -> {'node': ..., 'items': [...], 'expires_at': ...}
+        self.num_completed = 0
+        self.num_requeued = 0
+
+
+    def add(self, item):
+        if item['url'] in self.known_urls:
+            return False
+        self.known_urls.add(item['url'])
+        self.pending.append(item)
+        return True
+
+
+    def lease(self, node, max_items):
+        # Returns (lease id, items). The items are empty if there is nothing to hand out right now.
+        items = []
+        while self.pending and len(items) < max_items:
+            items.append(self.pending.popleft())
+        if len(items) == 0:
+            return None, []
+        lease_id = uuid.uuid4().hex
+        self.leases[lease_id] = {'node': node, 'items': items, 'expires_at': time.monotonic() + self.lease_seconds}
+        return lease_id, items
+
+
+    def renew(self, lease_id):
+        if lease_id not in self.leases:
+            return False
+        self.leases[lease_id]['expires_at'] = time.monotonic() + self.lease_seconds
+        return True
+
+
+    def complete(self, lease_id):
+        # Returns False if the lease already expired. Its items were queued again, so the result is a duplicate.
+        if self.leases.pop(lease_id, None) == None:
+            return False
+        self.num_completed += 1
+        return True
+
+
+    def requeue_expired(self):
+        now = time.monotonic()
+        for lease_id, lease in list(self.leases.items()):
+            if lease['expires_at'] < now:
+                del self.leases[lease_id]
+                self.pending.extendleft(reversed(lease['items']))
+                self.num_requeued += 1
+                logging.info(f'Lease of node {lease["node"]} expired. Queued its {len(lease["items"])} items again.')
+
+
+    def is_done(self):
+        return len(self.pending) == 0 and len(self.leases) == 0
+
+
+
+class Coordinator:
+    # Http server that hands out the work of a run to worker nodes, and collects their results.
+    # Worker nodes call:
+    #   POST /lease     {'node': name, 'max_items': n}  -> {'lease_id': ..., 'items': [...], 'lease_seconds': ...}, or {'done': true} at the end of the run.
+    #   POST /renew     {'lease_id': ...}               -> keeps the lease alive while its items are scraped.
+    #   POST /complete  {'lease_id': ..., 'result': {...}}
+    #   GET  /communities                               -> rows of the apartments csv file.
+    # The result of a lease may contain 'new_work', a list of items found while scraping it (e.g. the communities of a city).
+
+    def __init__(self, host, port, lease_seconds, handle_result, get_community_rows):
+        self.host = host
+        self.port = port
+        self.work_queue = WorkQueue(lease_seconds)
+        self.handle_result = handle_result    # Called with the result of each completed lease.
+        self.get_community_rows = get_community_rows
+        self.done = asyncio.Event()
+        self.runner = None
+        self.requeue_task = None
+
+
+    def add_work(self, item):
+        self.work_queue.add(item)
+
+
+    async def start(self):
+        app = web.Application(client_max_size=1024*1024*100)    # Results include the json files and images of the communities.
+        app.router.add_post('/lease', self.handle_lease)
+        app.router.add_post('/renew', self.handle_renew)
+        app.router.add_post('/complete', self.handle_complete)
+        app.router.add_get('/communities', self.handle_communities)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, self.host, self.port).start()
+        self.requeue_task = asyncio.create_task(self.requeue_expired_leases())
+        self.check_done()
+
+
+    async def stop(self):
+        self.requeue_task.cancel()
+        await self.runner.cleanup()
+
+
+    async def wait_until_done(self):
+        await self.done.wait()
+
+
+    def check_done(self):
+        if self.work_queue.is_done():
+            self.done.set()
+
+
+    async def requeue_expired_leases(self):
+        while True:
+            await asyncio.sleep(min(5, self.work_queue.lease_seconds / 3))
+            self.work_queue.requeue_expired()
+
+
+    async def handle_lease(self, request):
+        data = await request.json()
+        if self.done.is_set():
+            return web.json_response({'done': True})
+        lease_id, items = self.work_queue.lease(data['node'], data.get('max_items', 1))
+        if lease_id:
+            logging.info(f'Leased {len(items)} items to node {data["node"]}. Items left: {len(self.work_queue.pending)}')
+        return web.json_response({'lease_id': lease_id, 'items': items, 'lease_seconds': self.work_queue.lease_seconds})
+
+
+    async def handle_renew(self, request):
+        data = await request.json()
+        return web.json_response({'ok': self.work_queue.renew(data['lease_id'])})
+
+
+    async def handle_complete(self, request):
+        data = await request.json()
+        result = data['result']
+        # New work is added before the lease is completed, so that the run isn't seen as done in between.
+        for item in result.get('new_work', []):
+            self.work_queue.add(item)
+        if self.work_queue.complete(data['lease_id']):
+            self.handle_result(result)
+        else:
+            logging.info(f'Ignoring the result of an expired lease: {data["lease_id"]}')
+        self.check_done()
+        return web.json_response({'ok': True})
+
+
+    async def handle_communities(self, request):
+        return web.json_response({'rows': self.get_community_rows()})
+
+
+
+class CoordinatorClient:
+    # Used by worker nodes to talk to the coordinator.
+
+    def __init__(self, session, coordinator_url, node):
+        self.session = session
+        self.coordinator_url = coordinator_url.rstrip('/')
+        self.node = node
+
+
+    async def post(self, path, data):
+        async with self.session.post(self.coordinator_url + path, json=data, timeout=120) as response:
+            response.raise_for_status()
+            return await response.json()
+
+
+    async def lease(self, max_items):
+        # Returns the lease, or None once the run is done.
+        lease = await self.post('/lease', {'node': self.node, 'max_items': max_items})
+        if lease.get('done'):
+            return None
+        return lease
+
+
+    async def renew(self, lease_id):
+        return (await self.post('/renew', {'lease_id': lease_id}))['ok']
+
+
+    async def complete(self, lease_id, result):
+        await self.post('/complete', {'lease_id': lease_id, 'result': result})
+
+
+    async def get_community_rows(self):
+        async with self.session.get(self.coordinator_url + '/communities', timeout=120) as response:
+            response.raise_for_status()
+            return (await response.json())['rows']
@@ -57,4 +57,11 @@ def format_phone(phone_number):
 
     return phone_number
 
+
+
+def format_price(price):
+    # example price: 2345.0 -> '$2,345'
+    if price is None:
+        return None
     
+    return '${:,}'.format(int(round(float(price))))
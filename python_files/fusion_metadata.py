@@ -0,0 +1,163 @@
+import re
+import json
+import itertools
+import logging
+
+
+
+# Start of the value of each assignment in the script, e.g. 'Fusion.globalContent=' or ';Fusion.contentCache = '.
+assignment_pattern = re.compile(r'(?:^|;)\s*(?:var\s+|window\.)?[\w$.]+\s*=\s*(?=[\[{])', re.MULTILINE)
+
+# Keys whose value is a list of objects. The list of units is found among these by its content, whatever the name of its key.
+object_list_pattern = re.compile(r'"[^"\\]*"\s*:\s*(?=\[\s*\{)')
+
+# Keys of the community object, used by the fallback parser.
+key_patterns = {
+    'promotions': re.compile(r'"promotions"\s*:\s*(?=\[)'),
+    'fees': re.compile(r'"fees"\s*:\s*(?=[\[{])'),
+    'officeHours': re.compile(r'"officeHours"\s*:\s*(?=\[)'),
+    'policies': re.compile(r'"policies"\s*:\s*(?=[\[{])')
+}
+
+decoder = json.JSONDecoder()
+
+
+
+class CommunityMetadata:
+    # The data of a community that is embedded in the fusion-metadata script of its page.
+
+    def __init__(self, units, promotions=None, fees=None, office_hours=None, policies=None, office_hours_source=None):
+        self.units = units    # List of unit objects, e.g. {'unitId': ..., 'name': '101', 'bedroom': 1, 'floorPlan': {...}, ...}
+        self.promotions = promotions or []    # List of {'promotionId': ..., 'promotionTitle': ...}
+        self.fees = fees or []
+        self.office_hours = office_hours or []    # Usually a list of strings, e.g. ['Mon-Fri 9:00am-6:00pm', 'Sat 10:00am-5:00pm']
+        self.policies = policies or {}
+        self.office_hours_source = office_hours_source    # Text of the office hours as it is in the script, escapes included. None if not found there.
+
+
+    def get_promo_titles(self):
+        # promotion id -> promotion title. Promotions without an id or title are left out.
+        return {promo['promotionId']: promo['promotionTitle'] for promo in self.promotions if isinstance(promo, dict) and promo.get('promotionId') and promo.get('promotionTitle')}
+
+
+    def get_office_hours_text(self):
+        # e.g. 'Mon-Fri 9:00am-6:00pm, Sat 10:00am-5:00pm'. Cut out of the script like in earlier versions, so escapes such as \u0026 are kept and the json files don't change.
+        if self.office_hours_source != None:
+            text = self.office_hours_source
+        else:
+            text = json.dumps(self.office_hours, separators=(',', ':'), ensure_ascii=False)
+        return text[1:-1].replace('"', '').replace(',', ', ')
+
+
+
+def is_unit_list(value):
+    return isinstance(value, list) and len(value) > 0 and all(isinstance(unit, dict) and 'unitId' in unit for unit in value)
+
+
+
+def find_community_object(value):
+    # Depth-first search for the object that holds the list of units, under any key. Returns the object and the list of units, or (None, None).
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for item in value.values():
+                if is_unit_list(item):
+                    return value, item
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return None, None
+
+
+
+def decode_assignments(script):
+    # Yields the json value of each assignment in the script, with its start and end. Values that aren't valid json (e.g. javascript expressions) are skipped.
+    # The search continues after the end of each decoded value, so the script is only read once.
+    position = 0
+    while True:
+        match = assignment_pattern.search(script, position)
+        if match == None:
+            return
+        try:
+            value, position = decoder.raw_decode(script, match.end())
+            yield value, match.end(), position
+        except json.JSONDecodeError:
+            position = match.end()
+
+
+
+def parse_with_key_search(script):
+    # Fallback for scripts whose assignments can't be decoded: decode the value of each key on its own.
+    # The units are found first, and the other keys are looked up outside of the list of units (units have their own 'promotions').
+    values = {}
+    units_span = None
+    for match in object_list_pattern.finditer(script):
+        try:
+            units, end = decoder.raw_decode(script, match.end())
+        except json.JSONDecodeError:
+            continue
+        if is_unit_list(units):
+            values['units'] = units
+            units_span = (match.start(), end)
+            break
+    if units_span == None:
+        return None
+
+    for key, pattern in key_patterns.items():
+        for match in pattern.finditer(script):
+            if units_span[0] <= match.start() < units_span[1]:
+                continue
+            try:
+                values[key] = decoder.raw_decode(script, match.end())[0]
+                break
+            except json.JSONDecodeError:
+                continue
+    return values
+
+
+
+def find_office_hours_source(script, office_hours, span):
+    # The text of the office hours in the script. It is looked for in the span of the community first, and then in the rest of the script.
+    # If office_hours is None, the first value of an 'officeHours' key is used.
+    for match in itertools.chain(key_patterns['officeHours'].finditer(script, *span), key_patterns['officeHours'].finditer(script)):
+        try:
+            value, end = decoder.raw_decode(script, match.end())
+        except json.JSONDecodeError:
+            continue
+        if office_hours == None or value == office_hours:
+            return value, script[match.end():end]
+    return office_hours, None
+
+
+
+def parse_fusion_metadata(script):
+    # Returns the CommunityMetadata in the text of the fusion-metadata script, or None if the script contains no units.
+    # The script is decoded once, and the community object is found by its content, so the order of its keys doesn't matter.
+    community = None
+    for value, start, end in decode_assignments(script):
+        community, units = find_community_object(value)
+        if community:
+            break
+
+    if community == None:
+        community = parse_with_key_search(script)
+        if community == None:
+            return None
+        units = community['units']
+        start, end = 0, len(script)
+        logging.debug('-- fusion-metadata could not be decoded as a whole. Used the key search.')
+
+    # The office hours may be stored outside of the community object.
+    office_hours, office_hours_source = find_office_hours_source(script, community.get('officeHours'), (start, end))
+    if office_hours == None:
+        logging.info('-- Office hours not found in fusion-metadata.')
+
+    return CommunityMetadata(
+        units = units,
+        promotions = community.get('promotions'),
+        fees = community.get('fees'),
+        office_hours = office_hours,
+        policies = community.get('policies'),
+        office_hours_source = office_hours_source
+    )
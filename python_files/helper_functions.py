@@ -1,9 +1,11 @@
 import os
 import re
+import time
 import random
 import hashlib
 import unicodedata
 from pathlib import Path
+from python_files.metrics import metrics
 
 
 
@@ -13,6 +15,9 @@ rb_directory = Path(__file__).parent.parent.parent.parent
 # Absolute path to proxy file.
 proxy_path = rb_directory / 'global_config/proxies.txt'
 
+# Used in place of a proxy when proxies are disabled. Requests are made without a proxy.
+direct_connection = [None, None, None, None]
+
 
 
 def get_image_filename(image_url):
@@ -21,21 +26,129 @@ def get_image_filename(image_url):
 
 
 
-def get_proxy():
-    # This function will return a random proxy from the proxies.txt file.
-    with open(proxy_path, 'r') as f:
-        lines = f.readlines()
-        proxy = random.choice(lines)
-        proxy = proxy.strip()
-        ip_and_port = proxy.split('@')[1]
-        server = 'http://' + ip_and_port
-        username = proxy.split('@')[0].split(':')[0]
-        password = proxy.split('@')[0].split(':')[1]
-        url = f'http://{username}:{password}@{ip_and_port}'
+def parse_proxy(line):
+    # 'username:password@ip:port' -> [server, username, password, url]
+    proxy = line.strip()
+    ip_and_port = proxy.split('@')[1]
+    server = 'http://' + ip_and_port
+    username = proxy.split('@')[0].split(':')[0]
+    password = proxy.split('@')[0].split(':')[1]
+    url = f'http://{username}:{password}@{ip_and_port}'
     return [server, username, password, url]
 
 
 
+class ProxyStats:
+    # Health of a single proxy.
+
+    def __init__(self):
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.average_latency = None    # Exponential moving average, in seconds.
+        self.benched_until = 0    # A failing proxy is not picked until this time (time.monotonic()).
+
+
+    def get_weight(self):
+        # Proxies with a higher success rate and lower latency are picked more often.
+        success_rate = (self.successes + 1) / (self.successes + self.failures + 2)
+        latency = self.average_latency if self.average_latency != None else 1
+        return success_rate / (1 + latency)
+
+
+
+class ProxyPool:
+    # Pool of the proxies in proxies.txt. The file is only read again when it is modified.
+    # Proxies are picked at random, weighted by their health. A proxy that fails is benched for a cooldown that doubles with each consecutive failure.
+
+    def __init__(self, proxy_path, bench_seconds=5, max_bench_seconds=600):
+        self.proxy_path = proxy_path
+        self.bench_seconds = bench_seconds
+        self.max_bench_seconds = max_bench_seconds
+        self.file_mtime = None
+        self.proxies = []
+        self.stats = {}    # proxy url -> ProxyStats
+        self.enabled = True    # If False, get_proxy returns direct_connection instead of reading proxies.txt.
+
+
+    def reload_if_changed(self):
+        file_mtime = os.stat(self.proxy_path).st_mtime
+        if file_mtime == self.file_mtime:
+            return
+        with open(self.proxy_path, 'r') as f:
+            self.proxies = [parse_proxy(line) for line in f.readlines() if line.strip()]
+        self.stats = {proxy[3]: self.stats.get(proxy[3], ProxyStats()) for proxy in self.proxies}
+        self.file_mtime = file_mtime
+
+
+    def get_proxy(self):
+        if not self.enabled:
+            return list(direct_connection)
+        self.reload_if_changed()
+        now = time.monotonic()
+        available = [proxy for proxy in self.proxies if self.stats[proxy[3]].benched_until <= now]
+        if len(available) == 0:    # Every proxy is benched. Use the one that comes off the bench first.
+            return list(min(self.proxies, key=lambda proxy: self.stats[proxy[3]].benched_until))
+        weights = [self.stats[proxy[3]].get_weight() for proxy in available]
+        return list(random.choices(available, weights=weights)[0])
+
+
+    def report_success(self, proxy, latency):
+        if proxy == None:
+            return
+        metrics.observe('proxy_request_seconds', latency, proxy=proxy[0])
+        stats = self.stats.get(proxy[3])
+        if stats == None:
+            return
+        stats.successes += 1
+        stats.consecutive_failures = 0
+        stats.benched_until = 0
+        if stats.average_latency == None:
+            stats.average_latency = latency
+        else:
+            stats.average_latency = 0.8 * stats.average_latency + 0.2 * latency
+
+
+    def report_failure(self, proxy):
+        if proxy == None:
+            return
+        metrics.increment('proxy_failures', proxy=proxy[0])
+        stats = self.stats.get(proxy[3])
+        if stats == None:
+            return
+        stats.failures += 1
+        stats.consecutive_failures += 1
+        bench_seconds = min(self.bench_seconds * 2 ** (stats.consecutive_failures - 1), self.max_bench_seconds)
+        stats.benched_until = time.monotonic() + bench_seconds
+
+
+
+proxy_pool = ProxyPool(proxy_path)
+
+
+
+def get_proxy():
+    # This function will return a proxy from the proxies.txt file, picked by the proxy pool.
+    return proxy_pool.get_proxy()
+
+
+
+def disable_proxies():
+    # Make requests without a proxy, e.g. to a local copy of the site.
+    proxy_pool.enabled = False
+
+
+
+def report_proxy_success(proxy, latency):
+    proxy_pool.report_success(proxy, latency)
+
+
+
+def report_proxy_failure(proxy):
+    proxy_pool.report_failure(proxy)
+
+
+
 def slugify(value, allow_unicode=False):
         """
         This function converts string to a valid filename.
@@ -0,0 +1,20 @@
+import os
+from io import BytesIO
+from PIL import Image
+
+
+
+def transcode_image(image_bytes, file_path):
+    # This function will convert the downloaded image to jpg and save it to file_path.
+    # It runs in a worker process, so that decoding large images doesn't block the asyncio event loop.
+    # The image is first written to a temporary file and then renamed, so an interrupted run never leaves a truncated jpg behind.
+    file_path = str(file_path)
+    temp_path = f'{file_path}.{os.getpid()}.tmp'
+    try:
+        im = Image.open(BytesIO(image_bytes))
+        rgb_im = im.convert('RGB')    # Convert image to jpg format.
+        rgb_im.save(temp_path, format='JPEG')
+        os.replace(temp_path, file_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
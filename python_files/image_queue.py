@@ -0,0 +1,58 @@
+import asyncio
+import logging
+from python_files.helper_functions import get_image_filename
+
+
+
+class ImageQueue:
+    # A bounded queue of images to download, drained by a fixed number of worker tasks.
+    # Unit extraction only has to put the image on the queue, instead of waiting for the download to finish.
+
+    def __init__(self, download_function, num_workers, max_queue_size):
+        self.download_function = download_function    # Coroutine function called as download_function(session, url, proxy).
+        self.num_workers = num_workers
+        self.queue = asyncio.Queue(maxsize=max_queue_size)
+        self.queued_filenames = set()    # Filenames of images that are queued or being downloaded. Used to skip duplicates.
+        self.workers = []
+
+
+    def start(self):
+        for i in range(self.num_workers):
+            self.workers.append(asyncio.create_task(self.worker()))
+
+
+    async def put(self, session, url, proxy):
+        # Waits if the queue is full, so that extraction can't run too far ahead of the downloads.
+        if url == None:
+            logging.debug('Missing image.')
+            return
+
+        filename = get_image_filename(url)
+        if filename in self.queued_filenames:    # Same image is already on its way.
+            return
+        self.queued_filenames.add(filename)
+        await self.queue.put((session, url, proxy, filename))
+
+
+    async def worker(self):
+        while True:
+            session, url, proxy, filename = await self.queue.get()
+            try:
+                await self.download_function(session, url, proxy)
+            except Exception:
+                logging.exception('exception: ')
+            finally:
+                self.queued_filenames.discard(filename)
+                self.queue.task_done()
+
+
+    async def join(self):
+        # Wait until every queued image is downloaded. The workers keep running, for the next run of the daemon.
+        await self.queue.join()
+
+
+    async def stop(self):
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
@@ -0,0 +1,138 @@
+import os
+import gzip
+import json
+import sqlite3
+from pathlib import Path
+from datetime import datetime
+
+
+
+# Columns of a flat listing record. Each record is keyed by community_url and unit_id.
+listing_columns = [
+    'community_url', 'unit_id', 'community_name', 'phone', 'office_hours',
+    'street_number', 'street_name', 'city', 'state', 'zip_code',
+    'available', 'bathrooms', 'bedrooms', 'floor_plan_name', 'rent', 'furnished_rent', 'sqft',
+    'unit_url', 'image_url', 'image_filename', 'virtual_tour', 'specials', 'unit_details', 'scraped_at'
+]
+
+
+
+def get_listing_records(community_data, scraped_at):
+    # This function will flatten the community_data object (as written to the community json files) into one record per listing.
+    community = community_data[0]
+    address = community['apartment_address_data']
+    contact = community['contact_information']
+    records = []
+    for listing in community['listings']:
+        records.append({
+            'community_url': community['additional_data']['original_url'],
+            'unit_id': listing['unitId'],
+            'community_name': contact['name'].replace('_', ' '),
+            'phone': contact['phone'],
+            'office_hours': contact['Office Hours'],
+            'street_number': address['street_number'],
+            'street_name': address['street_name'],
+            'city': address['city'],
+            'state': address['state'],
+            'zip_code': address['zip_code'],
+            'available': listing['available'],
+            'bathrooms': listing['bathrooms'],
+            'bedrooms': listing['bedrooms'],
+            'floor_plan_name': listing['floor_plan_name'],
+            'rent': listing['rent'],
+            'furnished_rent': listing['furnishedRent'],
+            'sqft': listing['sqft'],
+            'unit_url': listing['unit_url'],
+            'image_url': listing['image_url'],
+            'image_filename': listing['image_filename'],
+            'virtual_tour': listing['virtual_tour'],
+            'specials': listing['specials'],
+            'unit_details': listing['unit_details'],
+            'scraped_at': scraped_at
+        })
+    return records
+
+
+
+class ListingExport:
+    # Streams every listing of the run as a flat record to a single ndjson file (optionally gzipped).
+    # At the end of the run, the records are also written to a compact sqlite snapshot, so that downstream jobs load one file instead of thousands.
+
+    def __init__(self, ndjson_path, use_gzip, snapshot_path):
+        self.ndjson_path = Path(str(ndjson_path) + '.gz') if use_gzip else Path(ndjson_path)
+        self.use_gzip = use_gzip
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.file = None
+        self.num_records = 0
+
+
+    def open(self, append=False):
+        # A resumed run, or a refresh of single apartments, appends to the file of the last run. Duplicate records are resolved in the snapshot.
+        mode = 'at' if append else 'wt'
+        if self.use_gzip:
+            self.file = gzip.open(self.ndjson_path, mode, encoding='utf-8')
+        else:
+            self.file = open(self.ndjson_path, mode, encoding='utf-8')
+
+
+    def write_community(self, community_data):
+        scraped_at = datetime.now().isoformat(timespec='seconds')
+        for record in get_listing_records(community_data, scraped_at):
+            self.file.write(json.dumps(record) + '\n')
+            self.num_records += 1
+        self.file.flush()
+
+
+    def merge(self, other_export):
+        # Append the records of another export (the export of a worker process) to this one, and delete its file.
+        if not other_export.ndjson_path.exists():
+            return
+        for record in other_export.read_records():
+            self.file.write(json.dumps(record) + '\n')
+            self.num_records += 1
+        self.file.flush()
+        os.remove(other_export.ndjson_path)
+
+
+    def read_records(self):
+        opener = gzip.open if self.use_gzip else open
+        with opener(self.ndjson_path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+    def close(self):
+        self.file.close()
+        self.file = None
+        if self.snapshot_path:
+            self.write_snapshot()
+
+
+    def get_latest_scrape_times(self):
+        # community url -> time of its last scrape in the file. A resumed run or a refresh of single apartments appends to the file of the last run.
+        latest = {}
+        for record in self.read_records():
+            if record['scraped_at'] >= latest.get(record['community_url'], ''):
+                latest[record['community_url']] = record['scraped_at']
+        return latest
+
+
+    def write_snapshot(self):
+        # The snapshot is built in a temporary file and then renamed, so readers never see a half written database.
+        # Only the last scrape of each apartment is kept, so units that were let since an earlier scrape in the file are left out.
+        latest = self.get_latest_scrape_times()
+        temp_path = self.snapshot_path.with_suffix('.tmp')
+        if temp_path.exists():
+            os.remove(temp_path)
+        connection = sqlite3.connect(temp_path)
+        columns = ', '.join(listing_columns)
+        placeholders = ', '.join('?' for c in listing_columns)
+        connection.execute(f'CREATE TABLE listings ({columns}, PRIMARY KEY (community_url, unit_id)) WITHOUT ROWID')
+        connection.executemany(
+            f'INSERT OR REPLACE INTO listings ({columns}) VALUES ({placeholders})',
+            ([record.get(c) for c in listing_columns] for record in self.read_records() if record['scraped_at'] == latest[record['community_url']])
+        )
+        connection.commit()
+        connection.close()
+        os.replace(temp_path, self.snapshot_path)
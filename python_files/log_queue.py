@@ -0,0 +1,65 @@
+import sys
+import json
+import queue
+import atexit
+import logging
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+
+listener = None    # QueueListener of this process. Writes the log records on its own thread.
+
+
+
+class JsonLinesFormatter(logging.Formatter):
+    # One json object per line, e.g. {"time": "2024-05-01T10:00:00.123", "level": "INFO", "process": "MainProcess", "message": "..."}
+
+    def format(self, record):
+        return json.dumps({
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'process': record.processName,
+            'message': record.getMessage().strip()    # The blank lines around console messages are not kept.
+        }, ensure_ascii=False)
+
+
+
+def is_not_blank(record):
+    # Messages like '\n' only space out the console output.
+    return record.getMessage().strip() != ''
+
+
+
+def start_logging(log_file):
+    # The handlers run on the listener's thread, so the event loop only puts records on a queue, and never waits for file writes or rotations.
+    # The log file is written as json lines. The console gets the plain messages.
+    global listener
+    stop_logging()
+
+    file_handler = RotatingFileHandler(log_file, encoding='utf-8', maxBytes=1024*1024*20, backupCount=1)
+    file_handler.setFormatter(JsonLinesFormatter())
+    file_handler.addFilter(is_not_blank)
+    console_handler = logging.StreamHandler(sys.stdout)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))    # The message is formatted (with the traceback, if any) before it is queued.
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
+    listener.start()
+
+
+
+def stop_logging():
+    # Writes the records that are still queued. Called at exit, and by worker processes before they return their results.
+    global listener
+    if listener:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        listener = None
+
+
+
+atexit.register(stop_logging)
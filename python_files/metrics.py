@@ -0,0 +1,199 @@
+import json
+import logging
+from time import monotonic
+from contextlib import contextmanager
+
+
+
+# Upper bounds (in seconds) of the latency histogram buckets.
+default_buckets = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+
+def get_labels_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+
+def format_labels(labels_key, extra_labels=()):
+    labels = list(labels_key) + list(extra_labels)
+    if len(labels) == 0:
+        return ''
+    return '{' + ','.join(f'{name}="{value}"' for name, value in labels) + '}'
+
+
+
+class Histogram:
+
+    def __init__(self, buckets=default_buckets):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)    # Not cumulative. Summed up when exported.
+        self.count = 0
+        self.sum = 0.0
+
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, upper_bound in enumerate(self.buckets):
+            if value <= upper_bound:
+                self.bucket_counts[i] += 1
+                break
+
+
+
+class MetricsRegistry:
+    # Counters, latency histograms and gauges of the run. Metrics can have labels, e.g. metrics.increment('proxy_bytes', 512, proxy='http://...').
+    # Gauges are functions that are called when the metrics are exported, e.g. to read the size of a queue.
+
+    def __init__(self, prefix='avalonbay_'):
+        self.prefix = prefix
+        self.counters = {}    # name -> {labels key -> value}
+        self.histograms = {}    # name -> {labels key -> Histogram}
+        self.gauges = {}    # name -> {labels key -> function}
+
+
+    def increment(self, name, value=1, **labels):
+        values = self.counters.setdefault(name, {})
+        key = get_labels_key(labels)
+        values[key] = values.get(key, 0) + value
+
+
+    def observe(self, name, seconds, **labels):
+        histograms = self.histograms.setdefault(name, {})
+        key = get_labels_key(labels)
+        if key not in histograms:
+            histograms[key] = Histogram()
+        histograms[key].observe(seconds)
+
+
+    @contextmanager
+    def timer(self, name, **labels):
+        # Usage: "with metrics.timer('page_goto_seconds'):". The time is recorded even if the block raises.
+        start = monotonic()
+        try:
+            yield
+        finally:
+            self.observe(name, monotonic() - start, **labels)
+
+
+    def set_gauge(self, name, get_value, **labels):
+        self.gauges.setdefault(name, {})[get_labels_key(labels)] = get_value
+
+
+    def get_gauge_values(self):
+        values = {}
+        for name, functions in self.gauges.items():
+            for key, get_value in functions.items():
+                try:
+                    values.setdefault(name, {})[key] = get_value()
+                except Exception:
+                    logging.info(f'Unable to read gauge: {name}')
+        return values
+
+
+    def to_prometheus(self):
+        # Prometheus text exposition format.
+        lines = []
+        for name, values in sorted(self.counters.items()):
+            lines.append(f'# TYPE {self.prefix}{name} counter')
+            for key, value in values.items():
+                lines.append(f'{self.prefix}{name}{format_labels(key)} {value}')
+        for name, values in sorted(self.get_gauge_values().items()):
+            lines.append(f'# TYPE {self.prefix}{name} gauge')
+            for key, value in values.items():
+                lines.append(f'{self.prefix}{name}{format_labels(key)} {value}')
+        for name, histograms in sorted(self.histograms.items()):
+            lines.append(f'# TYPE {self.prefix}{name} histogram')
+            for key, histogram in histograms.items():
+                cumulative_count = 0
+                for upper_bound, bucket_count in zip(histogram.buckets, histogram.bucket_counts):
+                    cumulative_count += bucket_count
+                    lines.append(f'{self.prefix}{name}_bucket{format_labels(key, [("le", upper_bound)])} {cumulative_count}')
+                lines.append(f'{self.prefix}{name}_bucket{format_labels(key, [("le", "+Inf")])} {histogram.count}')
+                lines.append(f'{self.prefix}{name}_sum{format_labels(key)} {histogram.sum}')
+                lines.append(f'{self.prefix}{name}_count{format_labels(key)} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+    def get_state(self):
+        # The counters and histograms as a json-serializable dict. Worker processes send this to the parent process, which merges it.
+        return {
+            'counters': {name: [[dict(key), value] for key, value in values.items()] for name, values in self.counters.items()},
+            'histograms': {
+                name: [[dict(key), {'buckets': list(h.buckets), 'bucket_counts': h.bucket_counts, 'count': h.count, 'sum': h.sum}] for key, h in histograms.items()]
+                for name, histograms in self.histograms.items()
+            }
+        }
+
+
+    def merge(self, state):
+        for name, values in state['counters'].items():
+            for labels, value in values:
+                self.increment(name, value, **labels)
+        for name, histograms in state['histograms'].items():
+            for labels, other in histograms:
+                key = get_labels_key(labels)
+                histogram = self.histograms.setdefault(name, {}).setdefault(key, Histogram(tuple(other['buckets'])))
+                histogram.bucket_counts = [a + b for a, b in zip(histogram.bucket_counts, other['bucket_counts'])]
+                histogram.count += other['count']
+                histogram.sum += other['sum']
+
+
+    def reset(self):
+        # Gauges stay registered.
+        self.counters = {}
+        self.histograms = {}
+
+
+    def write_json(self, file_path, progress=None):
+        gauges = {name: [[dict(key), value] for key, value in values.items()] for name, values in self.get_gauge_values().items()}
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({**self.get_state(), 'gauges': gauges, 'progress': progress}, f, indent=2)
+
+
+
+class MetricsServer:
+    # Optional local http endpoint, for watching a run while it is going:
+    #   GET /metrics   -> metrics in Prometheus text format.
+    #   GET /progress  -> progress and estimated time left, as text.
+
+    def __init__(self, registry, host, port, get_progress):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.get_progress = get_progress    # Function that returns the progress of the run as a dict.
+        self.runner = None
+        self.web = None
+
+
+    async def start(self):
+        from aiohttp import web    # Imported here, so that the registry can be used by modules that are imported before the dependency checks in execute.py.
+        app = web.Application()
+        app.router.add_get('/metrics', self.handle_metrics)
+        app.router.add_get('/progress', self.handle_progress)
+        app.router.add_get('/', self.handle_progress)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, self.host, self.port).start()
+        self.web = web
+        logging.info(f'Metrics: http://{self.host}:{self.port}/metrics   Progress: http://{self.host}:{self.port}/progress\n')
+
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+    async def handle_metrics(self, request):
+        return self.web.Response(text=self.registry.to_prometheus(), content_type='text/plain', charset='utf-8')
+
+
+    async def handle_progress(self, request):
+        progress = self.get_progress()
+        text = ''.join(f'{name}: {value}\n' for name, value in progress.items())
+        return self.web.Response(text=text, content_type='text/plain', charset='utf-8')
+
+
+
+# Shared by all modules of the scraper.
+metrics = MetricsRegistry()
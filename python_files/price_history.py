@@ -0,0 +1,134 @@
+import sqlite3
+from pathlib import Path
+
+
+
+def parse_price(price):
+    # example price: '$2,345' -> 2345.0
+    if price == None:
+        return None
+    digits = ''.join(char for char in price if char.isdecimal() or char == '.')
+    if digits == '':
+        return None
+    return float(digits)
+
+
+
+class PriceHistory:
+    # Local sqlite store of the rent, availability and specials of each unit over time.
+    # An observation is only stored when one of these values changed since the unit's last observation, so the store grows with real changes only.
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.connection = None
+        self.run_id = None
+
+
+    def open(self):
+        self.connection = sqlite3.connect(self.db_path, timeout=60)    # Worker processes write to the same database, so wait for their locks.
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                started_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS observations (
+                observation_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                community_url TEXT NOT NULL,
+                unit_id TEXT NOT NULL,
+                scraped_at TEXT NOT NULL,
+                run_id INTEGER,
+                listed INTEGER,
+                rent TEXT,
+                rent_amount REAL,
+                furnished_rent TEXT,
+                available TEXT,
+                specials TEXT
+            );
+            CREATE INDEX IF NOT EXISTS observations_unit ON observations (community_url, unit_id, scraped_at);
+            CREATE INDEX IF NOT EXISTS observations_run ON observations (run_id);
+        ''')
+
+
+    def close(self):
+        self.connection.close()
+        self.connection = None
+
+
+    def start_run(self, started_at):
+        cursor = self.connection.execute('INSERT INTO runs (started_at) VALUES (?)', (started_at.isoformat(timespec='seconds'),))
+        self.connection.commit()
+        self.run_id = cursor.lastrowid
+
+
+    def join_run(self, run_id):
+        # Worker processes record their observations under the run started by the parent process.
+        self.run_id = run_id
+
+
+    def get_latest_observations(self, community_url):
+        # unit id -> last observation of the unit in the community.
+        rows = self.connection.execute('''
+            SELECT o.unit_id, o.listed, o.rent, o.furnished_rent, o.available, o.specials
+            FROM observations o
+            WHERE o.community_url = ? AND o.observation_id = (
+                SELECT MAX(observation_id) FROM observations WHERE community_url = o.community_url AND unit_id = o.unit_id
+            )
+        ''', (community_url,)).fetchall()
+        return {row[0]: row[1:] for row in rows}
+
+
+    def record_community(self, community_url, listings, scraped_at):
+        # Store the listings of a community. Units that are no longer listed get an observation with listed = 0.
+        scraped_at = scraped_at.isoformat(timespec='seconds')
+        latest = self.get_latest_observations(community_url)
+        new_rows = []
+        listed_units = set()
+        for listing in listings:
+            unit_id = listing['unitId']
+            listed_units.add(unit_id)
+            values = (1, listing['rent'], listing['furnishedRent'], listing['available'], listing['specials'])
+            if latest.get(unit_id) != values:
+                new_rows.append((community_url, unit_id, scraped_at, self.run_id, *values, parse_price(listing['rent'])))
+        for unit_id, values in latest.items():
+            if unit_id not in listed_units and values[0] == 1:
+                new_rows.append((community_url, unit_id, scraped_at, self.run_id, 0, None, None, None, None, None))
+
+        self.connection.executemany('''
+            INSERT INTO observations (community_url, unit_id, scraped_at, run_id, listed, rent, furnished_rent, available, specials, rent_amount)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', new_rows)
+        self.connection.commit()
+        return len(new_rows)
+
+
+    def get_latest_prices(self, community_url=None):
+        # Latest rent of each unit that is still listed. Optionally only for one community.
+        query = '''
+            SELECT o.community_url, o.unit_id, o.rent, o.rent_amount, o.furnished_rent, o.available, o.specials, o.scraped_at
+            FROM observations o
+            WHERE o.observation_id = (
+                SELECT MAX(observation_id) FROM observations WHERE community_url = o.community_url AND unit_id = o.unit_id
+            ) AND o.listed = 1
+        '''
+        parameters = ()
+        if community_url:
+            query += ' AND o.community_url = ?'
+            parameters = (community_url,)
+        columns = ['community_url', 'unit_id', 'rent', 'rent_amount', 'furnished_rent', 'available', 'specials', 'scraped_at']
+        return [dict(zip(columns, row)) for row in self.connection.execute(query, parameters)]
+
+
+    def get_price_changes(self, run_id=None):
+        # Units whose rent changed in the given run (default: the current run), with their previous rent.
+        run_id = run_id or self.run_id
+        query = '''
+            SELECT o.community_url, o.unit_id, p.rent, o.rent, o.rent_amount - p.rent_amount, o.scraped_at
+            FROM observations o
+            JOIN observations p ON p.observation_id = (
+                SELECT MAX(observation_id) FROM observations
+                WHERE community_url = o.community_url AND unit_id = o.unit_id AND observation_id < o.observation_id AND listed = 1
+            )
+            WHERE o.run_id = ? AND o.listed = 1 AND o.rent_amount IS NOT p.rent_amount
+        '''
+        columns = ['community_url', 'unit_id', 'previous_rent', 'rent', 'rent_change', 'scraped_at']
+        return [dict(zip(columns, row)) for row in self.connection.execute(query, (run_id,))]
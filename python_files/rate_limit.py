@@ -0,0 +1,144 @@
+import random
+import asyncio
+import logging
+import aiohttp
+from time import monotonic
+from urllib import parse
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from python_files.metrics import metrics
+
+
+
+# Statuses that mean the site wants us to slow down. Other 5xx statuses are retried as well.
+throttle_statuses = (429, 503)
+
+
+
+class RetryableHTTPError(Exception):
+    # Raised for responses that should be retried after a delay (429, 5xx).
+
+    def __init__(self, status, retry_after=None):
+        super().__init__(f'HTTP status {status}')
+        self.status = status
+        self.retry_after = retry_after    # Seconds, from the Retry-After header. None if not given.
+
+
+
+def parse_retry_after(value):
+    # The Retry-After header is either a number of seconds or an http date.
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_date = parsedate_to_datetime(value)
+        return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+
+def check_response_status(status, retry_after_header=None):
+    # Raise RetryableHTTPError if the response should be retried.
+    if status in throttle_statuses or status >= 500:
+        raise RetryableHTTPError(status, parse_retry_after(retry_after_header))
+
+
+
+def is_request_error(exception):
+    # Errors that may mean the host is overloaded: error statuses, transport errors and timeouts. Errors of the site or the parser (e.g. a missing element) are not.
+    return isinstance(exception, (RetryableHTTPError, aiohttp.ClientError, asyncio.TimeoutError))
+
+
+
+def get_host(url):
+    return (parse.urlparse(url).hostname or '').lower()
+
+
+
+class HostBucket:
+    # Token bucket of a single host. The rate is adjusted by HostRateLimiter.
+
+    def __init__(self, rate):
+        self.rate = rate    # Requests per second.
+        self.tokens = 1.0
+        self.last_refill = monotonic()
+        self.paused_until = 0.0
+
+
+    def refill(self, now):
+        capacity = max(1.0, self.rate)    # Allows a burst of up to one second of requests.
+        self.tokens = min(capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+
+
+class HostRateLimiter:
+    # Limits the rate of requests to each host with a token bucket, and adapts the rate to the responses:
+    # the rate grows by a small step after each success, and is cut after errors (sharply after a 429/503), so that it stays near the limit of the site.
+    # It also applies exponential backoff with jitter between retries, respecting Retry-After.
+
+    def __init__(self, initial_rate, min_rate, max_rate, retry_base_delay, retry_max_delay, is_request_error=is_request_error):
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.buckets = {}    # host -> HostBucket
+        self.is_request_error = is_request_error    # Decides which errors lower the rate. Other errors only get the backoff delay.
+
+
+    def get_bucket(self, url):
+        host = get_host(url)
+        if host not in self.buckets:
+            self.buckets[host] = HostBucket(self.initial_rate)
+        return self.buckets[host]
+
+
+    async def acquire(self, url):
+        # Wait until a request to the url's host is allowed.
+        bucket = self.get_bucket(url)
+        while True:
+            now = monotonic()
+            if now < bucket.paused_until:
+                await asyncio.sleep(bucket.paused_until - now)
+                continue
+            bucket.refill(now)
+            if bucket.tokens >= 1:
+                bucket.tokens -= 1
+                return
+            await asyncio.sleep((1 - bucket.tokens) / bucket.rate)
+
+
+    def report_success(self, url):
+        bucket = self.get_bucket(url)
+        bucket.rate = min(self.max_rate, bucket.rate + 0.05)
+
+
+    def report_error(self, url, exception):
+        bucket = self.get_bucket(url)
+        metrics.increment('request_errors', host=get_host(url), error=type(exception).__name__)
+        if isinstance(exception, RetryableHTTPError) and exception.status in throttle_statuses:
+            bucket.rate = max(self.min_rate, bucket.rate / 2)
+            if exception.retry_after:    # Pause all requests to the host for as long as the site asked.
+                bucket.paused_until = max(bucket.paused_until, monotonic() + exception.retry_after)
+            logging.info(f'-- {get_host(url)} responded with {exception.status}. Rate lowered to {bucket.rate:.2f} requests/second.')
+        elif self.is_request_error(exception):
+            bucket.rate = max(self.min_rate, bucket.rate * 0.9)
+
+
+    def get_retry_delay(self, attempt_number, exception):
+        # Exponential backoff with full jitter. A Retry-After from the site is used as the minimum delay.
+        delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt_number - 1)))
+        if isinstance(exception, RetryableHTTPError) and exception.retry_after:
+            delay = max(delay, min(exception.retry_after, self.retry_max_delay))
+        return delay
+
+
+    async def wait_before_retry(self, attempt_number, exception, url):
+        # Called from the except block of a retry loop.
+        self.report_error(url, exception)
+        await asyncio.sleep(self.get_retry_delay(attempt_number, exception))
@@ -0,0 +1,111 @@
+from urllib import parse
+
+
+
+# Rough size of a response of each resource type. Used to estimate the bytes saved by blocked requests, when no request of that type was let through.
+default_response_bytes = {
+    'image': 60000,
+    'media': 500000,
+    'font': 40000,
+    'stylesheet': 30000,
+    'script': 80000,
+    'xhr': 10000,
+    'fetch': 10000,
+    'document': 50000,
+    'other': 5000
+}
+
+
+
+def parse_list(value):
+    # 'a, b,c' -> ['a', 'b', 'c']
+    return [item.strip().lower() for item in value.split(',') if item.strip()]
+
+
+
+def format_bytes(num_bytes):
+    for unit in ['B', 'KB', 'MB']:
+        if num_bytes < 1024:
+            return f'{num_bytes:.1f} {unit}'
+        num_bytes /= 1024
+    return f'{num_bytes:.1f} GB'
+
+
+
+class BlockingProfile:
+    # Decides which requests of the browser are allowed, based on an allow-list of resource types and hosts.
+    # It also keeps count of the bytes transferred and the requests blocked, per resource type, so that the profile can be tuned.
+
+    def __init__(self, allowed_resource_types, allowed_hosts):
+        self.allowed_resource_types = set(allowed_resource_types)
+        self.allowed_hosts = list(allowed_hosts)    # An empty list allows every host.
+        self.bytes_transferred = {}    # resource type -> bytes
+        self.requests_transferred = {}    # resource type -> number of requests
+        self.requests_blocked = {}    # resource type -> number of requests
+
+
+    def is_allowed(self, resource_type, url):
+        if resource_type not in self.allowed_resource_types:
+            return False
+        if len(self.allowed_hosts) == 0:
+            return True
+        host = (parse.urlparse(url).hostname or '').lower()
+        return any(host == allowed_host or host.endswith('.' + allowed_host) for allowed_host in self.allowed_hosts)
+
+
+    async def handle_route(self, route):
+        # Registered with context.route('**/*', ...) for every browser context.
+        request = route.request
+        if self.is_allowed(request.resource_type, request.url):
+            await route.continue_()
+        else:
+            self.requests_blocked[request.resource_type] = self.requests_blocked.get(request.resource_type, 0) + 1
+            await route.abort()
+
+
+    async def on_request_finished(self, request):
+        # Registered for the 'requestfinished' event of every browser context. Returns the number of bytes of the response.
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            return 0
+        num_bytes = sizes['responseBodySize'] + sizes['responseHeadersSize']
+        self.bytes_transferred[request.resource_type] = self.bytes_transferred.get(request.resource_type, 0) + num_bytes
+        self.requests_transferred[request.resource_type] = self.requests_transferred.get(request.resource_type, 0) + 1
+        return num_bytes
+
+
+    def estimated_bytes_saved(self):
+        # Blocked responses are never downloaded, so their size is estimated from the average size of that resource type.
+        bytes_saved = {}
+        for resource_type, num_blocked in self.requests_blocked.items():
+            if self.requests_transferred.get(resource_type):
+                average_bytes = self.bytes_transferred[resource_type] / self.requests_transferred[resource_type]
+            else:
+                average_bytes = default_response_bytes.get(resource_type, default_response_bytes['other'])
+            bytes_saved[resource_type] = num_blocked * average_bytes
+        return bytes_saved
+
+
+    def get_stats(self):
+        return {'bytes_transferred': dict(self.bytes_transferred), 'requests_transferred': dict(self.requests_transferred), 'requests_blocked': dict(self.requests_blocked)}
+
+
+    def add_stats(self, stats):
+        # Add the counts of another profile (the profile of a worker process) to this one.
+        for name, counts in stats.items():
+            totals = getattr(self, name)
+            for resource_type, count in counts.items():
+                totals[resource_type] = totals.get(resource_type, 0) + count
+
+
+    def get_report(self):
+        bytes_saved = self.estimated_bytes_saved()
+        lines = []
+        lines.append(f'Browser bytes transferred: {format_bytes(sum(self.bytes_transferred.values()))}')
+        for resource_type in sorted(self.bytes_transferred, key=self.bytes_transferred.get, reverse=True):
+            lines.append(f'    {resource_type}: {format_bytes(self.bytes_transferred[resource_type])} ({self.requests_transferred[resource_type]} requests)')
+        lines.append(f'Browser bytes saved by blocking (estimated): {format_bytes(sum(bytes_saved.values()))}')
+        for resource_type in sorted(bytes_saved, key=bytes_saved.get, reverse=True):
+            lines.append(f'    {resource_type}: {format_bytes(bytes_saved[resource_type])} ({self.requests_blocked[resource_type]} requests blocked)')
+        return '\n'.join(lines)
@@ -0,0 +1,3 @@
+cd /D "%~dp0"
+cd ..
+python .\execute.py --daemon
\ No newline at end of file